@@ -0,0 +1,32 @@
+"""Add gig full-text search index
+
+Revision ID: 3f1c9a7d2b10
+Revises: 78d60fdb7bf4
+Create Date: 2025-11-14 10:02:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b10'
+down_revision: Union[str, Sequence[str], None] = '78d60fdb7bf4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Expression must match crud.gig.gig_search_vector() for the planner to use it
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_gigs_full_text ON gigs "
+        "USING GIN (to_tsvector('english', title || ' ' || description))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_gigs_full_text")
@@ -0,0 +1,40 @@
+"""Add client profile coordinates with an earthdistance GiST index
+
+Revision ID: a1c7e5b9f318
+Revises: f6b2d8e4a935
+Create Date: 2025-11-26 16:22:40.117385
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c7e5b9f318'
+down_revision: Union[str, Sequence[str], None] = 'f6b2d8e4a935'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS cube")
+    op.execute("CREATE EXTENSION IF NOT EXISTS earthdistance")
+    op.add_column('client_profiles', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('client_profiles', sa.Column('longitude', sa.Float(), nullable=True))
+    op.create_index(
+        'idx_client_profiles_location', 'client_profiles',
+        [sa.text('ll_to_earth(latitude, longitude)')],
+        unique=False,
+        postgresql_using='gist',
+        postgresql_where=sa.text('latitude IS NOT NULL AND longitude IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_client_profiles_location', table_name='client_profiles', postgresql_using='gist')
+    op.drop_column('client_profiles', 'longitude')
+    op.drop_column('client_profiles', 'latitude')
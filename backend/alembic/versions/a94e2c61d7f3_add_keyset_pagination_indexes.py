@@ -0,0 +1,50 @@
+"""Add keyset pagination indexes for gigs and projects
+
+Revision ID: a94e2c61d7f3
+Revises: 3f1c9a7d2b10
+Create Date: 2025-11-14 15:37:09.402871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a94e2c61d7f3'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7d2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+GIG_SORT_INDEXES = {
+    'idx_gigs_status_created_at_id': 'created_at',
+    'idx_gigs_status_basic_price_id': 'basic_price',
+    'idx_gigs_status_order_count_id': 'order_count',
+    'idx_gigs_status_view_count_id': 'view_count',
+}
+
+PROJECT_SORT_INDEXES = {
+    'idx_projects_status_created_at_id': 'created_at',
+    'idx_projects_status_budget_min_id': 'budget_min',
+    'idx_projects_status_deadline_date_id': 'deadline_date',
+    'idx_projects_status_proposal_count_id': 'proposal_count',
+    'idx_projects_status_view_count_id': 'view_count',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, column in GIG_SORT_INDEXES.items():
+        op.create_index(name, 'gigs', ['status', column, 'id'], unique=False, if_not_exists=True)
+    for name, column in PROJECT_SORT_INDEXES.items():
+        op.create_index(name, 'projects', ['status', column, 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in PROJECT_SORT_INDEXES:
+        op.drop_index(name, table_name='projects', if_exists=True)
+    for name in GIG_SORT_INDEXES:
+        op.drop_index(name, table_name='gigs', if_exists=True)
@@ -0,0 +1,37 @@
+"""Restore project GIN indexes on required_skills and full text
+
+Revision ID: b4e9d1f7a263
+Revises: a1c7e5b9f318
+Create Date: 2025-11-27 09:41:12.560938
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e9d1f7a263'
+down_revision: Union[str, Sequence[str], None] = 'a1c7e5b9f318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Declared in database/init.sql but dropped by the initial autogenerated
+    # migration while the model left them commented out
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_projects_required_skills ON projects "
+        "USING GIN (required_skills)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_projects_full_text ON projects "
+        "USING GIN (to_tsvector('english', title || ' ' || description))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_projects_full_text")
+    op.execute("DROP INDEX IF EXISTS idx_projects_required_skills")
@@ -0,0 +1,56 @@
+"""Add gig change notification trigger
+
+Revision ID: b7c3e58f1a26
+Revises: a94e2c61d7f3
+Create Date: 2025-11-20 16:12:05.481337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c3e58f1a26'
+down_revision: Union[str, Sequence[str], None] = 'a94e2c61d7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Channel must match Settings.GIG_INDEX_CHANNEL (app.services.gig_index)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_gig_change()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('gig_changes', COALESCE(NEW.id, OLD.id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # Updates notify only for columns the index serves or filters on, so the
+    # write-behind view count flushes (view_count, updated_at) stay silent
+    op.execute(
+        """
+        CREATE TRIGGER notify_gigs_change
+        AFTER INSERT OR DELETE OR UPDATE OF
+            creator_profile_id, title, slug, description,
+            basic_price, basic_description, basic_delivery_days, basic_revisions,
+            standard_price, standard_description, standard_delivery_days, standard_revisions,
+            premium_price, premium_description, premium_delivery_days, premium_revisions,
+            category, subcategory, video_type, thumbnail_url, video_samples, requirements,
+            order_count, favorite_count, status, search_tags, published_at
+        ON gigs
+        FOR EACH ROW EXECUTE FUNCTION notify_gig_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS notify_gigs_change ON gigs")
+    op.execute("DROP FUNCTION IF EXISTS notify_gig_change()")
@@ -0,0 +1,56 @@
+"""Add generated min/max package price columns to gigs
+
+Revision ID: c2d9f4a6e813
+Revises: b7c3e58f1a26
+Create Date: 2025-11-24 09:37:52.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d9f4a6e813'
+down_revision: Union[str, Sequence[str], None] = 'b7c3e58f1a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'gigs',
+        sa.Column(
+            'min_package_price',
+            sa.DECIMAL(precision=10, scale=2),
+            sa.Computed('LEAST(basic_price, standard_price, premium_price)', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'gigs',
+        sa.Column(
+            'max_package_price',
+            sa.DECIMAL(precision=10, scale=2),
+            sa.Computed('GREATEST(basic_price, standard_price, premium_price)', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'idx_gigs_status_min_package_price_id', 'gigs',
+        ['status', 'min_package_price', 'id'], unique=False,
+    )
+    op.create_index(
+        'idx_gigs_status_max_package_price_id', 'gigs',
+        ['status', 'max_package_price', 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_gigs_status_max_package_price_id', table_name='gigs')
+    op.drop_index('idx_gigs_status_min_package_price_id', table_name='gigs')
+    op.drop_column('gigs', 'max_package_price')
+    op.drop_column('gigs', 'min_package_price')
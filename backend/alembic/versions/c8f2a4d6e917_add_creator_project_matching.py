@@ -0,0 +1,180 @@
+"""Add creator-project matching tables and refresh triggers
+
+Revision ID: c8f2a4d6e917
+Revises: b4e9d1f7a263
+Create Date: 2025-11-28 11:05:47.913204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2a4d6e917'
+down_revision: Union[str, Sequence[str], None] = 'b4e9d1f7a263'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Creator skills and categories are mapped but were never part of
+    # database/init.sql; matching reads them
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_skills (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+            skill_name VARCHAR(50) NOT NULL,
+            proficiency_level VARCHAR(20) CHECK (proficiency_level IN ('beginner', 'intermediate', 'expert')),
+            years_experience INTEGER,
+            created_at TIMESTAMPTZ DEFAULT NOW()
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_creator_skills_unique "
+        "ON creator_skills (creator_profile_id, skill_name)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_creator_skills_skill_name ON creator_skills (skill_name)")
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_categories (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+            category VARCHAR(50) NOT NULL,
+            is_primary BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMPTZ DEFAULT NOW()
+        )
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_creator_categories_creator_profile_id "
+        "ON creator_categories (creator_profile_id)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_creator_categories_category ON creator_categories (category)")
+
+    op.create_table(
+        'project_match_terms',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('term', sa.String(length=120), nullable=False),
+        sa.Column('weight', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'term'),
+    )
+    op.create_index('idx_project_match_terms_term', 'project_match_terms', ['term'], unique=False)
+
+    op.create_table(
+        'creator_match_terms',
+        sa.Column('creator_profile_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('term', sa.String(length=120), nullable=False),
+        sa.Column('weight', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['creator_profile_id'], ['creator_profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('creator_profile_id', 'term'),
+    )
+    op.create_index('idx_creator_match_terms_term', 'creator_match_terms', ['term'], unique=False)
+
+    op.create_table(
+        'project_matches',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('creator_profile_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['creator_profile_id'], ['creator_profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'creator_profile_id'),
+    )
+    op.create_index('idx_project_matches_project_score', 'project_matches', ['project_id', 'score'], unique=False)
+    op.create_index(
+        'idx_project_matches_creator_score', 'project_matches', ['creator_profile_id', 'score'], unique=False,
+    )
+
+    op.create_table(
+        'match_refresh_queue',
+        sa.Column('entity_type', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('queued_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('entity_type', 'entity_id'),
+    )
+
+    # Queue projects and creators whose match inputs change; consumed by
+    # app.services.matching_service. Arguments: entity type, id column
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION enqueue_match_refresh()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            changed JSONB;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := to_jsonb(OLD);
+            ELSE
+                changed := to_jsonb(NEW);
+            END IF;
+            INSERT INTO match_refresh_queue (entity_type, entity_id)
+            VALUES (TG_ARGV[0], (changed ->> TG_ARGV[1])::uuid)
+            ON CONFLICT DO NOTHING;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION enqueue_user_match_refresh()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO match_refresh_queue (entity_type, entity_id)
+            SELECT 'creator', id FROM creator_profiles WHERE user_id = NEW.id
+            ON CONFLICT DO NOTHING;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER queue_project_match_refresh "
+        "AFTER INSERT OR UPDATE OF status, category, required_skills, budget_min, budget_max, experience_level "
+        "ON projects FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('project', 'id')"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_creator_profile_match_refresh "
+        "AFTER INSERT OR UPDATE OF hourly_rate, years_of_experience, availability_status "
+        "ON creator_profiles FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'id')"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_creator_skill_match_refresh AFTER INSERT OR UPDATE OR DELETE ON creator_skills "
+        "FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'creator_profile_id')"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_creator_category_match_refresh AFTER INSERT OR UPDATE OR DELETE ON creator_categories "
+        "FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'creator_profile_id')"
+    )
+    op.execute(
+        "CREATE TRIGGER queue_user_match_refresh AFTER UPDATE OF status, deleted_at ON users "
+        "FOR EACH ROW EXECUTE FUNCTION enqueue_user_match_refresh()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS queue_user_match_refresh ON users")
+    op.execute("DROP TRIGGER IF EXISTS queue_creator_category_match_refresh ON creator_categories")
+    op.execute("DROP TRIGGER IF EXISTS queue_creator_skill_match_refresh ON creator_skills")
+    op.execute("DROP TRIGGER IF EXISTS queue_creator_profile_match_refresh ON creator_profiles")
+    op.execute("DROP TRIGGER IF EXISTS queue_project_match_refresh ON projects")
+    op.execute("DROP FUNCTION IF EXISTS enqueue_user_match_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS enqueue_match_refresh()")
+
+    op.drop_table('match_refresh_queue')
+    op.drop_index('idx_project_matches_creator_score', table_name='project_matches')
+    op.drop_index('idx_project_matches_project_score', table_name='project_matches')
+    op.drop_table('project_matches')
+    op.drop_index('idx_creator_match_terms_term', table_name='creator_match_terms')
+    op.drop_table('creator_match_terms')
+    op.drop_index('idx_project_match_terms_term', table_name='project_match_terms')
+    op.drop_table('project_match_terms')
+    # creator_skills and creator_categories may predate this revision; kept
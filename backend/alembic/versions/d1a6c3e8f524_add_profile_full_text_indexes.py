@@ -0,0 +1,38 @@
+"""Add full-text indexes on creator and client profiles
+
+Revision ID: d1a6c3e8f524
+Revises: c8f2a4d6e917
+Create Date: 2025-11-29 10:12:36.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a6c3e8f524'
+down_revision: Union[str, Sequence[str], None] = 'c8f2a4d6e917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Used by /v1/search; must match crud.creator.creator_search_vector() and
+    # crud.client.client_search_vector()
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_creator_profiles_full_text ON creator_profiles "
+        "USING GIN (to_tsvector('english', display_name || ' ' || coalesce(tagline, '') "
+        "|| ' ' || coalesce(bio, '')))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_client_profiles_full_text ON client_profiles "
+        "USING GIN (to_tsvector('english', company_name || ' ' || coalesce(industry, '')))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_client_profiles_full_text")
+    op.execute("DROP INDEX IF EXISTS idx_creator_profiles_full_text")
@@ -0,0 +1,30 @@
+"""Add varchar_pattern_ops index on gig slugs
+
+Revision ID: d5a8b3e7c140
+Revises: c2d9f4a6e813
+Create Date: 2025-11-25 10:12:08.431977
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8b3e7c140'
+down_revision: Union[str, Sequence[str], None] = 'c2d9f4a6e813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_gigs_slug_pattern', 'gigs', ['slug'], unique=False,
+        postgresql_ops={'slug': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_gigs_slug_pattern', table_name='gigs')
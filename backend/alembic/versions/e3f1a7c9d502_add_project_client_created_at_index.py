@@ -0,0 +1,30 @@
+"""Add (client_profile_id, created_at, id) index on projects
+
+Revision ID: e3f1a7c9d502
+Revises: d5a8b3e7c140
+Create Date: 2025-11-25 14:48:31.207644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f1a7c9d502'
+down_revision: Union[str, Sequence[str], None] = 'd5a8b3e7c140'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_projects_client_created_at', 'projects',
+        ['client_profile_id', 'created_at', 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_projects_client_created_at', table_name='projects')
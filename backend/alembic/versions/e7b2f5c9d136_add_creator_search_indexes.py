@@ -0,0 +1,49 @@
+"""Add creator search sort indexes
+
+Revision ID: e7b2f5c9d136
+Revises: d1a6c3e8f524
+Create Date: 2025-11-29 16:47:05.281934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2f5c9d136'
+down_revision: Union[str, Sequence[str], None] = 'd1a6c3e8f524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SORT_COLUMNS = {
+    'rating': 'average_rating',
+    'jobs_completed': 'total_jobs_completed',
+    'created_at': 'created_at',
+    'hourly_rate': 'hourly_rate',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination of GET /v1/creators: one (sort key, id) index per
+    # sort_by, plus partial copies for available creators
+    for name, column in SORT_COLUMNS.items():
+        op.create_index(f'idx_creator_profiles_{name}_id', 'creator_profiles', [column, 'id'], unique=False)
+        op.create_index(
+            f'idx_creator_profiles_available_{name}_id', 'creator_profiles', [column, 'id'], unique=False,
+            postgresql_where=sa.text("availability_status = 'available'"),
+        )
+    # Superseded by idx_creator_profiles_rating_id (scanned in either direction)
+    op.execute("DROP INDEX IF EXISTS idx_creator_profiles_rating")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_creator_profiles_rating ON creator_profiles (average_rating DESC)"
+    )
+    for name in reversed(list(SORT_COLUMNS)):
+        op.drop_index(f'idx_creator_profiles_available_{name}_id', table_name='creator_profiles')
+        op.drop_index(f'idx_creator_profiles_{name}_id', table_name='creator_profiles')
@@ -0,0 +1,32 @@
+"""Add users.token_version for token revocation
+
+Revision ID: f2c8a5d1b749
+Revises: e7b2f5c9d136
+Create Date: 2025-11-30 10:12:38.604215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a5d1b749'
+down_revision: Union[str, Sequence[str], None] = 'e7b2f5c9d136'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tokens carry the version they were issued under; logout increments it
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,46 @@
+"""Add generated budget_range column with GiST index to projects
+
+Revision ID: f6b2d8e4a935
+Revises: e3f1a7c9d502
+Create Date: 2025-11-26 11:05:17.882410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d8e4a935'
+down_revision: Union[str, Sequence[str], None] = 'e3f1a7c9d502'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column(
+            'budget_range',
+            postgresql.NUMRANGE(),
+            sa.Computed(
+                "CASE WHEN budget_min IS NULL AND budget_max IS NULL THEN NULL "
+                "ELSE numrange(LEAST(budget_min, budget_max), GREATEST(budget_min, budget_max), '[]') END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'idx_projects_budget_range', 'projects', ['budget_range'],
+        unique=False, postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_projects_budget_range', table_name='projects', postgresql_using='gist')
+    op.drop_column('projects', 'budget_range')
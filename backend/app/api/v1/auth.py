@@ -15,6 +15,8 @@ from app.schemas.auth import (
     MessageResponse,
 )
 from app.services import auth_service
+from app.core.config import settings
+from app.core.rate_limit import rate_limit
 from app.core.security import get_current_user
 
 router = APIRouter()
@@ -25,7 +27,8 @@ router = APIRouter()
     response_model=AuthResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user",
-    description="Create a new user account (creator or client) and return authentication tokens"
+    description="Create a new user account (creator or client) and return authentication tokens",
+    dependencies=[Depends(rate_limit("auth:register", settings.RATE_LIMIT_REGISTER))],
 )
 async def register(
     user_data: UserCreate,
@@ -62,7 +65,8 @@ async def register(
     "/login",
     response_model=AuthResponse,
     summary="Login with email and password",
-    description="Authenticate user with email and password, return JWT tokens"
+    description="Authenticate user with email and password, return JWT tokens",
+    dependencies=[Depends(rate_limit("auth:login", settings.RATE_LIMIT_LOGIN))],
 )
 async def login(
     login_data: LoginRequest,
@@ -167,7 +171,7 @@ async def logout(
     """
     user_id = UUID(current_user.get("sub"))
 
-    # Logout user (client-side token discarding)
+    # Revoke every token issued to the user so far
     await auth_service.logout_user(db, user_id)
 
     return MessageResponse(message="Successfully logged out")
@@ -0,0 +1,72 @@
+"""API endpoints for creator discovery."""
+
+from decimal import Decimal
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_db
+from app.schemas.creator import CreatorSearchFilters, CreatorsListResponse
+from app.services import creator_service
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=CreatorsListResponse)
+async def search_creators(
+    search: Optional[str] = Query(None, description="Search in name, tagline and bio, or an exact skill"),
+    categories: Optional[List[str]] = Query(None, description="Filter by categories"),
+    skills: Optional[List[str]] = Query(None, description="Filter by skills"),
+    availability_status: Optional[List[str]] = Query(None, description="Filter by availability"),
+    min_rating: Optional[Decimal] = Query(None, ge=0, le=5, description="Minimum average rating"),
+    min_jobs_completed: Optional[int] = Query(None, ge=0, description="Minimum jobs completed"),
+    min_years_experience: Optional[int] = Query(None, ge=0, description="Minimum years of experience"),
+    max_hourly_rate: Optional[Decimal] = Query(None, ge=0, description="Maximum hourly rate"),
+    verified_only: bool = Query(False, description="Show only verified creators"),
+    sort_by: str = Query("rating", description="Sort field: rating, jobs_completed, created_at, hourly_rate"),
+    sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page_size: int = Query(20, ge=1, le=100, description="Number of records per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search creators with filters and pagination.
+
+    - **search**: Search term for display name, tagline and bio (web search
+      syntax), also matching creators with exactly this skill
+    - **categories**: Creators covering any of these categories (can provide multiple)
+    - **skills**: Creators with any of these skills (can provide multiple)
+    - **availability_status**: available, busy and/or unavailable
+    - **min_rating**: Minimum average rating
+    - **min_jobs_completed**: Minimum number of completed jobs
+    - **min_years_experience**: Minimum years of experience
+    - **max_hourly_rate**: Maximum hourly rate
+    - **verified_only**: Only verified creators
+    - **sort_by**: Field to sort by
+    - **sort_order**: Sort order (asc or desc)
+    - **page**: Page number (1-indexed)
+    - **page_size**: Number of records per page
+    - **cursor**: Keyset cursor (`next_cursor` of the previous page); overrides page
+      and keeps deep pages as cheap as the first one
+    """
+    filters = CreatorSearchFilters(
+        search_query=search,
+        categories=categories,
+        skills=skills,
+        availability_status=availability_status,
+        min_rating=min_rating,
+        min_jobs_completed=min_jobs_completed,
+        min_years_experience=min_years_experience,
+        max_hourly_rate=max_hourly_rate,
+        verified_only=verified_only,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=page,
+        page_size=page_size,
+        cursor=cursor
+    )
+
+    return await creator_service.search_creators(db, filters)
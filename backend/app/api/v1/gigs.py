@@ -4,15 +4,19 @@ from typing import List, Dict, Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import get_db
 from app.core.security import get_current_user
+from app.schemas.export import ExportFormat
 from app.schemas.gig import (
     GigCreate, GigUpdate, GigResponse, GigsListResponse,
-    GigSearchFilters, GigPackageResponse, GigStatus
+    GigSearchFilters, GigPackageResponse, GigStatus, GigSearchMode,
+    GigFacetsResponse, GigSuggestResponse
 )
-from app.services import gig_service
+from app.services import auth_service, gig_service, suggest_service
+from app.utils.export import EXPORT_MEDIA_TYPES
 
 
 router = APIRouter()
@@ -21,56 +25,186 @@ router = APIRouter()
 @router.get("/", response_model=GigsListResponse)
 async def list_gigs(
     search: Optional[str] = Query(None, description="Search in title and description"),
+    search_mode: GigSearchMode = Query(GigSearchMode.fulltext, description="Search mode: fulltext or substring"),
     category: Optional[str] = Query(None, description="Filter by category"),
     subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
     video_type: Optional[str] = Query(None, description="Filter by video type"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
+    package_min_price: Optional[float] = Query(None, ge=0, description="Some package costs at least this"),
+    package_max_price: Optional[float] = Query(None, ge=0, description="Some package costs at most this"),
     tags: Optional[List[str]] = Query(None, description="Filter by tags"),
     creator_profile_id: Optional[UUID] = Query(None, description="Filter by creator"),
     gig_status: Optional[GigStatus] = Query(GigStatus.active, description="Filter by status"),
-    sort_by: str = Query("created_at", description="Sort field: created_at, price, popularity, views"),
+    sort_by: str = Query(
+        "created_at",
+        description="Sort field: created_at, price, popularity, views, relevance, min_package_price, max_package_price"
+    ),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List and search gigs with filters and pagination.
 
     - **search**: Search term for title and description
+    - **search_mode**: `fulltext` (ranked, web search syntax) or `substring` (ILIKE)
     - **category**: Filter by category
     - **subcategory**: Filter by subcategory
     - **video_type**: Filter by video type
     - **min_price**: Minimum price filter
     - **max_price**: Maximum price filter
+    - **package_min_price**: Only gigs with a package (any tier) priced at least this
+    - **package_max_price**: Only gigs with a package (any tier) priced at most this
     - **tags**: Filter by tags (can provide multiple)
     - **creator_profile_id**: Filter by specific creator
     - **gig_status**: Filter by gig status (default: active)
-    - **sort_by**: Field to sort by
+    - **sort_by**: Field to sort by (`relevance` requires a fulltext search;
+      `min_package_price` / `max_package_price` order by cheapest / priciest tier)
     - **sort_order**: Sort order (asc or desc)
     - **skip**: Number of records to skip for pagination
     - **limit**: Maximum number of records to return
+    - **cursor**: Keyset cursor (`next_cursor` of the previous page); overrides skip
+      and keeps deep pages as cheap as the first one
     """
     filters = GigSearchFilters(
         search=search,
+        search_mode=search_mode,
         category=category,
         subcategory=subcategory,
         video_type=video_type,
         min_price=min_price,
         max_price=max_price,
+        package_min_price=package_min_price,
+        package_max_price=package_max_price,
         tags=tags,
         creator_profile_id=creator_profile_id,
         status=gig_status,
         sort_by=sort_by,
         sort_order=sort_order,
         skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
 
     return await gig_service.list_gigs(db, filters)
 
 
+@router.get("/suggest", response_model=GigSuggestResponse)
+async def suggest_gigs(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+):
+    """
+    Autocomplete for the gig search box.
+
+    Returns prefix and typo-tolerant completions over active gig titles,
+    search tags, categories and subcategories. Served from an in-process
+    index, so it does not query the database per keystroke.
+
+    - **q**: Text typed so far
+    - **limit**: Maximum number of suggestions (default: 8)
+    """
+    return await suggest_service.suggest_gigs(q, limit)
+
+
+@router.get("/facets", response_model=GigFacetsResponse)
+async def get_gig_facets(
+    search: Optional[str] = Query(None, description="Search in title and description"),
+    search_mode: GigSearchMode = Query(GigSearchMode.fulltext, description="Search mode: fulltext or substring"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+    video_type: Optional[str] = Query(None, description="Filter by video type"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
+    package_min_price: Optional[float] = Query(None, ge=0, description="Some package costs at least this"),
+    package_max_price: Optional[float] = Query(None, ge=0, description="Some package costs at most this"),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags"),
+    creator_profile_id: Optional[UUID] = Query(None, description="Filter by creator"),
+    gig_status: Optional[GigStatus] = Query(GigStatus.active, description="Filter by status"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get gig counts per category, subcategory, video type, price range and tag.
+
+    Accepts the same filters as the gig listing and counts every facet under
+    them in a single aggregation, so a filter panel needs one request.
+    """
+    filters = GigSearchFilters(
+        search=search,
+        search_mode=search_mode,
+        category=category,
+        subcategory=subcategory,
+        video_type=video_type,
+        min_price=min_price,
+        max_price=max_price,
+        package_min_price=package_min_price,
+        package_max_price=package_max_price,
+        tags=tags,
+        creator_profile_id=creator_profile_id,
+        status=gig_status
+    )
+
+    return await gig_service.get_gig_facets(db, filters)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_gigs(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Output format: ndjson or csv"),
+    search: Optional[str] = Query(None, description="Search in title and description"),
+    search_mode: GigSearchMode = Query(GigSearchMode.fulltext, description="Search mode: fulltext or substring"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+    video_type: Optional[str] = Query(None, description="Filter by video type"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
+    package_min_price: Optional[float] = Query(None, ge=0, description="Some package costs at least this"),
+    package_max_price: Optional[float] = Query(None, ge=0, description="Some package costs at most this"),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags"),
+    creator_profile_id: Optional[UUID] = Query(None, description="Filter by creator"),
+    gig_status: Optional[GigStatus] = Query(GigStatus.active, description="Filter by status"),
+    sort_by: str = Query(
+        "created_at",
+        description="Sort field: created_at, price, popularity, views, relevance, min_package_price, max_package_price"
+    ),
+    sort_order: str = Query("desc", description="Sort order: asc or desc")
+):
+    """
+    Export every gig matching the filters in one streamed response.
+
+    Accepts the same filters and sorting as the gig listing, without
+    pagination. Rows are read through a server-side cursor and written as
+    they arrive, so exports of any size use constant memory.
+
+    - **format**: `ndjson` (one GigResponse object per line) or `csv`
+      (creator fields as `creator.*` columns, list values joined with `|`)
+    """
+    filters = GigSearchFilters(
+        search=search,
+        search_mode=search_mode,
+        category=category,
+        subcategory=subcategory,
+        video_type=video_type,
+        min_price=min_price,
+        max_price=max_price,
+        package_min_price=package_min_price,
+        package_max_price=package_max_price,
+        tags=tags,
+        creator_profile_id=creator_profile_id,
+        status=gig_status,
+        sort_by=sort_by,
+        sort_order=sort_order
+    )
+
+    return StreamingResponse(
+        await gig_service.export_gigs(filters, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="gigs.{format.value}"'}
+    )
+
+
 @router.get("/{gig_id}", response_model=GigResponse)
 async def get_gig(
     gig_id: UUID,
@@ -136,6 +270,10 @@ async def create_gig(
             detail="Creator profile not found"
         )
 
+    # Reject suspended or deleted accounts (usually answered from the
+    # principal cache, without a users query)
+    await auth_service.get_current_user_from_token(db, current_user)
+
     return await gig_service.create_gig(db, gig_data, UUID(creator_profile_id))
 
 
@@ -170,6 +308,10 @@ async def update_gig(
             detail="Creator profile not found"
         )
 
+    # Reject suspended or deleted accounts (usually answered from the
+    # principal cache, without a users query)
+    await auth_service.get_current_user_from_token(db, current_user)
+
     return await gig_service.update_gig(
         db, gig_id, gig_update, UUID(creator_profile_id)
     )
@@ -205,6 +347,10 @@ async def delete_gig(
             detail="Creator profile not found"
         )
 
+    # Reject suspended or deleted accounts (usually answered from the
+    # principal cache, without a users query)
+    await auth_service.get_current_user_from_token(db, current_user)
+
     return await gig_service.delete_gig(db, gig_id, UUID(creator_profile_id))
 
 
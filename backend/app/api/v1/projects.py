@@ -1,18 +1,27 @@
 """API endpoints for projects (restaurant collaboration opportunities)."""
 
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.security import get_current_user
 from app.db.base import get_db
+from app.schemas.export import ExportFormat
 from app.schemas.project import (
     ProjectWithClient,
     ProjectSearchFilters,
-    ProjectsListResponse
+    ProjectsListResponse,
+    ProjectFacetsResponse,
+    ProjectBudgetMode,
+    RecommendedProjectsResponse,
+    ProjectCreatorMatchesResponse
 )
-from app.services import project_service
+from app.services import creator_service, matching_service, project_service
+from app.utils.export import EXPORT_MEDIA_TYPES
 
 
 router = APIRouter()
@@ -26,12 +35,16 @@ async def list_projects(
     experience_level: Optional[str] = Query(None, description="Filter by experience level"),
     min_budget: Optional[float] = Query(None, ge=0, description="Minimum budget"),
     max_budget: Optional[float] = Query(None, ge=0, description="Maximum budget"),
+    budget_mode: ProjectBudgetMode = Query(ProjectBudgetMode.overlap, description="Budget match: overlap or within"),
+    near: Optional[str] = Query(None, description="Search around 'lat,lon'"),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius around near, in km"),
     search: Optional[str] = Query(None, description="Search in title and description"),
     client_profile_id: Optional[UUID] = Query(None, description="Filter by client"),
-    sort_by: str = Query("created_at", description="Sort field: created_at, budget, deadline, proposals, views"),
+    sort_by: str = Query("created_at", description="Sort field: created_at, budget, deadline, proposals, views, distance"),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(12, ge=1, le=100, description="Number of records per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -43,12 +56,20 @@ async def list_projects(
     - **experience_level**: Filter by required experience level
     - **min_budget**: Minimum budget filter
     - **max_budget**: Maximum budget filter
+    - **budget_mode**: `overlap` (default) matches projects whose budget range
+      intersects [min_budget, max_budget]; `within` only those whose whole range
+      lies inside it. Fixed budgets are a single value.
+    - **near**: `lat,lon` to search around; only projects whose restaurant lies
+      within **radius_km** (default 10) are returned
+    - **radius_km**: Search radius in kilometres
     - **search**: Search term for title and description
     - **client_profile_id**: Filter by specific restaurant/client
-    - **sort_by**: Field to sort by
+    - **sort_by**: Field to sort by (`distance` requires near)
     - **sort_order**: Sort order (asc or desc)
     - **page**: Page number (1-indexed)
     - **page_size**: Number of records per page (default: 12)
+    - **cursor**: Keyset cursor (`next_cursor` of the previous page); overrides page
+      and keeps deep pages as cheap as the first one
     """
     # Convert page to skip offset (page is 1-indexed)
     skip = (page - 1) * page_size
@@ -60,17 +81,148 @@ async def list_projects(
         experience_level=experience_level,
         min_budget=min_budget,
         max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
         search=search,
         client_profile_id=client_profile_id,
         sort_by=sort_by,
         sort_order=sort_order,
         skip=skip,
-        limit=page_size
+        limit=page_size,
+        cursor=cursor
     )
 
     return await project_service.list_projects(db, filters)
 
 
+@router.get("/facets", response_model=ProjectFacetsResponse)
+async def get_project_facets(
+    status: Optional[str] = Query("open", description="Filter by project status"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    video_type: Optional[str] = Query(None, description="Filter by video type"),
+    experience_level: Optional[str] = Query(None, description="Filter by experience level"),
+    min_budget: Optional[float] = Query(None, ge=0, description="Minimum budget"),
+    max_budget: Optional[float] = Query(None, ge=0, description="Maximum budget"),
+    budget_mode: ProjectBudgetMode = Query(ProjectBudgetMode.overlap, description="Budget match: overlap or within"),
+    near: Optional[str] = Query(None, description="Search around 'lat,lon'"),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius around near, in km"),
+    search: Optional[str] = Query(None, description="Search in title and description"),
+    client_profile_id: Optional[UUID] = Query(None, description="Filter by client"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get project counts per category, video type, experience level, budget range
+    and required skill.
+
+    Accepts the same filters as the project listing and counts every facet
+    under them in a single aggregation, so a filter panel needs one request.
+    """
+    filters = ProjectSearchFilters(
+        status=status,
+        category=category,
+        video_type=video_type,
+        experience_level=experience_level,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
+        search=search,
+        client_profile_id=client_profile_id
+    )
+
+    return await project_service.get_project_facets(db, filters)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_projects(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Output format: ndjson or csv"),
+    status: Optional[str] = Query("open", description="Filter by project status"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    video_type: Optional[str] = Query(None, description="Filter by video type"),
+    experience_level: Optional[str] = Query(None, description="Filter by experience level"),
+    min_budget: Optional[float] = Query(None, ge=0, description="Minimum budget"),
+    max_budget: Optional[float] = Query(None, ge=0, description="Maximum budget"),
+    budget_mode: ProjectBudgetMode = Query(ProjectBudgetMode.overlap, description="Budget match: overlap or within"),
+    near: Optional[str] = Query(None, description="Search around 'lat,lon'"),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius around near, in km"),
+    search: Optional[str] = Query(None, description="Search in title and description"),
+    client_profile_id: Optional[UUID] = Query(None, description="Filter by client"),
+    sort_by: str = Query("created_at", description="Sort field: created_at, budget, deadline, proposals, views, distance"),
+    sort_order: str = Query("desc", description="Sort order: asc or desc")
+):
+    """
+    Export every project matching the filters in one streamed response.
+
+    Accepts the same filters and sorting as the project listing, without
+    pagination. Rows are read through a server-side cursor and written as
+    they arrive, so exports of any size use constant memory.
+
+    - **format**: `ndjson` (one ProjectWithClient object per line) or `csv`
+      (client fields as `client.*` columns, list values joined with `|`)
+    """
+    filters = ProjectSearchFilters(
+        status=status,
+        category=category,
+        video_type=video_type,
+        experience_level=experience_level,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
+        search=search,
+        client_profile_id=client_profile_id,
+        sort_by=sort_by,
+        sort_order=sort_order
+    )
+
+    return StreamingResponse(
+        await project_service.export_projects(filters, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="projects.{format.value}"'}
+    )
+
+
+@router.get("/recommended", response_model=RecommendedProjectsResponse)
+async def get_recommended_projects(
+    limit: int = Query(20, ge=1, le=settings.MATCH_TOP_K, description="Number of projects"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the open projects that best match the current creator (creator only).
+
+    Projects are ranked by how well their required skills and category match
+    the creator's skills and categories, weighted by budget and experience
+    fit. Matches are precomputed and refreshed shortly after projects or
+    creator skills change.
+
+    - **limit**: Number of projects to return
+    """
+    creator_profile_id = await creator_service.get_current_creator_profile_id(
+        db, current_user, "get project recommendations"
+    )
+
+    return await matching_service.get_recommended_projects(db, creator_profile_id, limit)
+
+
+@router.get("/{project_id}/creators", response_model=ProjectCreatorMatchesResponse)
+async def get_project_matches(
+    project_id: UUID,
+    limit: int = Query(20, ge=1, le=settings.MATCH_TOP_K, description="Number of creators"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the creators that best match a project.
+
+    - **project_id**: Project UUID
+    - **limit**: Number of creators to return
+    """
+    return await matching_service.get_project_matches(db, project_id, limit)
+
+
 @router.get("/{project_id}", response_model=ProjectWithClient)
 async def get_project(
     project_id: UUID,
@@ -0,0 +1,36 @@
+"""API endpoints for proposals."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_db
+from app.core.security import get_current_user
+from app.schemas.project import ProposalCreate, ProposalSubmitted
+from app.services import creator_service, proposal_service
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=ProposalSubmitted, status_code=status.HTTP_201_CREATED)
+async def submit_proposal(
+    proposal_data: ProposalCreate,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Submit a proposal for an open project.
+
+    Requires authentication as a creator (user_type creator or both). A
+    creator can submit one proposal per project.
+
+    - **proposal_data**: Job ID, cover letter, proposed budget and timeline,
+      optional attachment URLs and portfolio item IDs
+    """
+    creator_profile_id = await creator_service.get_current_creator_profile_id(
+        db, current_user, "submit proposals"
+    )
+
+    return await proposal_service.submit_proposal(db, proposal_data, creator_profile_id)
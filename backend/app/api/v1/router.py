@@ -1,10 +1,11 @@
 """Main API v1 router that includes all endpoint modules."""
 
-from fastapi import APIRouter
-from app.api.v1 import auth, gigs, projects, clients
+from fastapi import APIRouter, Depends
+from app.api.v1 import auth, gigs, projects, clients, creators, proposals, search
+from app.core.rate_limit import enforce_rate_limit_tier
 
-# Create main v1 router
-api_router = APIRouter()
+# Create main v1 router (every route is subject to the caller's rate limit tier)
+api_router = APIRouter(dependencies=[Depends(enforce_rate_limit_tier)])
 
 # Placeholder routes - these will be implemented in separate modules
 # and included here as the application grows
@@ -32,11 +33,14 @@ api_router.include_router(gigs.router, prefix="/gigs", tags=["gigs"])
 # Project endpoints
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 
+# Creator endpoints
+api_router.include_router(creators.router, prefix="/creators", tags=["creators"])
+
 # Client endpoints
 api_router.include_router(clients.router, prefix="/clients", tags=["clients"])
 
 # Proposal endpoints
-# api_router.include_router(proposals.router, prefix="/proposals", tags=["proposals"])
+api_router.include_router(proposals.router, prefix="/proposals", tags=["proposals"])
 
 # Order endpoints
 # api_router.include_router(orders.router, prefix="/orders", tags=["orders"])
@@ -52,7 +56,7 @@ api_router.include_router(clients.router, prefix="/clients", tags=["clients"])
 # api_router.include_router(reviews.router, prefix="/reviews", tags=["reviews"])
 
 # Search endpoints
-# api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
 
 # Upload endpoints
 # api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
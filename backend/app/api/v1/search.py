@@ -0,0 +1,36 @@
+"""API endpoints for unified search."""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_db
+from app.schemas.search import SearchResponse, SearchResultType
+from app.services import search_service
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms (web search syntax)"),
+    types: List[SearchResultType] = Query(
+        list(SearchResultType), description="Entity types to search: gig, project, creator, client"
+    ),
+    limit: int = Query(5, ge=1, le=20, description="Maximum results per type"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search gigs, projects, creators and clients in one request.
+
+    All requested types are searched by a single ranked full-text query; each
+    type contributes at most **limit** results, and results are merged in
+    relevance order.
+
+    - **q**: Search terms; supports quoted phrases, `OR` and `-term`
+    - **types**: Entity types to include (can provide multiple; default all)
+    - **limit**: Maximum results per type
+    """
+    return await search_service.search(db, q, types, limit)
@@ -0,0 +1,206 @@
+"""Redis-backed response cache with single-flight loading.
+
+Cached responses are stored under a per-namespace generation number.
+Invalidating a namespace bumps the generation, so every key written under the
+previous one becomes unreachable at once and simply expires, without scanning
+or deleting keys.
+
+Concurrent misses for the same key are collapsed: within a process the first
+request loads the value and the others await it; across processes a short
+Redis lock lets one worker load while the others poll for its result. The
+lock holds a random token and is released (only if it still holds that
+token) once the load finishes or fails, so a failing loader does not keep
+the other workers waiting for the lock timeout.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import InMemoryRedis, get_redis
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# KEYS: lock key; ARGV: token of the holder
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def normalize_params(params: Dict[str, Any]) -> str:
+    """
+    Serialize request parameters into a canonical string.
+
+    Unset values are dropped and list values sorted, so equivalent requests
+    map to the same cache entry.
+
+    Args:
+        params: Request parameters
+
+    Returns:
+        Canonical JSON string
+    """
+    normalized = {}
+    for name, value in params.items():
+        if value is None or value == []:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(str(item) for item in value)
+        elif isinstance(value, Enum):
+            value = value.value
+        normalized[name] = value
+
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """Cache of serialized Pydantic responses for one namespace."""
+
+    def __init__(self, namespace: str, ttl: Optional[int] = None):
+        """
+        Args:
+            namespace: Key prefix and invalidation scope (e.g. "gigs:list")
+            ttl: Seconds a cached response stays valid (default REDIS_TTL)
+        """
+        self.namespace = namespace
+        self.ttl = ttl if ttl is not None else settings.REDIS_TTL
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def _generation_key(self) -> str:
+        return f"cache:{self.namespace}:gen"
+
+    async def _entry_key(self, params: Dict[str, Any]) -> str:
+        generation = await get_redis().get(self._generation_key)
+        generation = int(generation or 0)
+        digest = hashlib.sha1(normalize_params(params).encode()).hexdigest()
+        return f"cache:{self.namespace}:{generation}:{digest}"
+
+    async def get_or_load(
+        self,
+        params: Dict[str, Any],
+        model: Type[ModelT],
+        loader: Callable[[], Awaitable[ModelT]]
+    ) -> ModelT:
+        """
+        Return the cached response for params, loading it on a miss.
+
+        Redis failures are logged and the loader is called directly, so the
+        cache never makes a request fail.
+
+        Args:
+            params: Request parameters identifying the response
+            model: Response model used to deserialize cached values
+            loader: Coroutine factory producing the response on a miss
+
+        Returns:
+            Response model instance
+        """
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return await loader()
+
+        try:
+            key = await self._entry_key(params)
+            cached = await get_redis().get(key)
+        except RedisError as e:
+            logger.warning("Response cache unavailable: %s", e)
+            return await loader()
+
+        if cached is not None:
+            return model.model_validate_json(cached)
+
+        # Single-flight within this process
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._load_once(key, model, loader)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Followers re-raise it; avoid "exception never retrieved" warnings
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _load_once(
+        self,
+        key: str,
+        model: Type[ModelT],
+        loader: Callable[[], Awaitable[ModelT]]
+    ) -> ModelT:
+        """Load a missing entry, letting only one worker hit the database."""
+        client = get_redis()
+        lock_key = f"{key}:lock"
+        lock_timeout = settings.RESPONSE_CACHE_LOCK_TIMEOUT_MS
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = await client.set(lock_key, token, px=lock_timeout, nx=True)
+        except RedisError:
+            acquired = True
+
+        if not acquired:
+            # Another worker is loading this entry; wait briefly for it
+            waited = 0
+            while waited < lock_timeout:
+                await asyncio.sleep(0.025)
+                waited += 25
+                try:
+                    cached = await client.get(key)
+                except RedisError:
+                    break
+                if cached is not None:
+                    return model.model_validate_json(cached)
+
+        try:
+            response = await loader()
+            try:
+                await client.set(key, response.model_dump_json(), ex=self.ttl)
+            except RedisError as e:
+                logger.warning("Could not store cached response: %s", e)
+        finally:
+            if acquired:
+                await self._release_lock(client, lock_key, token)
+
+        return response
+
+    @staticmethod
+    async def _release_lock(client, lock_key: str, token: str) -> None:
+        """Delete a load lock unless it expired and another worker took it."""
+        try:
+            if isinstance(client, InMemoryRedis):
+                if await client.get(lock_key) == token.encode():
+                    await client.delete(lock_key)
+            else:
+                await client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except RedisError as e:
+            logger.warning("Could not release cache lock %s: %s", lock_key, e)
+
+    async def invalidate(self) -> None:
+        """Make every cached response of this namespace stale."""
+        try:
+            await get_redis().incr(self._generation_key)
+        except RedisError as e:
+            logger.warning("Could not invalidate response cache %s: %s", self.namespace, e)
@@ -23,16 +23,84 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 40
 
+    # Listing total counts (strategies: exact, estimated, cached)
+    GIG_LIST_COUNT_STRATEGY: str = "exact"
+    PROJECT_LIST_COUNT_STRATEGY: str = "exact"
+    CREATOR_GIGS_COUNT_STRATEGY: str = "exact"
+    CLIENT_PROJECTS_COUNT_STRATEGY: str = "exact"
+    CREATOR_SEARCH_COUNT_STRATEGY: str = "estimated"  # Exact would read every match of broad searches
+    COUNT_ESTIMATE_THRESHOLD: int = 10000  # Below this, estimated falls back to exact
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # Streaming exports (rows fetched per server-side cursor round trip)
+    EXPORT_BATCH_SIZE: int = 1000
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_TTL: int = 3600
 
+    # Response cache (listing endpoints)
+    RESPONSE_CACHE_ENABLED: bool = True
+    LISTING_CACHE_TTL: int = 60
+    RESPONSE_CACHE_LOCK_TIMEOUT_MS: int = 2000
+
+    # Gig autocomplete index (rebuilt in-process from active gigs)
+    SUGGEST_REFRESH_SECONDS: int = 300
+
+    # In-process index of active gigs, kept current via LISTEN/NOTIFY
+    GIG_MEMORY_INDEX_ENABLED: bool = False
+    GIG_INDEX_CHANNEL: str = "gig_changes"  # Must match the notify_gig_change() trigger
+    GIG_INDEX_RELOAD_SECONDS: int = 600
+    GIG_INDEX_BATCH_WINDOW_MS: int = 50
+
+    # Write-behind view counters
+    VIEW_COUNT_FLUSH_SECONDS: float = 5.0
+
+    # Proposal counter reconciliation (projects.proposal_count drift repair)
+    PROPOSAL_COUNT_RECONCILE_SECONDS: float = 900.0
+    PROPOSAL_COUNT_RECONCILE_BATCH: int = 5000  # Projects checked per statement
+
+    # Creator-project matching (precomputed top-k lists)
+    MATCHING_ENABLED: bool = True
+    MATCH_TOP_K: int = 50  # Matches kept per project and per creator
+    MATCH_BATCH_SIZE: int = 1000  # Projects or creators scored per statement
+    MATCH_REFRESH_SECONDS: float = 10.0
+    MATCH_REFRESH_BATCH: int = 500  # Queued changes applied per refresh
+
     # Security
     SECRET_KEY: str = "change-this-to-a-secure-secret-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     PASSWORD_MIN_LENGTH: int = 8
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt operations running at once
+    PASSWORD_HASH_MAX_WAITING: int = 64  # Queued operations before 503
+
+    # Authenticated user cache (in-process LRU, optional shared Redis tier)
+    USER_PRINCIPAL_CACHE_ENABLED: bool = True
+    USER_PRINCIPAL_CACHE_TTL_SECONDS: float = 10.0  # Bounds cross-worker staleness
+    USER_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    USER_PRINCIPAL_CACHE_REDIS: bool = True
+    USER_PRINCIPAL_REDIS_TTL_SECONDS: int = 300
+
+    # Token revocation (logout), propagated to all workers through Redis
+    TOKEN_REVOCATION_POLL_SECONDS: float = 2.0
+    TOKEN_REVOCATION_BACKFILL: int = 50000  # Log entries read by a new worker
+
+    # Verified-token cache (skips repeat JWT signature checks)
+    JWT_CACHE_ENABLED: bool = True
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+
+    # Rate limiting (sliding window in Redis, local token buckets as fallback)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_PUBLIC: str = "100/minute"  # Per client IP, unauthenticated
+    RATE_LIMIT_AUTHENTICATED: str = "1000/minute"  # Per user
+    RATE_LIMIT_CREATOR: str = "2000/minute"  # Per user
+    RATE_LIMIT_LOGIN: str = "5/minute"  # Per client IP
+    RATE_LIMIT_REGISTER: str = "3/hour"  # Per client IP
+    RATE_LIMIT_REDIS_RETRY_SECONDS: float = 5.0
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 100000
 
     # Mollie Payment Integration
     MOLLIE_API_KEY: str = ""
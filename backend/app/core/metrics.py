@@ -0,0 +1,127 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+A deliberately small registry of counters and gauges, served by ``GET
+/metrics`` (see app.main). Each worker process reports its own values; the
+scraper aggregates across workers.
+"""
+
+from typing import Dict, List, Tuple
+
+LabelValues = Tuple[Tuple[str, str], ...]
+
+
+class _Metric:
+    """A named metric holding one value per label combination."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        """
+        Args:
+            name: Metric name (snake_case, unit suffixed)
+            documentation: HELP text
+        """
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[LabelValues, float] = {}
+        _registry.append(self)
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> LabelValues:
+        return tuple(sorted(labels.items()))
+
+    def value(self, **labels: str) -> float:
+        """
+        Return the current value for a label combination.
+
+        Args:
+            **labels: Label values
+
+        Returns:
+            Current value (0 if never set)
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of this metric."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self._values.items()):
+            if key:
+                label_text = ",".join(
+                    '{}="{}"'.format(name, str(label).replace("\\", "\\\\").replace('"', '\\"'))
+                    for name, label in key
+                )
+                lines.append(f"{self.name}{{{label_text}}} {value:g}")
+            else:
+                lines.append(f"{self.name} {value:g}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Add to the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value: New value
+            **labels: Label values
+        """
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Add to the gauge.
+
+        Args:
+            amount: Increment (negative to decrement)
+            **labels: Label values
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Subtract from the gauge.
+
+        Args:
+            amount: Decrement
+            **labels: Label values
+        """
+        self.inc(-amount, **labels)
+
+
+_registry: List[_Metric] = []
+
+
+def render_metrics() -> str:
+    """
+    Render every registered metric.
+
+    Returns:
+        Prometheus text exposition (version 0.0.4)
+    """
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
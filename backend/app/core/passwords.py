@@ -0,0 +1,175 @@
+"""Password hashing off the event loop.
+
+A bcrypt hash or check costs a few hundred milliseconds of CPU. Run inline in
+an async handler it stalls every other request on the worker, so hashing runs
+on a dedicated thread pool instead (bcrypt releases the GIL while hashing, so
+threads hash in parallel and the event loop keeps running).
+
+At most ``PASSWORD_HASH_WORKERS`` operations run at once; further callers
+wait their turn in FIFO order. Once ``PASSWORD_HASH_MAX_WAITING`` callers are
+waiting, new ones are rejected with 503 instead of queueing without bound, so
+a login burst cannot grow the backlog (and each caller's latency) forever.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+
+T = TypeVar("T")
+
+# bcrypt only uses the first 72 bytes of a password; newer bcrypt releases
+# raise instead of truncating, so truncate explicitly as passlib did
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+password_hash_in_flight = Gauge(
+    "password_hash_in_flight", "Password hash/verify operations running on the pool"
+)
+password_hash_waiting = Gauge(
+    "password_hash_waiting", "Password hash/verify operations waiting for a pool slot"
+)
+password_hash_operations = Counter(
+    "password_hash_operations_total", "Completed password operations by operation"
+)
+password_hash_rejected = Counter(
+    "password_hash_rejected_total", "Password operations rejected because the wait queue was full"
+)
+password_hash_wait_seconds = Counter(
+    "password_hash_wait_seconds_total", "Time operations spent waiting for a pool slot"
+)
+password_hash_run_seconds = Counter(
+    "password_hash_run_seconds_total", "Time operations spent hashing on the pool"
+)
+
+
+def _encode(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt()).decode()
+
+
+def _verify(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(_encode(password), hashed.encode())
+    except ValueError:
+        return False  # Malformed or non-bcrypt hash
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt operations."""
+
+    def __init__(self, workers: int, max_waiting: int):
+        """
+        Args:
+            workers: Threads, and so operations running at once
+            max_waiting: Callers allowed to wait for a thread before new
+                ones are rejected
+        """
+        self.workers = workers
+        self.max_waiting = max_waiting
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(workers)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers waiting for a pool slot."""
+        return self._waiting
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        if self._waiting >= self.max_waiting:
+            password_hash_rejected.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        password_hash_waiting.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+            password_hash_waiting.dec()
+
+        started_at = time.perf_counter()
+        password_hash_wait_seconds.inc(started_at - queued_at)
+        password_hash_in_flight.inc()
+        loop = asyncio.get_running_loop()
+
+        def release(_: Future) -> None:
+            # Runs when the thread finishes, even if the caller was cancelled,
+            # so a slot is never reused while its bcrypt call still runs
+            loop.call_soon_threadsafe(self._finish, operation, started_at)
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._finish(operation, started_at)
+            raise
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def _finish(self, operation: str, started_at: float) -> None:
+        password_hash_run_seconds.inc(time.perf_counter() - started_at)
+        password_hash_operations.inc(operation=operation)
+        password_hash_in_flight.dec()
+        self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password on the pool.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            bcrypt hash string
+
+        Raises:
+            HTTPException: 503 if too many operations are already waiting
+        """
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """
+        Check a password against a bcrypt hash on the pool.
+
+        Args:
+            password: Plain text password
+            hashed: Stored hash
+
+        Returns:
+            True if the password matches
+
+        Raises:
+            HTTPException: 503 if too many operations are already waiting
+        """
+        return await self._run("verify", _verify, password, hashed)
+
+    def shutdown(self) -> None:
+        """Stop the pool's threads once running operations finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_waiting=settings.PASSWORD_HASH_MAX_WAITING,
+)
@@ -0,0 +1,162 @@
+"""Cache of authenticated users for the request path.
+
+Resolving the user behind an access token used to read the ``users`` row on
+every authenticated request. Principals are now cached in two tiers, keyed by
+the token's ``sub``:
+
+* an in-process TTL LRU (``USER_PRINCIPAL_CACHE_TTL_SECONDS``), which serves
+  most requests without any I/O;
+* optionally Redis (``USER_PRINCIPAL_CACHE_REDIS``), shared by all workers, so
+  a process with a cold local tier still skips the database.
+
+Every write to a user through app.crud.user (status, deleted_at and user_type
+included) calls ``invalidate``, which drops the local entry and the Redis
+entry at once. Other workers may serve their local copy until it expires, so
+USER_PRINCIPAL_CACHE_TTL_SECONDS bounds how long e.g. a suspension takes to
+apply everywhere.
+
+A worker may have read the row just before another worker's change and write
+it to Redis just after that worker's invalidation. Redis entries are
+therefore versioned: ``invalidate`` increments ``principal:{id}:version``, a
+load stores its entry tagged with the version it saw before reading the row,
+and lookups (one MGET of entry and version) ignore entries whose tag is not
+the current version. Version keys do not expire, so a version is never
+reused while an entry tagged with it may still exist.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import get_redis
+from app.schemas.user import UserPrincipal
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+principal_lookups = Counter(
+    "user_principal_lookups_total", "Authenticated user lookups by the tier that answered"
+)
+
+
+class PrincipalCache:
+    """Two-tier cache of UserPrincipal by user id."""
+
+    def __init__(self, ttl: float, maxsize: int, redis_ttl: int, use_redis: bool):
+        """
+        Args:
+            ttl: Seconds a principal stays in the in-process tier
+            maxsize: Principals kept in the in-process tier
+            redis_ttl: Seconds a principal stays in Redis
+            use_redis: Whether the shared Redis tier is used
+        """
+        self.redis_ttl = redis_ttl
+        self.use_redis = use_redis
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Bumped by every invalidation; a load that overlapped one is not
+        # stored, since it may have read the row before the change committed
+        self._generation = 0
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"principal:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: UUID) -> str:
+        return f"principal:{user_id}:version"
+
+    async def get_or_load(
+        self,
+        user_id: UUID,
+        loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[UserPrincipal]:
+        """
+        Return the principal for a user id, loading it on a miss.
+
+        Redis failures are logged and fall through to the loader, so the
+        cache never makes a request fail.
+
+        Args:
+            user_id: User UUID (the token's ``sub``)
+            loader: Coroutine factory returning the User row or None
+
+        Returns:
+            UserPrincipal, or None if the user does not exist
+        """
+        if not settings.USER_PRINCIPAL_CACHE_ENABLED:
+            user = await loader()
+            return UserPrincipal.model_validate(user) if user is not None else None
+
+        principal = self._local.get(user_id)
+        if principal is not None:
+            principal_lookups.inc(tier="local")
+            return principal
+
+        generation = self._generation
+        version = None
+        if self.use_redis:
+            try:
+                cached, current = await get_redis().mget(self._key(user_id), self._version_key(user_id))
+                version = int(current or 0)
+            except RedisError as e:
+                logger.warning("Principal cache unavailable: %s", e)
+                cached = None
+            if cached is not None:
+                tag, _, data = cached.partition(b":")
+                # An entry tagged with an older version was loaded before the
+                # last invalidation and may be stale
+                if tag.isdigit() and int(tag) == version:
+                    principal = UserPrincipal.model_validate_json(data)
+                    if generation == self._generation:
+                        self._local.set(user_id, principal)
+                    principal_lookups.inc(tier="redis")
+                    return principal
+
+        user = await loader()
+        principal_lookups.inc(tier="database")
+        if user is None:
+            return None
+
+        principal = UserPrincipal.model_validate(user)
+        if generation == self._generation:
+            self._local.set(user_id, principal)
+            if version is not None:
+                try:
+                    await get_redis().set(
+                        self._key(user_id),
+                        f"{version}:{principal.model_dump_json()}",
+                        ex=self.redis_ttl
+                    )
+                except RedisError as e:
+                    logger.warning("Could not store principal: %s", e)
+
+        return principal
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """
+        Drop a user's cached principal after the user row changed.
+
+        Args:
+            user_id: User UUID
+        """
+        self._generation += 1
+        self._local.pop(user_id)
+        if self.use_redis:
+            try:
+                client = get_redis()
+                await client.incr(self._version_key(user_id))
+                await client.delete(self._key(user_id))
+            except RedisError as e:
+                logger.warning("Could not invalidate principal %s: %s", user_id, e)
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.USER_PRINCIPAL_CACHE_TTL_SECONDS,
+    maxsize=settings.USER_PRINCIPAL_CACHE_MAX_ENTRIES,
+    redis_ttl=settings.USER_PRINCIPAL_REDIS_TTL_SECONDS,
+    use_redis=settings.USER_PRINCIPAL_CACHE_REDIS,
+)
@@ -0,0 +1,298 @@
+"""Request rate limiting.
+
+Two kinds of policy apply (rates like ``"5/minute"``, see config):
+
+* a tier limit on every ``/v1`` request (``enforce_rate_limit_tier``), per
+  principal for authenticated requests (JWT ``sub``; creators get a larger
+  allowance) and per client IP otherwise;
+* route limits added to individual endpoints with ``rate_limit(...)``, e.g.
+  login attempts per client IP, which keeps bcrypt from being used to burn
+  every worker's CPU.
+
+Limits are enforced with a sliding window shared by all workers in Redis: a
+counter per fixed window, with the previous window's count weighted by how
+much of it still overlaps the sliding window. One Lua script reads both
+counters and increments the current one, so a check is one round trip.
+
+When Redis fails (or ``REDIS_URL`` is ``memory://``) each worker falls back to
+a local token bucket per key for ``RATE_LIMIT_REDIS_RETRY_SECONDS`` before
+trying Redis again. Local buckets are not shared, so during an outage the
+effective limit is multiplied by the number of workers.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis import InMemoryRedis, get_redis
+from app.core.security import decode_token
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+WINDOW_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# KEYS: current window counter, previous window counter
+# ARGV: limit, window seconds, elapsed fraction of the current window
+SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimate = previous * (1 - tonumber(ARGV[3])) + current
+if estimate + 1 > tonumber(ARGV[1]) then
+    return {0, math.floor(estimate)}
+end
+if redis.call('INCR', KEYS[1]) == 1 then
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]) * 2)
+end
+return {1, math.floor(estimate) + 1}
+"""
+
+rate_limit_requests = Counter(
+    "rate_limit_requests_total", "Rate-limited requests by policy and result"
+)
+rate_limit_backend = Counter(
+    "rate_limit_checks_total", "Rate limit checks by the backend that answered"
+)
+rate_limit_redis_errors = Counter(
+    "rate_limit_redis_errors_total", "Rate limit checks that fell back after a Redis error"
+)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """A named limit of requests per window."""
+
+    name: str
+    limit: int
+    window: int  # Seconds
+
+    @classmethod
+    def parse(cls, name: str, rate: str) -> "RateLimitPolicy":
+        """
+        Build a policy from a rate string.
+
+        Args:
+            name: Policy name (metric label and key prefix)
+            rate: ``"<count>/<second|minute|hour|day>"``, e.g. ``"5/minute"``
+
+        Returns:
+            Parsed policy
+
+        Raises:
+            ValueError: If the rate string is malformed
+        """
+        count, _, unit = rate.partition("/")
+        unit = unit.strip().rstrip("s")
+        if unit not in WINDOW_UNITS:
+            raise ValueError(f"Invalid rate limit {rate!r} for {name}")
+        return cls(name=name, limit=int(count), window=WINDOW_UNITS[unit])
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int  # Seconds (0 when allowed)
+
+
+class TokenBucket:
+    """Local token bucket refilled at ``limit`` tokens per window."""
+
+    def __init__(self, policy: RateLimitPolicy):
+        self.capacity = float(policy.limit)
+        self.rate = policy.limit / policy.window
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def take(self) -> Tuple[bool, int, int]:
+        """
+        Take one token.
+
+        Returns:
+            Tuple of (allowed, tokens remaining, seconds until one is free)
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, int(self.tokens), 0
+        return False, 0, math.ceil((1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Sliding-window limiter on Redis with a local token bucket fallback."""
+
+    def __init__(self, local_max_keys: int, redis_retry_seconds: float):
+        """
+        Args:
+            local_max_keys: Token buckets kept in memory (LRU)
+            redis_retry_seconds: Seconds to use local buckets after a Redis
+                error before trying Redis again
+        """
+        self.redis_retry_seconds = redis_retry_seconds
+        self._buckets = TTLCache(maxsize=local_max_keys, ttl=WINDOW_UNITS["day"])
+        self._redis_down_until = 0.0
+        self._script = None
+        self._script_client = None
+
+    def _sliding_window_script(self, client):
+        # Registered per client so a replaced client (tests) gets its own
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def _hit_redis(self, client, policy: RateLimitPolicy, identity: str) -> RateLimitDecision:
+        now = time.time()
+        window_index, elapsed = divmod(now, policy.window)
+        prefix = f"ratelimit:{policy.name}:{identity}"
+        allowed, count = await self._sliding_window_script(client)(
+            keys=[f"{prefix}:{int(window_index)}", f"{prefix}:{int(window_index) - 1}"],
+            args=[policy.limit, policy.window, elapsed / policy.window],
+        )
+        if allowed:
+            return RateLimitDecision(True, policy.limit, max(0, policy.limit - int(count)), 0)
+        return RateLimitDecision(False, policy.limit, 0, max(1, math.ceil(policy.window - elapsed)))
+
+    def _hit_local(self, policy: RateLimitPolicy, identity: str) -> RateLimitDecision:
+        key = (policy.name, identity)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(policy)
+        # Re-set on every hit so active buckets stay at the LRU's fresh end
+        self._buckets.set(key, bucket, ttl=policy.window * 2)
+        allowed, remaining, retry_after = bucket.take()
+        return RateLimitDecision(allowed, policy.limit, remaining, retry_after)
+
+    async def hit(self, policy: RateLimitPolicy, identity: str) -> RateLimitDecision:
+        """
+        Count one request against a policy.
+
+        Args:
+            policy: Policy to apply
+            identity: Who the limit is per (principal or client IP)
+
+        Returns:
+            Whether the request is allowed, with header values
+        """
+        client = get_redis()
+        if not isinstance(client, InMemoryRedis) and time.monotonic() >= self._redis_down_until:
+            try:
+                decision = await self._hit_redis(client, policy, identity)
+                rate_limit_backend.inc(backend="redis")
+                return decision
+            except RedisError as e:
+                logger.warning("Rate limiter falling back to local buckets: %s", e)
+                rate_limit_redis_errors.inc()
+                self._redis_down_until = time.monotonic() + self.redis_retry_seconds
+
+        rate_limit_backend.inc(backend="local")
+        return self._hit_local(policy, identity)
+
+
+rate_limiter = RateLimiter(
+    local_max_keys=settings.RATE_LIMIT_LOCAL_MAX_KEYS,
+    redis_retry_seconds=settings.RATE_LIMIT_REDIS_RETRY_SECONDS,
+)
+
+PUBLIC_POLICY = RateLimitPolicy.parse("public", settings.RATE_LIMIT_PUBLIC)
+AUTHENTICATED_POLICY = RateLimitPolicy.parse("authenticated", settings.RATE_LIMIT_AUTHENTICATED)
+CREATOR_POLICY = RateLimitPolicy.parse("creator", settings.RATE_LIMIT_CREATOR)
+
+
+def client_ip(request: Request) -> str:
+    """
+    Return the client address of a request.
+
+    Behind a proxy, run uvicorn with ``--proxy-headers`` so this is the
+    forwarded client rather than the proxy.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client IP, or "unknown"
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def _token_claims(request: Request) -> Optional[Dict]:
+    """Return the verified claims of the request's bearer token, if any."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token)
+    except HTTPException:
+        return None
+
+
+async def _enforce(policy: RateLimitPolicy, identity: str) -> None:
+    decision = await rate_limiter.hit(policy, identity)
+    if decision.allowed:
+        rate_limit_requests.inc(policy=policy.name, result="allowed")
+        return
+
+    rate_limit_requests.inc(policy=policy.name, result="limited")
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, please retry later",
+        headers={
+            "Retry-After": str(decision.retry_after),
+            "X-RateLimit-Limit": str(decision.limit),
+            "X-RateLimit-Remaining": str(decision.remaining),
+        },
+    )
+
+
+async def enforce_rate_limit_tier(request: Request) -> None:
+    """
+    Dependency applying the tier limit of the caller (router-wide).
+
+    Args:
+        request: Incoming request
+
+    Raises:
+        HTTPException: 429 if the caller is over its tier's limit
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    claims = _token_claims(request)
+    if claims is None or not claims.get("sub"):
+        await _enforce(PUBLIC_POLICY, f"ip:{client_ip(request)}")
+    elif claims.get("user_type") in ["creator", "both"]:
+        await _enforce(CREATOR_POLICY, f"user:{claims['sub']}")
+    else:
+        await _enforce(AUTHENTICATED_POLICY, f"user:{claims['sub']}")
+
+
+def rate_limit(name: str, rate: str) -> Callable:
+    """
+    Build a dependency limiting one route per client IP.
+
+    Args:
+        name: Policy name (metric label and key prefix)
+        rate: Rate string, e.g. ``settings.RATE_LIMIT_LOGIN``
+
+    Returns:
+        Dependency raising 429 once the client is over the limit
+    """
+    policy = RateLimitPolicy.parse(name, rate)
+
+    async def enforce_route_limit(request: Request) -> None:
+        if settings.RATE_LIMIT_ENABLED:
+            await _enforce(policy, f"ip:{client_ip(request)}")
+
+    return enforce_route_limit
@@ -0,0 +1,170 @@
+"""Redis client management.
+
+``REDIS_URL`` selects the backend: a regular ``redis://`` / ``rediss://`` URL
+connects to Redis, while ``memory://`` uses an in-process stand-in that
+implements the subset of commands the application relies on. The stand-in is
+meant for tests and local development; it is not shared across processes.
+"""
+
+import asyncio
+import fnmatch
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as redis_asyncio
+
+from app.core.config import settings
+
+
+class InMemoryRedis:
+    """
+    In-process replacement for redis.asyncio.Redis.
+
+    Supports the string, counter, expiry and key commands used by the
+    application caches. Values are stored as bytes like real Redis returns
+    them without ``decode_responses``.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _expiry(ex: Optional[float], px: Optional[float]) -> Optional[float]:
+        if ex is not None:
+            return time.monotonic() + ex
+        if px is not None:
+            return time.monotonic() + px / 1000
+        return None
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def mget(self, *keys) -> list:
+        if len(keys) == 1 and isinstance(keys[0], (list, tuple)):
+            keys = keys[0]
+        return [self._live(key) for key in keys]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ex: Optional[float] = None,
+        px: Optional[float] = None,
+        nx: bool = False
+    ) -> Optional[bool]:
+        async with self._lock:
+            if nx and self._live(key) is not None:
+                return None
+            self._data[key] = (self._encode(value), self._expiry(ex, px))
+            return True
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        async with self._lock:
+            current = self._live(key)
+            expires_at = self._data[key][1] if current is not None else None
+            value = int(current or 0) + amount
+            self._data[key] = (self._encode(value), expires_at)
+            return value
+
+    async def incrby(self, key: str, amount: int = 1) -> int:
+        return await self.incr(key, amount)
+
+    async def delete(self, *keys: str) -> int:
+        async with self._lock:
+            removed = 0
+            for key in keys:
+                if self._live(key) is not None:
+                    del self._data[key]
+                    removed += 1
+            return removed
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._live(key) is not None)
+
+    async def expire(self, key: str, seconds: float) -> bool:
+        async with self._lock:
+            value = self._live(key)
+            if value is None:
+                return False
+            self._data[key] = (value, time.monotonic() + seconds)
+            return True
+
+    async def ttl(self, key: str) -> int:
+        value = self._live(key)
+        if value is None:
+            return -2
+        expires_at = self._data[key][1]
+        if expires_at is None:
+            return -1
+        return max(0, int(expires_at - time.monotonic()))
+
+    async def keys(self, pattern: str = "*") -> list:
+        return [
+            key.encode() for key in list(self._data)
+            if self._live(key) is not None and fnmatch.fnmatchcase(key, pattern)
+        ]
+
+    async def flushdb(self) -> bool:
+        self._data.clear()
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+
+_client = None
+
+
+def get_redis():
+    """
+    Return the shared Redis client, creating it on first use.
+
+    Returns:
+        redis.asyncio.Redis, or InMemoryRedis when REDIS_URL is ``memory://``
+    """
+    global _client
+    if _client is None:
+        if settings.REDIS_URL.startswith("memory://"):
+            _client = InMemoryRedis()
+        else:
+            _client = redis_asyncio.from_url(settings.REDIS_URL)
+    return _client
+
+
+def set_redis(client) -> None:
+    """
+    Replace the shared client (e.g. with an InMemoryRedis in tests).
+
+    Args:
+        client: Client exposing the redis.asyncio API
+    """
+    global _client
+    _client = client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
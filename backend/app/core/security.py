@@ -1,44 +1,68 @@
 """Security utilities for authentication and authorization."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.metrics import Counter
+from app.core.passwords import password_hasher
+from app.core.token_revocation import revoked_tokens_rejected, token_revocations
+from app.utils.cache import TTLCache
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Claims of tokens whose signature was already verified, by SHA-256 of the
+# token; an entry expires no later than the token's own exp
+_verified_tokens = TTLCache(
+    maxsize=settings.JWT_CACHE_MAX_ENTRIES,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+jwt_cache_lookups = Counter(
+    "jwt_cache_lookups_total", "Token decodes by whether verified claims were cached"
+)
+
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
     """Hash a plain text password.
 
+    bcrypt runs on the password hashing pool (app.core.passwords), never on
+    the event loop.
+
     Args:
         password: Plain text password
 
     Returns:
         Hashed password string
+
+    Raises:
+        HTTPException: 503 if the hashing pool's wait queue is full
     """
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash.
 
+    bcrypt runs on the password hashing pool (app.core.passwords), never on
+    the event loop.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password to compare against
 
     Returns:
         True if password matches, False otherwise
+
+    Raises:
+        HTTPException: 503 if the hashing pool's wait queue is full
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -93,6 +117,10 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
 def decode_token(token: str) -> Dict[str, Any]:
     """Decode and verify a JWT token.
 
+    Clients reuse a token for its whole lifetime, so the claims of verified
+    tokens are cached (JWT_CACHE_ENABLED) and repeat requests skip the
+    signature check. Entries expire with the token's exp claim.
+
     Args:
         token: JWT token string to decode
 
@@ -102,9 +130,16 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    key = None
+    if settings.JWT_CACHE_ENABLED:
+        key = hashlib.sha256(token.encode()).digest()
+        cached = _verified_tokens.get(key)
+        if cached is not None:
+            jwt_cache_lookups.inc(result="hit")
+            return dict(cached)
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -112,6 +147,15 @@ def decode_token(token: str) -> Dict[str, Any]:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if key is not None:
+        jwt_cache_lookups.inc(result="miss")
+        remaining = payload.get("exp", 0) - time.time()
+        if remaining > 0:
+            _verified_tokens.set(key, payload, ttl=min(remaining, _verified_tokens.ttl))
+        return dict(payload)
+
+    return payload
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -144,6 +188,15 @@ async def get_current_user(
             detail="Could not validate credentials",
         )
 
+    # Reject tokens issued before the user's last logout (in-memory lookup)
+    if token_revocations.is_revoked(user_id, payload.get("token_version", 0)):
+        revoked_tokens_rejected.inc()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     # In a real application, you would fetch the user from the database here
     # For now, return the payload
     return payload
@@ -0,0 +1,179 @@
+"""Revocation of issued tokens by token version.
+
+Every token carries the ``token_version`` of its user at issue time; logging
+out increments ``users.token_version``, revoking every token issued before.
+
+Checking a token must not touch the database, so each worker keeps the
+minimum valid version of recently revoked users in a dict, and
+``is_revoked`` is a single lookup. Revocations reach the other workers through
+a log in Redis: ``revoke`` increments ``auth:revocations:seq`` and writes the
+entry under ``auth:revocations:<seq>``, and every worker polls the sequence
+every ``TOKEN_REVOCATION_POLL_SECONDS`` and reads the entries it has not seen.
+
+An entry is only needed while tokens issued before it can still be valid, so
+entries (in Redis and in memory) expire after the access token lifetime.
+Refresh tokens live longer and are checked against ``users.token_version``
+itself when they are used.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_KEY = "auth:revocations:seq"
+ENTRY_KEY_PREFIX = "auth:revocations:"
+# Slack on top of the access token lifetime before an entry is forgotten
+EXPIRY_MARGIN_SECONDS = 60
+
+revoked_tokens_rejected = Counter(
+    "revoked_tokens_rejected_total", "Requests rejected because their token was revoked"
+)
+token_revocations_tracked = Gauge(
+    "token_revocations_tracked", "Users with a revocation held in memory by this worker"
+)
+
+
+class TokenRevocations:
+    """In-memory view of recent revocations, synchronized through Redis."""
+
+    def __init__(self, entry_ttl: float, backfill: int):
+        """
+        Args:
+            entry_ttl: Seconds a revocation is kept (access token lifetime)
+            backfill: Most recent log entries read by a freshly started worker
+        """
+        self.entry_ttl = entry_ttl
+        self.backfill = backfill
+        # user id -> (minimum valid token version, monotonic expiry)
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        self._cursor: Optional[int] = None
+        # Sequence numbers seen before their entry was written; retried once
+        self._pending: Set[int] = set()
+
+    def is_revoked(self, user_id: str, token_version: int) -> bool:
+        """
+        Check whether a token was issued before its user's last revocation.
+
+        Args:
+            user_id: The token's ``sub``
+            token_version: The token's ``token_version`` claim
+
+        Returns:
+            True if the token must be rejected
+        """
+        entry = self._versions.get(user_id)
+        return entry is not None and token_version < entry[0]
+
+    def _apply(self, user_id: str, version: int) -> None:
+        current = self._versions.get(user_id)
+        if current is None or version >= current[0]:
+            self._versions[user_id] = (version, time.monotonic() + self.entry_ttl)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for user_id in [user_id for user_id, (_, expires_at) in self._versions.items() if expires_at <= now]:
+            del self._versions[user_id]
+        token_revocations_tracked.set(len(self._versions))
+
+    async def revoke(self, user_id: Union[UUID, str], version: int) -> None:
+        """
+        Reject the user's tokens issued under versions below ``version``.
+
+        Applies to this worker at once and to the others on their next poll.
+
+        Args:
+            user_id: User UUID
+            version: The user's new token version
+        """
+        self._apply(str(user_id), version)
+        token_revocations_tracked.set(len(self._versions))
+        try:
+            client = get_redis()
+            sequence = await client.incr(SEQUENCE_KEY)
+            await client.set(
+                f"{ENTRY_KEY_PREFIX}{sequence}", f"{user_id}:{version}", ex=int(self.entry_ttl)
+            )
+        except RedisError as e:
+            logger.warning("Could not publish token revocation for %s: %s", user_id, e)
+
+    async def sync(self) -> int:
+        """
+        Read revocations published since the last call.
+
+        Returns:
+            Number of revocation entries applied
+        """
+        client = get_redis()
+        sequence = int(await client.get(SEQUENCE_KEY) or 0)
+        if self._cursor is None:
+            self._cursor = max(0, sequence - self.backfill)
+
+        retry = sorted(self._pending)
+        self._pending.clear()
+        new = list(range(self._cursor + 1, sequence + 1))
+        applied = 0
+        for start in range(0, len(retry) + len(new), 1000):
+            numbers: List[int] = (retry + new)[start:start + 1000]
+            entries = await client.mget([f"{ENTRY_KEY_PREFIX}{number}" for number in numbers])
+            for number, entry in zip(numbers, entries):
+                if entry is None:
+                    # The sequence is incremented just before the entry is
+                    # written; look again next time unless already retried
+                    if number > self._cursor:
+                        self._pending.add(number)
+                    continue
+                user_id, _, version = (entry.decode() if isinstance(entry, bytes) else entry).rpartition(":")
+                self._apply(user_id, int(version))
+                applied += 1
+
+        self._cursor = max(self._cursor, sequence)
+        self._prune()
+        return applied
+
+
+token_revocations = TokenRevocations(
+    entry_ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60 + EXPIRY_MARGIN_SECONDS,
+    backfill=settings.TOKEN_REVOCATION_BACKFILL,
+)
+
+_sync_task: Optional[asyncio.Task] = None
+
+
+async def _sync_periodically() -> None:
+    while True:
+        try:
+            await token_revocations.sync()
+        except RedisError as e:
+            logger.warning("Could not read token revocations: %s", e)
+        except Exception:
+            logger.exception("Failed to sync token revocations; will retry")
+        await asyncio.sleep(settings.TOKEN_REVOCATION_POLL_SECONDS)
+
+
+def start_token_revocation_sync() -> None:
+    """Start the background loop reading other workers' revocations."""
+    global _sync_task
+    if _sync_task is None:
+        _sync_task = asyncio.create_task(_sync_periodically())
+
+
+async def stop_token_revocation_sync() -> None:
+    """Stop the revocation sync loop."""
+    global _sync_task
+    if _sync_task is not None:
+        _sync_task.cancel()
+        try:
+            await _sync_task
+        except asyncio.CancelledError:
+            pass
+        _sync_task = None
@@ -3,13 +3,29 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.client import ClientProfile
 
 
+def client_search_vector():
+    """
+    Build the tsvector expression for client profile full-text search.
+
+    Must match the idx_client_profiles_full_text index definition exactly.
+
+    Returns:
+        SQL expression producing the client document vector
+    """
+    return func.to_tsvector(
+        literal_column("'english'"),
+        ClientProfile.company_name + literal_column("' '")
+        + func.coalesce(ClientProfile.industry, literal_column("''"))
+    )
+
+
 async def get_client_by_id(db: AsyncSession, client_id: UUID) -> Optional[ClientProfile]:
     """
     Get a client profile by its ID.
@@ -0,0 +1,231 @@
+"""CRUD operations for creator profiles."""
+
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal_column, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.creator import CreatorCategory, CreatorProfile, CreatorSkill
+from app.models.user import User
+from app.schemas.creator import CreatorSearchFilters
+from app.utils.counting import ListingCounter, count_cache_key
+from app.utils.pagination import (
+    decode_cursor,
+    keyset_condition,
+    keyset_order_by,
+    next_page_cursor,
+)
+
+
+def creator_search_vector():
+    """
+    Build the tsvector expression for creator profile full-text search.
+
+    Must match the idx_creator_profiles_full_text index definition exactly.
+
+    Returns:
+        SQL expression producing the creator document vector
+    """
+    return func.to_tsvector(
+        literal_column("'english'"),
+        CreatorProfile.display_name + literal_column("' '")
+        + func.coalesce(CreatorProfile.tagline, literal_column("''")) + literal_column("' '")
+        + func.coalesce(CreatorProfile.bio, literal_column("''"))
+    )
+
+
+async def get_creator_profile_id_by_user_id(db: AsyncSession, user_id: UUID) -> Optional[UUID]:
+    """
+    Get the creator profile ID of a user (unique index on user_id).
+
+    Args:
+        db: Database session
+        user_id: User UUID
+
+    Returns:
+        Creator profile UUID or None if the user has no creator profile
+    """
+    result = await db.execute(
+        select(CreatorProfile.id).where(CreatorProfile.user_id == user_id)
+    )
+    return result.scalar_one_or_none()
+
+
+def creator_sort_column(sort_by: str):
+    """
+    Resolve the column a creator search is ordered by.
+
+    Each has an ``(column, id)`` index (see CreatorProfile.__table_args__), so
+    every sort order is an index scan in either direction.
+
+    Args:
+        sort_by: Sort field name
+
+    Returns:
+        Column to sort by
+    """
+    sort_column = CreatorProfile.average_rating  # Default
+    if sort_by == "jobs_completed":
+        sort_column = CreatorProfile.total_jobs_completed
+    elif sort_by == "created_at":
+        sort_column = CreatorProfile.created_at
+    elif sort_by == "hourly_rate":
+        sort_column = CreatorProfile.hourly_rate
+    elif sort_by == "rating":
+        sort_column = CreatorProfile.average_rating
+
+    return sort_column
+
+
+def build_creator_conditions(filters: CreatorSearchFilters) -> list:
+    """
+    Build WHERE conditions for a creator search.
+
+    Every condition is on creator_profiles itself; skills, categories, the
+    owning user and the text search are semi-joins (``id IN (SELECT ...)``),
+    which the planner runs once as a hashed or index-driven semi-join rather
+    than as a subquery per creator.
+
+    Args:
+        filters: Search and filter parameters
+
+    Returns:
+        List of SQL conditions
+    """
+    # Only creators whose account is active
+    conditions = [
+        CreatorProfile.user_id.in_(
+            select(User.id).where(User.status == "active", User.deleted_at.is_(None))
+        )
+    ]
+
+    # Availability filter; a single status is compared with = so the planner
+    # can use the partial "available" indexes
+    if filters.availability_status:
+        if len(filters.availability_status) == 1:
+            conditions.append(CreatorProfile.availability_status == filters.availability_status[0])
+        else:
+            conditions.append(CreatorProfile.availability_status.in_(filters.availability_status))
+
+    # Rating, experience and track record
+    if filters.min_rating is not None:
+        conditions.append(CreatorProfile.average_rating >= filters.min_rating)
+
+    if filters.min_jobs_completed is not None:
+        conditions.append(CreatorProfile.total_jobs_completed >= filters.min_jobs_completed)
+
+    if filters.min_years_experience is not None:
+        conditions.append(CreatorProfile.years_of_experience >= filters.min_years_experience)
+
+    # Budget filter
+    if filters.max_hourly_rate is not None:
+        conditions.append(CreatorProfile.hourly_rate <= filters.max_hourly_rate)
+
+    # Verification filter
+    if filters.verified_only:
+        conditions.append(CreatorProfile.is_verified.is_(True))
+
+    # Skills filter (creator must have at least one of the provided skills)
+    if filters.skills:
+        conditions.append(
+            CreatorProfile.id.in_(
+                select(CreatorSkill.creator_profile_id)
+                .where(CreatorSkill.skill_name.in_(filters.skills))
+            )
+        )
+
+    # Categories filter (creator must cover at least one of the categories)
+    if filters.categories:
+        conditions.append(
+            CreatorProfile.id.in_(
+                select(CreatorCategory.creator_profile_id)
+                .where(CreatorCategory.category.in_(filters.categories))
+            )
+        )
+
+    # Search in name, tagline and bio (idx_creator_profiles_full_text) or an
+    # exact skill name (idx_creator_skills_skill_name)
+    if filters.search_query:
+        ts_query = func.websearch_to_tsquery(literal_column("'english'"), filters.search_query)
+        conditions.append(
+            CreatorProfile.id.in_(
+                union(
+                    select(CreatorProfile.id)
+                    .where(creator_search_vector().op("@@")(ts_query))
+                    .correlate(None),
+                    select(CreatorSkill.creator_profile_id)
+                    .where(CreatorSkill.skill_name == filters.search_query.strip()),
+                )
+            )
+        )
+
+    return conditions
+
+
+async def search_creators(
+    db: AsyncSession,
+    filters: CreatorSearchFilters
+) -> Tuple[List[CreatorProfile], int, Optional[str]]:
+    """
+    Search creator profiles with filters and pagination.
+
+    Pages are addressed either by ``filters.page`` or, when ``filters.cursor``
+    is set, by keyset pagination on (sort key, id), which costs the same on
+    every page.
+
+    Args:
+        db: Database session
+        filters: Search and filter parameters
+
+    Returns:
+        Tuple of (list of creator profiles, total count, cursor for the next
+        page or None)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another sort
+    """
+    conditions = build_creator_conditions(filters)
+    sort_column = creator_sort_column(filters.sort_by)
+    skip = (filters.page - 1) * filters.page_size
+
+    # The sort key is selected alongside each creator so the next cursor can
+    # be built from it
+    query = select(CreatorProfile, sort_column.label("sort_value")).where(and_(*conditions))
+
+    # Resolve the total per the configured count strategy; exact counts ride
+    # along with the page as a window column
+    counter = ListingCounter(
+        settings.CREATOR_SEARCH_COUNT_STRATEGY,
+        CreatorProfile,
+        conditions,
+        count_cache_key("creators", filters.model_dump()),
+    )
+    await counter.prepare(db)
+    query = counter.apply(query, keyset=bool(filters.cursor))
+
+    # Apply sorting (id breaks ties so keyset positions are unique)
+    query = query.order_by(*keyset_order_by(sort_column, CreatorProfile.id, filters.sort_order))
+
+    # Apply pagination, fetching one extra row to detect a next page
+    if filters.cursor:
+        value, last_id = decode_cursor(
+            filters.cursor, filters.sort_by, filters.sort_order, sort_column
+        )
+        query = query.where(
+            keyset_condition(sort_column, CreatorProfile.id, filters.sort_order, value, last_id)
+        )
+    else:
+        query = query.offset(skip)
+    query = query.limit(filters.page_size + 1)
+
+    # Execute query
+    result = await db.execute(query)
+    rows = result.all()
+    total = await counter.resolve(db, rows, skip)
+    creators, next_cursor = next_page_cursor(
+        rows, filters.page_size, filters.sort_by, filters.sort_order
+    )
+
+    return creators, total, next_cursor
@@ -1,16 +1,61 @@
 """CRUD operations for gigs."""
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import (
+    select, update, exists, func, cast, literal, or_, and_, desc, asc,
+    literal_column, Float, Integer, String,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.core.config import settings
 from app.models.gig import Gig
-from app.schemas.gig import GigCreate, GigUpdate, GigSearchFilters
+from app.schemas.gig import GigCreate, GigUpdate, GigSearchFilters, GigSearchMode
+from app.utils.pagination import (
+    decode_cursor,
+    keyset_condition,
+    keyset_order_by,
+    next_page_cursor,
+)
+from app.utils.counting import ListingCounter, count_cache_key
+from app.utils.facets import bucket_expression, count_facets
+
+
+def gig_search_vector():
+    """
+    Build the tsvector expression for gig full-text search.
+
+    The expression must match the idx_gigs_full_text index definition exactly
+    (including the literal 'english' config), otherwise the planner cannot use
+    the GIN index and falls back to a sequential scan.
+
+    Returns:
+        SQL expression producing the gig document vector
+    """
+    return func.to_tsvector(
+        literal_column("'english'"),
+        Gig.title + literal_column("' '") + Gig.description
+    )
+
+
+def gig_search_query(search: str):
+    """
+    Build a tsquery from user input using web search syntax.
+
+    Supports quoted phrases, OR and -negation, and never raises on malformed input.
+
+    Args:
+        search: Raw search string
+
+    Returns:
+        SQL expression producing the tsquery
+    """
+    return func.websearch_to_tsquery(literal_column("'english'"), search)
 
 
 async def create_gig(
@@ -156,42 +201,50 @@ async def delete_gig(db: AsyncSession, gig: Gig) -> bool:
     return True
 
 
-async def increment_view_count(db: AsyncSession, gig: Gig) -> Gig:
+async def add_view_counts(db: AsyncSession, counts: Dict[UUID, int]) -> int:
     """
-    Increment the view count for a gig.
+    Add buffered view increments to many gigs in one statement.
+
+    Issues a single ``UPDATE ... FROM unnest(ids, views)`` with the batch
+    bound as two array parameters, so its size is not limited by the
+    driver's bind parameter limit. Rows are listed in id order so concurrent
+    flushes take row locks in the same order.
 
     Args:
         db: Database session
-        gig: Gig instance
+        counts: Gig ID -> number of views to add
 
     Returns:
-        Updated Gig instance
+        Number of rows updated
     """
-    gig.view_count += 1
-    await db.flush()
-    await db.refresh(gig)
-    return gig
+    if not counts:
+        return 0
 
+    ids, views = zip(*sorted(counts.items()))
+    increments = func.unnest(
+        literal(list(ids), ARRAY(PGUUID(as_uuid=True))),
+        literal(list(views), ARRAY(Integer)),
+    ).table_valued("id", "views").render_derived(name="increments")
 
-async def list_gigs(
-    db: AsyncSession,
-    filters: GigSearchFilters
-) -> tuple[List[Gig], int]:
+    table = Gig.__table__
+    result = await db.execute(
+        update(table)
+        .where(table.c.id == increments.c.id)
+        .values(view_count=func.coalesce(table.c.view_count, 0) + increments.c.views)
+    )
+    return result.rowcount
+
+
+def build_gig_conditions(filters: GigSearchFilters) -> tuple[list, Optional[Any]]:
     """
-    List gigs with pagination, search, and filters.
+    Build WHERE conditions for a gig search.
 
     Args:
-        db: Database session
         filters: Search and filter parameters
 
     Returns:
-        Tuple of (list of gigs, total count)
+        Tuple of (list of conditions, tsquery expression or None)
     """
-    # Build base query with eager loading of creator profile
-    query = select(Gig).options(selectinload(Gig.creator))
-    count_query = select(func.count()).select_from(Gig)
-
-    # Build WHERE conditions
     conditions = []
 
     # Status filter
@@ -221,30 +274,56 @@ async def list_gigs(
     if filters.max_price is not None:
         conditions.append(Gig.basic_price <= filters.max_price)
 
+    # Tier-aware price range: some package must be priced within the range.
+    # With one bound this is exactly a bound on the gig's priciest/cheapest
+    # package (single-column range scans); with both, those bounds only
+    # narrow the candidates, and each package is then checked individually
+    if filters.package_min_price is not None:
+        conditions.append(Gig.max_package_price >= filters.package_min_price)
+
+    if filters.package_max_price is not None:
+        conditions.append(Gig.min_package_price <= filters.package_max_price)
+
+    if filters.package_min_price is not None and filters.package_max_price is not None:
+        conditions.append(or_(*(
+            price.between(filters.package_min_price, filters.package_max_price)
+            for price in (Gig.basic_price, Gig.standard_price, Gig.premium_price)
+        )))
+
     # Tags filter (gig must have at least one of the provided tags)
     if filters.tags:
         conditions.append(Gig.search_tags.overlap(filters.tags))
 
     # Search in title and description
+    ts_query = None
     if filters.search:
-        search_term = f"%{filters.search}%"
-        conditions.append(
-            or_(
-                Gig.title.ilike(search_term),
-                Gig.description.ilike(search_term)
+        if filters.search_mode == GigSearchMode.substring:
+            search_term = f"%{filters.search}%"
+            conditions.append(
+                or_(
+                    Gig.title.ilike(search_term),
+                    Gig.description.ilike(search_term)
+                )
             )
-        )
+        else:
+            # Full-text match served by the idx_gigs_full_text GIN index
+            ts_query = gig_search_query(filters.search)
+            conditions.append(gig_search_vector().op("@@")(ts_query))
+
+    return conditions, ts_query
 
-    # Apply conditions to queries
-    if conditions:
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+def gig_sort_column(filters: GigSearchFilters, ts_query=None):
+    """
+    Resolve the column or expression a gig search is ordered by.
 
-    # Apply sorting
+    Args:
+        filters: Search and filter parameters
+        ts_query: tsquery of the full-text search, if any
+
+    Returns:
+        Column or SQL expression to sort by
+    """
     sort_column = Gig.created_at  # Default
     if filters.sort_by == "price":
         sort_column = Gig.basic_price
@@ -252,22 +331,263 @@ async def list_gigs(
         sort_column = Gig.order_count
     elif filters.sort_by == "views":
         sort_column = Gig.view_count
+    elif filters.sort_by == "min_package_price":
+        sort_column = Gig.min_package_price
+    elif filters.sort_by == "max_package_price":
+        sort_column = Gig.max_package_price
     elif filters.sort_by == "created_at":
         sort_column = Gig.created_at
+    elif filters.sort_by == "relevance" and ts_query is not None:
+        # Rank only the rows already matched through the index
+        sort_column = func.ts_rank_cd(gig_search_vector(), ts_query, type_=Float)
 
-    if filters.sort_order == "asc":
-        query = query.order_by(asc(sort_column))
-    else:
-        query = query.order_by(desc(sort_column))
+    return sort_column
+
+
+async def list_gigs(
+    db: AsyncSession,
+    filters: GigSearchFilters
+) -> tuple[List[Gig], int, Optional[str]]:
+    """
+    List gigs with pagination, search, and filters.
+
+    Pages are addressed either by ``filters.skip`` or, when ``filters.cursor``
+    is set, by keyset pagination on (sort key, id), which costs the same on
+    every page.
+
+    Args:
+        db: Database session
+        filters: Search and filter parameters
+
+    Returns:
+        Tuple of (list of gigs, total count, cursor for the next page or None)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another sort
+    """
+    conditions, ts_query = build_gig_conditions(filters)
+    sort_column = gig_sort_column(filters, ts_query)
+
+    # Build base query with eager loading of creator profile; the sort key is
+    # selected alongside each gig so the next cursor can be built from it
+    query = select(Gig, sort_column.label("sort_value")).options(selectinload(Gig.creator))
+
+    # Apply conditions to query
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    # Resolve the total per the configured count strategy; exact counts ride
+    # along with the page as a window column
+    counter = ListingCounter(
+        settings.GIG_LIST_COUNT_STRATEGY,
+        Gig,
+        conditions,
+        count_cache_key("gigs", filters.model_dump()),
+    )
+    await counter.prepare(db)
+    query = counter.apply(query, keyset=bool(filters.cursor))
+
+    # Apply sorting (id breaks ties so keyset positions are unique)
+    query = query.order_by(*keyset_order_by(sort_column, Gig.id, filters.sort_order))
 
-    # Apply pagination
-    query = query.offset(filters.skip).limit(filters.limit)
+    # Apply pagination, fetching one extra row to detect a next page
+    if filters.cursor:
+        value, last_id = decode_cursor(
+            filters.cursor, filters.sort_by, filters.sort_order, sort_column
+        )
+        query = query.where(
+            keyset_condition(sort_column, Gig.id, filters.sort_order, value, last_id)
+        )
+    else:
+        query = query.offset(filters.skip)
+    query = query.limit(filters.limit + 1)
 
     # Execute query
     result = await db.execute(query)
-    gigs = result.scalars().all()
+    rows = result.all()
+    total = await counter.resolve(db, rows, filters.skip)
+    gigs, next_cursor = next_page_cursor(
+        rows, filters.limit, filters.sort_by, filters.sort_order
+    )
+
+    return gigs, total, next_cursor
+
+
+async def stream_gigs(
+    db: AsyncSession,
+    filters: GigSearchFilters,
+    batch_size: int = 1000
+) -> AsyncIterator[Sequence[Gig]]:
+    """
+    Stream every gig matching the search filters through a server-side cursor.
 
-    return list(gigs), total
+    Pagination fields of ``filters`` are ignored. Creators are joined in the
+    same query, as selectinload cannot batch across a streamed result.
+
+    Args:
+        db: Database session (its transaction stays open while streaming)
+        filters: Search and filter parameters
+        batch_size: Rows fetched from the cursor at a time
+
+    Yields:
+        Batches of at most batch_size gigs with their creator loaded
+    """
+    conditions, ts_query = build_gig_conditions(filters)
+    sort_column = gig_sort_column(filters, ts_query)
+
+    query = select(Gig).options(joinedload(Gig.creator))
+    if conditions:
+        query = query.where(and_(*conditions))
+    query = query.order_by(*keyset_order_by(sort_column, Gig.id, filters.sort_order))
+
+    result = await db.stream_scalars(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def get_gig_facets(
+    db: AsyncSession,
+    filters: GigSearchFilters
+) -> tuple[int, Dict[str, Dict[Any, int]]]:
+    """
+    Count gigs per category, subcategory, video type, price bucket and tag.
+
+    All facets are computed in one GROUPING SETS aggregation under the same
+    conditions as list_gigs.
+
+    Args:
+        db: Database session
+        filters: Search and filter parameters (pagination is ignored)
+
+    Returns:
+        Tuple of (total matching gigs, facet name -> {value: count}); price
+        buckets are keyed by their bucket index
+    """
+    conditions, _ = build_gig_conditions(filters)
+
+    return await count_facets(
+        db,
+        Gig,
+        Gig.id,
+        dimensions={
+            "category": Gig.category,
+            "subcategory": Gig.subcategory,
+            "video_type": Gig.video_type,
+            "price_range": bucket_expression(Gig.basic_price),
+        },
+        conditions=conditions,
+        array_dimensions={"tags": Gig.search_tags},
+    )
+
+
+async def get_active_gig_terms(db: AsyncSession) -> List[Any]:
+    """
+    Fetch the searchable text of every active gig for the autocomplete index.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Rows of (title, search_tags, category, subcategory, order_count)
+    """
+    query = select(
+        Gig.title,
+        Gig.search_tags,
+        Gig.category,
+        Gig.subcategory,
+        Gig.order_count,
+    ).where(Gig.status == "active")
+
+    result = await db.execute(query)
+    return list(result.all())
+
+
+async def get_active_gigs(db: AsyncSession) -> List[Gig]:
+    """
+    Get every active gig with its creator profile loaded.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of active gigs
+    """
+    result = await db.execute(
+        select(Gig).options(selectinload(Gig.creator)).where(Gig.status == "active")
+    )
+    return list(result.scalars().all())
+
+
+async def get_gigs_by_ids(db: AsyncSession, gig_ids: List[UUID]) -> List[Gig]:
+    """
+    Get gigs by ID with their creator profiles loaded, in any status.
+
+    Args:
+        db: Database session
+        gig_ids: Gig UUIDs
+
+    Returns:
+        List of the gigs that exist
+    """
+    if not gig_ids:
+        return []
+
+    result = await db.execute(
+        select(Gig).options(selectinload(Gig.creator)).where(Gig.id.in_(gig_ids))
+    )
+    return list(result.scalars().all())
+
+
+async def get_gig_lexemes(
+    db: AsyncSession,
+    gig_ids: Optional[List[UUID]] = None
+) -> Dict[UUID, List[str]]:
+    """
+    Get the lexemes PostgreSQL indexes for each gig's title and description.
+
+    Args:
+        db: Database session
+        gig_ids: Gigs to read; every active gig when None
+
+    Returns:
+        Dict of gig ID to its gig_search_vector() lexemes
+    """
+    query = select(Gig.id, func.tsvector_to_array(gig_search_vector()))
+    if gig_ids is None:
+        query = query.where(Gig.status == "active")
+    elif not gig_ids:
+        return {}
+    else:
+        query = query.where(Gig.id.in_(gig_ids))
+
+    result = await db.execute(query)
+    return {gig_id: list(lexemes) for gig_id, lexemes in result.all()}
+
+
+async def get_word_lexemes(db: AsyncSession, words: List[str]) -> Dict[str, List[str]]:
+    """
+    Get the lexemes the english configuration turns single words into.
+
+    A stopword maps to no lexemes. The words are sent as one array parameter.
+
+    Args:
+        db: Database session
+        words: Plain words
+
+    Returns:
+        Dict of word to its lexemes
+    """
+    if not words:
+        return {}
+
+    word = func.unnest(literal(words, ARRAY(String))).table_valued("word").render_derived()
+    result = await db.execute(
+        select(
+            word.c.word,
+            func.tsvector_to_array(func.to_tsvector(literal_column("'english'"), word.c.word)),
+        )
+    )
+    return {value: list(lexemes) for value, lexemes in result.all()}
 
 
 async def get_gigs_by_creator(
@@ -297,20 +617,26 @@ async def get_gigs_by_creator(
         conditions.append(Gig.status == status)
 
     query = select(Gig).where(and_(*conditions))
-    count_query = select(func.count()).select_from(Gig).where(and_(*conditions))
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    counter = ListingCounter(
+        settings.CREATOR_GIGS_COUNT_STRATEGY,
+        Gig,
+        conditions,
+        count_cache_key("creator_gigs", {"creator_profile_id": creator_profile_id, "status": status}),
+    )
+    await counter.prepare(db)
+    query = counter.apply(query)
 
     # Apply pagination and sorting
     query = query.order_by(desc(Gig.created_at)).offset(skip).limit(limit)
 
     # Execute query
     result = await db.execute(query)
-    gigs = result.scalars().all()
+    rows = result.all()
+    total = await counter.resolve(db, rows, skip)
+    gigs = [row[0] for row in rows]
 
-    return list(gigs), total
+    return gigs, total
 
 
 async def check_slug_exists(db: AsyncSession, slug: str, exclude_id: Optional[UUID] = None) -> bool:
@@ -325,10 +651,75 @@ async def check_slug_exists(db: AsyncSession, slug: str, exclude_id: Optional[UU
     Returns:
         True if slug exists, False otherwise
     """
-    query = select(Gig).where(Gig.slug == slug)
+    condition = Gig.slug == slug
 
     if exclude_id:
-        query = query.where(Gig.id != exclude_id)
+        condition = and_(condition, Gig.id != exclude_id)
+
+    result = await db.execute(select(exists().where(condition)))
+    return result.scalar()
+
+
+async def allocate_slugs(db: AsyncSession, base_slugs: Sequence[str]) -> List[str]:
+    """
+    Assign unique slugs for a batch of base slugs in one query.
+
+    A free base slug is used as is; otherwise, and for repeats within the
+    batch, a numeric suffix is appended after the highest existing one
+    (``base``, ``base-1``, ``base-2``, ...). Existing suffixes are found with a
+    byte-wise range scan on idx_gigs_slug_pattern.
+
+    Concurrent transactions may allocate the same slug; the unique constraint
+    on gigs.slug rejects the second INSERT and callers retry.
+
+    Args:
+        db: Database session
+        base_slugs: Base slugs, one per gig to create
+
+    Returns:
+        Unique slugs in the same order as base_slugs
+    """
+    if not base_slugs:
+        return []
+
+    bases = func.unnest(
+        literal(sorted(set(base_slugs)), ARRAY(String))
+    ).table_valued("base").render_derived(name="bases")
+    suffix = func.substr(Gig.slug, func.length(bases.c.base) + 2)
+
+    # "base-<digits>" sorts byte-wise between "base-" and "base." ('.' follows '-')
+    max_suffix = (
+        select(func.max(cast(suffix, Integer)))
+        .where(
+            Gig.slug.op("~>=~")(bases.c.base + "-"),
+            Gig.slug.op("~<~")(bases.c.base + "."),
+            suffix.op("~")("^[0-9]{1,9}$"),
+        )
+        .scalar_subquery()
+    )
+    query = select(
+        bases.c.base,
+        exists().where(Gig.slug == bases.c.base).label("taken"),
+        max_suffix.label("max_suffix"),
+    )
 
     result = await db.execute(query)
-    return result.scalar_one_or_none() is not None
+    # Base slug -> highest suffix taken (existing "base-N" rows count even
+    # while the bare base is free), and the bases whose bare slug is free
+    last_suffix: Dict[str, int] = {}
+    free_bases = set()
+    for row in result:
+        last_suffix[row.base] = row.max_suffix or 0
+        if not row.taken:
+            free_bases.add(row.base)
+
+    slugs = []
+    for base in base_slugs:
+        if base in free_bases:
+            slugs.append(base)
+            free_bases.discard(base)
+        else:
+            last_suffix[base] += 1
+            slugs.append(f"{base}-{last_suffix[base]}")
+
+    return slugs
@@ -0,0 +1,609 @@
+"""CRUD operations for creator–project matching.
+
+Scoring runs as set-based SQL over the sparse term vectors: the dot products
+of a batch of projects (or creators) against every vector sharing a term are
+one join and GROUP BY, fit multipliers are applied per pair, and a window
+keeps the top k per entity. Only pairs with at least one shared term are ever
+materialized, so a batch costs O(shared-term pairs) rather than O(projects x
+creators).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Float, String, any_, case, cast, delete, func, literal, or_, select, tuple_, union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Bundle, aliased
+
+from app.crud.project import select_projects_with_client
+from app.models.creator import CreatorCategory, CreatorProfile, CreatorSkill
+from app.models.match import CreatorMatchTerm, MatchRefreshQueue, ProjectMatch, ProjectMatchTerm
+from app.models.project import Project
+from app.models.user import User
+
+# Term weights before normalization
+SKILL_PROFICIENCY_WEIGHTS = {"expert": 1.0, "intermediate": 0.8, "beginner": 0.6}
+DEFAULT_SKILL_WEIGHT = 0.8
+PRIMARY_CATEGORY_WEIGHT = 1.0
+SECONDARY_CATEGORY_WEIGHT = 0.6
+
+# Years of experience a project's experience_level asks for
+EXPERIENCE_MIN_YEARS = {"intermediate": 2, "expert": 5}
+
+# Score multipliers for soft requirements
+UNKNOWN_EXPERIENCE_FIT = 0.8
+UNMET_EXPERIENCE_FIT = 0.5
+MIN_BUDGET_FIT = 0.25
+
+CREATOR_MATCH_COLUMNS = Bundle(
+    "creator",
+    CreatorProfile.id,
+    CreatorProfile.display_name,
+    CreatorProfile.tagline,
+    CreatorProfile.profile_image_url,
+    CreatorProfile.availability_status,
+    CreatorProfile.average_rating,
+    CreatorProfile.total_reviews,
+    CreatorProfile.total_jobs_completed,
+    CreatorProfile.is_verified,
+    CreatorProfile.created_at,
+)
+
+
+# ============================================================================
+# Term vectors
+# ============================================================================
+
+def _term(prefix: str, value):
+    return literal(prefix, String) + func.lower(func.trim(value))
+
+
+def _normalized(raw_terms):
+    """
+    Collapse duplicate terms (keeping the highest weight) and L2-normalize
+    each entity's vector.
+
+    Args:
+        raw_terms: Selectable of (entity_id, term, weight)
+
+    Returns:
+        Select of (entity_id, term, weight)
+    """
+    raw = raw_terms.subquery("raw")
+    terms = (
+        select(raw.c.entity_id, raw.c.term, func.max(raw.c.weight, type_=Float).label("weight"))
+        .where(raw.c.term.is_not(None))
+        .group_by(raw.c.entity_id, raw.c.term)
+        .subquery("terms")
+    )
+    norm = func.sqrt(
+        func.sum(terms.c.weight * terms.c.weight).over(partition_by=terms.c.entity_id),
+        type_=Float,
+    )
+    return select(terms.c.entity_id, terms.c.term, terms.c.weight / norm)
+
+
+def eligible_projects():
+    """Condition on Project for projects that get a match vector."""
+    return Project.status == "open"
+
+
+def creator_eligibility() -> tuple:
+    """Conditions on CreatorProfile joined to User for creators that get a match vector."""
+    return (
+        User.status == "active",
+        User.deleted_at.is_(None),
+        CreatorProfile.availability_status != "unavailable",
+    )
+
+
+def eligible_creators():
+    """Select of creator profile ids that get a match vector."""
+    return (
+        select(CreatorProfile.id)
+        .join(User, User.id == CreatorProfile.user_id)
+        .where(*creator_eligibility())
+    )
+
+
+async def rebuild_project_vectors(
+    db: AsyncSession,
+    project_ids: Optional[Sequence[UUID]] = None
+) -> None:
+    """
+    Recompute the term vectors of projects.
+
+    Projects that are no longer open lose their vector.
+
+    Args:
+        db: Database session
+        project_ids: Projects to rebuild; all projects when None
+    """
+    conditions = [eligible_projects()]
+    stale = delete(ProjectMatchTerm)
+    if project_ids is not None:
+        conditions.append(Project.id.in_(project_ids))
+        stale = stale.where(ProjectMatchTerm.project_id.in_(project_ids))
+    await db.execute(stale)
+
+    skills = (
+        select(Project.id.label("entity_id"), func.unnest(Project.required_skills).label("name"))
+        .where(*conditions)
+        .subquery("skills")
+    )
+    raw = union_all(
+        select(
+            skills.c.entity_id,
+            _term("skill:", func.nullif(func.trim(skills.c.name), "")).label("term"),
+            literal(1.0, Float).label("weight"),
+        ),
+        select(Project.id, _term("category:", Project.category), literal(1.0, Float)).where(*conditions),
+    )
+
+    await db.execute(
+        insert(ProjectMatchTerm).from_select(["project_id", "term", "weight"], _normalized(raw))
+    )
+
+
+async def rebuild_creator_vectors(
+    db: AsyncSession,
+    creator_ids: Optional[Sequence[UUID]] = None
+) -> None:
+    """
+    Recompute the term vectors of creators from their skills and categories.
+
+    Creators that are inactive or unavailable lose their vector.
+
+    Args:
+        db: Database session
+        creator_ids: Creator profiles to rebuild; all creators when None
+    """
+    eligible = eligible_creators()
+    stale = delete(CreatorMatchTerm)
+    if creator_ids is not None:
+        eligible = eligible.where(CreatorProfile.id.in_(creator_ids))
+        stale = stale.where(CreatorMatchTerm.creator_profile_id.in_(creator_ids))
+    await db.execute(stale)
+
+    skill_weight = case(
+        *[(CreatorSkill.proficiency_level == level, weight)
+          for level, weight in SKILL_PROFICIENCY_WEIGHTS.items()],
+        else_=DEFAULT_SKILL_WEIGHT,
+    )
+    category_weight = case(
+        (CreatorCategory.is_primary, PRIMARY_CATEGORY_WEIGHT),
+        else_=SECONDARY_CATEGORY_WEIGHT,
+    )
+    raw = union_all(
+        select(
+            CreatorSkill.creator_profile_id.label("entity_id"),
+            _term("skill:", func.nullif(func.trim(CreatorSkill.skill_name), "")).label("term"),
+            cast(skill_weight, Float).label("weight"),
+        ).where(CreatorSkill.creator_profile_id.in_(eligible)),
+        select(
+            CreatorCategory.creator_profile_id,
+            _term("category:", CreatorCategory.category),
+            cast(category_weight, Float),
+        ).where(CreatorCategory.creator_profile_id.in_(eligible)),
+    )
+
+    await db.execute(
+        insert(CreatorMatchTerm).from_select(
+            ["creator_profile_id", "term", "weight"], _normalized(raw)
+        )
+    )
+
+
+# ============================================================================
+# Scoring
+# ============================================================================
+
+def pair_scores(
+    project_ids: Optional[Sequence[UUID]] = None,
+    creator_ids: Optional[Sequence[UUID]] = None
+):
+    """
+    Build the scores of all project/creator pairs sharing at least one term.
+
+    score = cosine similarity of the term vectors x budget fit x experience fit
+
+    Budget fit is 1 when the creator's hourly rate fits within the project's
+    upper budget (or either is unknown), otherwise their ratio, floored at
+    MIN_BUDGET_FIT. Experience fit is 1 when the creator's years of
+    experience meet the project's experience level, UNKNOWN_EXPERIENCE_FIT
+    when unknown and UNMET_EXPERIENCE_FIT otherwise.
+
+    Args:
+        project_ids: Only score these projects
+        creator_ids: Only score these creators
+
+    Returns:
+        Select of (project_id, creator_profile_id, score)
+    """
+    conditions = []
+    if project_ids is not None:
+        conditions.append(ProjectMatchTerm.project_id.in_(project_ids))
+    if creator_ids is not None:
+        conditions.append(CreatorMatchTerm.creator_profile_id.in_(creator_ids))
+
+    similarities = (
+        select(
+            ProjectMatchTerm.project_id,
+            CreatorMatchTerm.creator_profile_id,
+            func.sum(ProjectMatchTerm.weight * CreatorMatchTerm.weight).label("similarity"),
+        )
+        .join(CreatorMatchTerm, CreatorMatchTerm.term == ProjectMatchTerm.term)
+        .where(*conditions)
+        .group_by(ProjectMatchTerm.project_id, CreatorMatchTerm.creator_profile_id)
+        .subquery("similarities")
+    )
+
+    budget = cast(func.coalesce(Project.budget_max, Project.budget_min), Float)
+    rate = cast(CreatorProfile.hourly_rate, Float)
+    budget_fit = case(
+        (or_(budget.is_(None), rate.is_(None), rate <= budget), 1.0),
+        else_=func.greatest(budget / rate, MIN_BUDGET_FIT),
+    )
+
+    min_years = case(
+        *[(Project.experience_level == level, years) for level, years in EXPERIENCE_MIN_YEARS.items()],
+        else_=None,
+    )
+    experience_fit = case(
+        (min_years.is_(None), 1.0),
+        (CreatorProfile.years_of_experience.is_(None), UNKNOWN_EXPERIENCE_FIT),
+        (CreatorProfile.years_of_experience >= min_years, 1.0),
+        else_=UNMET_EXPERIENCE_FIT,
+    )
+
+    return (
+        select(
+            similarities.c.project_id,
+            similarities.c.creator_profile_id,
+            (similarities.c.similarity * budget_fit * experience_fit).label("score"),
+        )
+        .join(Project, Project.id == similarities.c.project_id)
+        .join(CreatorProfile, CreatorProfile.id == similarities.c.creator_profile_id)
+    )
+
+
+def _top_k(scores, partition_by: str, k: int):
+    """Keep the k best scored pairs per project_id or creator_profile_id."""
+    scored = scores.subquery("scored")
+    other = "creator_profile_id" if partition_by == "project_id" else "project_id"
+    ranked = select(
+        scored,
+        func.row_number().over(
+            partition_by=scored.c[partition_by],
+            order_by=(scored.c.score.desc(), scored.c[other]),
+        ).label("rank"),
+    ).subquery("ranked")
+    return (
+        select(ranked.c.project_id, ranked.c.creator_profile_id, ranked.c.score)
+        .where(ranked.c.rank <= k)
+    )
+
+
+def _upsert(pairs):
+    statement = insert(ProjectMatch).from_select(
+        ["project_id", "creator_profile_id", "score"], pairs
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[ProjectMatch.project_id, ProjectMatch.creator_profile_id],
+        set_={"score": statement.excluded.score, "computed_at": func.now()},
+    )
+
+
+async def _store(db: AsyncSession, pairs) -> int:
+    result = await db.execute(_upsert(pairs))
+    return result.rowcount
+
+
+async def _trim_lists(db: AsyncSession, side: str, side_ids: Sequence[UUID], k: int) -> None:
+    """
+    Delete rows that fell out of the top k of the given lists.
+
+    A row is shared by a project's list and a creator's list, so it is only
+    deleted when it ranks below k on both sides.
+    """
+    if not side_ids:
+        return
+
+    other = "creator_profile_id" if side == "project_id" else "project_id"
+    side_column = getattr(ProjectMatch, side)
+    other_column = getattr(ProjectMatch, other)
+    in_lists = side_column == any_(literal(list(side_ids), ARRAY(PGUUID(as_uuid=True))))
+
+    # Every row of the trimmed lists and of their counterparts' lists, so
+    # both rankings see complete partitions
+    ranked = (
+        select(
+            ProjectMatch.project_id,
+            ProjectMatch.creator_profile_id,
+            side_column.label("side_id"),
+            func.row_number().over(
+                partition_by=side_column, order_by=(ProjectMatch.score.desc(), other_column)
+            ).label("side_rank"),
+            func.row_number().over(
+                partition_by=other_column, order_by=(ProjectMatch.score.desc(), side_column)
+            ).label("other_rank"),
+        )
+        .where(other_column.in_(select(other_column).where(in_lists)))
+        .subquery("ranked")
+    )
+    stale = select(ranked.c.project_id, ranked.c.creator_profile_id).where(
+        ranked.c.side_id == any_(literal(list(side_ids), ARRAY(PGUUID(as_uuid=True)))),
+        ranked.c.side_rank > k,
+        ranked.c.other_rank > k,
+    )
+    await db.execute(
+        delete(ProjectMatch).where(
+            tuple_(ProjectMatch.project_id, ProjectMatch.creator_profile_id).in_(stale)
+        )
+    )
+
+
+async def store_project_top_matches(db: AsyncSession, project_ids: Sequence[UUID], k: int) -> int:
+    """
+    Score projects against all creators and store each project's top k.
+
+    Args:
+        db: Database session
+        project_ids: Projects to score
+        k: Creators kept per project
+
+    Returns:
+        Number of rows written
+    """
+    return await _store(db, _top_k(pair_scores(project_ids=project_ids), "project_id", k))
+
+
+async def store_creator_top_matches(db: AsyncSession, creator_ids: Sequence[UUID], k: int) -> int:
+    """
+    Score creators against all open projects and store each creator's top k.
+
+    Args:
+        db: Database session
+        creator_ids: Creator profiles to score
+        k: Projects kept per creator
+
+    Returns:
+        Number of rows written
+    """
+    return await _store(db, _top_k(pair_scores(creator_ids=creator_ids), "creator_profile_id", k))
+
+
+async def merge_into_other_side(
+    db: AsyncSession,
+    k: int,
+    project_ids: Optional[Sequence[UUID]] = None,
+    creator_ids: Optional[Sequence[UUID]] = None
+) -> int:
+    """
+    Add changed entities to the stored top-k lists of their counterparts.
+
+    After projects change, a creator's list gains a changed project when it
+    scores above that creator's current k-th match (or the list is short);
+    symmetrically for changed creators and project lists. Matches pushed out
+    of a list's top k by the merge are then deleted (unless they are in the
+    top k of their other side), in the same transaction.
+
+    Args:
+        db: Database session
+        k: List length
+        project_ids: Changed projects (merged into creator lists)
+        creator_ids: Changed creators (merged into project lists)
+
+    Returns:
+        Number of rows written
+    """
+    if project_ids is not None:
+        scores = pair_scores(project_ids=project_ids).cte("candidates")
+        side = "creator_profile_id"
+    else:
+        scores = pair_scores(creator_ids=creator_ids).cte("candidates")
+        side = "project_id"
+
+    existing_match = aliased(ProjectMatch)
+    side_column = getattr(existing_match, side)
+    existing = (
+        select(
+            side_column.label("side_id"),
+            existing_match.score,
+            func.row_number().over(
+                partition_by=side_column, order_by=existing_match.score.desc()
+            ).label("rank"),
+        )
+        .where(side_column.in_(select(scores.c[side])))
+        .subquery("existing")
+    )
+    kth = (
+        select(existing.c.side_id, existing.c.score.label("floor"))
+        .where(existing.c.rank == k)
+        .subquery("kth")
+    )
+
+    pairs = (
+        select(scores.c.project_id, scores.c.creator_profile_id, scores.c.score)
+        .outerjoin(kth, kth.c.side_id == scores.c[side])
+        .where(or_(kth.c.floor.is_(None), scores.c.score > kth.c.floor))
+    )
+    result = await db.execute(_upsert(pairs).returning(getattr(ProjectMatch, side)))
+    side_ids = [row[0] for row in result]
+    await _trim_lists(db, side, list(set(side_ids)), k)
+    return len(side_ids)
+
+
+async def delete_matches(
+    db: AsyncSession,
+    project_ids: Optional[Sequence[UUID]] = None,
+    creator_ids: Optional[Sequence[UUID]] = None
+) -> None:
+    """
+    Delete stored matches of projects and/or creators.
+
+    Args:
+        db: Database session
+        project_ids: Projects whose matches are deleted
+        creator_ids: Creators whose matches are deleted
+    """
+    conditions = []
+    if project_ids:
+        conditions.append(ProjectMatch.project_id.in_(project_ids))
+    if creator_ids:
+        conditions.append(ProjectMatch.creator_profile_id.in_(creator_ids))
+    if conditions:
+        await db.execute(delete(ProjectMatch).where(or_(*conditions)))
+
+
+async def delete_all_matches(db: AsyncSession) -> None:
+    """Delete every stored match."""
+    await db.execute(delete(ProjectMatch))
+
+
+async def has_matches(db: AsyncSession) -> bool:
+    """Check whether any match has been computed."""
+    return await db.scalar(select(select(ProjectMatch.project_id).limit(1).exists()))
+
+
+async def get_vector_ids_page(
+    db: AsyncSession,
+    entity: str,
+    after: Optional[UUID],
+    limit: int
+) -> List[UUID]:
+    """
+    Page through the ids of projects or creators that have a match vector.
+
+    Args:
+        db: Database session
+        entity: "project" or "creator"
+        after: Last id of the previous page
+        limit: Page size
+
+    Returns:
+        Ids in ascending order
+    """
+    id_column = ProjectMatchTerm.project_id if entity == "project" else CreatorMatchTerm.creator_profile_id
+    query = select(id_column).distinct().order_by(id_column).limit(limit)
+    if after is not None:
+        query = query.where(id_column > after)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+# ============================================================================
+# Refresh queue
+# ============================================================================
+
+async def claim_refresh_queue(db: AsyncSession, limit: int) -> Tuple[List[UUID], List[UUID]]:
+    """
+    Remove up to limit queued entities, skipping rows other workers hold.
+
+    The rows are only gone once the transaction commits, so a failed refresh
+    leaves them queued.
+
+    Args:
+        db: Database session
+        limit: Maximum entities to claim
+
+    Returns:
+        Tuple of (project ids, creator profile ids)
+    """
+    claimed = (
+        select(MatchRefreshQueue.entity_type, MatchRefreshQueue.entity_id)
+        .order_by(MatchRefreshQueue.queued_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .subquery()
+    )
+    result = await db.execute(
+        delete(MatchRefreshQueue)
+        .where(
+            MatchRefreshQueue.entity_type == claimed.c.entity_type,
+            MatchRefreshQueue.entity_id == claimed.c.entity_id,
+        )
+        .returning(MatchRefreshQueue.entity_type, MatchRefreshQueue.entity_id)
+    )
+
+    project_ids, creator_ids = [], []
+    for entity_type, entity_id in result.all():
+        (project_ids if entity_type == "project" else creator_ids).append(entity_id)
+    return project_ids, creator_ids
+
+
+async def clear_refresh_queue(db: AsyncSession, before) -> None:
+    """
+    Drop queue entries made obsolete by a full recompute.
+
+    Args:
+        db: Database session
+        before: Recompute start time; later entries are kept
+    """
+    await db.execute(delete(MatchRefreshQueue).where(MatchRefreshQueue.queued_at <= before))
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+async def get_recommended_projects(
+    db: AsyncSession,
+    creator_profile_id: UUID,
+    limit: int
+) -> List[Row]:
+    """
+    Get a creator's best matching open projects.
+
+    Args:
+        db: Database session
+        creator_profile_id: Creator profile UUID
+        limit: Maximum number of projects
+
+    Returns:
+        Rows of (project row, match_score), best first
+    """
+    query = (
+        select_projects_with_client(ProjectMatch.score.label("match_score"))
+        .join(ProjectMatch, ProjectMatch.project_id == Project.id)
+        .where(
+            ProjectMatch.creator_profile_id == creator_profile_id,
+            eligible_projects(),
+        )
+        .order_by(ProjectMatch.score.desc(), Project.id)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return list(result.all())
+
+
+async def get_matched_creators(
+    db: AsyncSession,
+    project_id: UUID,
+    limit: int
+) -> List[Row]:
+    """
+    Get a project's best matching creators.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        limit: Maximum number of creators
+
+    Returns:
+        Rows of (creator row, match_score), best first
+    """
+    query = (
+        select(CREATOR_MATCH_COLUMNS, ProjectMatch.score.label("match_score"))
+        .join(ProjectMatch, ProjectMatch.creator_profile_id == CreatorProfile.id)
+        .join(User, User.id == CreatorProfile.user_id)
+        .where(ProjectMatch.project_id == project_id, *creator_eligibility())
+        .order_by(ProjectMatch.score.desc(), CreatorProfile.id)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return list(result.all())
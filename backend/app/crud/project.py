@@ -1,99 +1,169 @@
 """CRUD operations for projects."""
 
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
+from decimal import Decimal
 
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, update, func, literal, or_, and_, desc, asc, literal_column, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, Range, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Bundle, selectinload
 
+from app.core.config import settings
 from app.models.project import Project
 from app.models.client import ClientProfile
+from app.schemas.project import ProjectBudgetMode
+from app.utils.pagination import (
+    decode_cursor,
+    keyset_condition,
+    keyset_order_by,
+    next_page_cursor,
+)
+from app.utils.counting import ListingCounter, count_cache_key
+from app.utils.facets import bucket_expression, count_facets
+from app.utils.geo import distance_km, within_radius
+
+
+# Columns of a ProjectWithClient response. Listings select these, joined to
+# the client, instead of full ORM objects (skipping the attachments JSONB and
+# identity-map bookkeeping); the resulting rows validate directly into the
+# response schemas (row.client is the nested ClientSummary)
+CLIENT_SUMMARY_COLUMNS = Bundle(
+    "client",
+    ClientProfile.id,
+    ClientProfile.user_id,
+    ClientProfile.company_name,
+    ClientProfile.company_logo_url,
+    ClientProfile.industry,
+    ClientProfile.website_url,
+    ClientProfile.is_verified,
+    ClientProfile.total_jobs_posted,
+    ClientProfile.average_rating,
+    ClientProfile.total_reviews,
+    ClientProfile.description,
+)
+PROJECT_WITH_CLIENT_COLUMNS = Bundle(
+    "project",
+    Project.id,
+    Project.client_profile_id,
+    Project.title,
+    Project.description,
+    Project.category,
+    Project.video_type,
+    Project.video_duration_preference,
+    Project.platform_preference,
+    Project.budget_type,
+    Project.budget_min,
+    Project.budget_max,
+    Project.deadline_date,
+    Project.estimated_duration_days,
+    Project.required_skills,
+    Project.experience_level,
+    Project.view_count,
+    Project.proposal_count,
+    Project.status,
+    Project.created_at,
+    Project.updated_at,
+    Project.published_at,
+    Project.closed_at,
+    CLIENT_SUMMARY_COLUMNS,
+)
+
+
+def project_search_vector():
+    """
+    Build the tsvector expression for project full-text search.
 
+    Must match the idx_projects_full_text index definition exactly.
 
-async def get_project_by_id(
-    db: AsyncSession,
-    project_id: UUID,
-    include_client: bool = True
-) -> Optional[Project]:
+    Returns:
+        SQL expression producing the project document vector
     """
-    Get a project by its ID.
+    return func.to_tsvector(
+        literal_column("'english'"),
+        Project.title + literal_column("' '") + Project.description
+    )
 
-    Args:
-        db: Database session
-        project_id: Project UUID
-        include_client: Whether to include client relationship
 
-    Returns:
-        Project instance or None if not found
+def select_projects_with_client(*columns):
     """
-    query = select(Project).where(Project.id == project_id)
+    Build a SELECT of ProjectWithClient rows joined to their client.
 
-    if include_client:
-        query = query.options(selectinload(Project.client))
+    Args:
+        *columns: Extra columns to select after the project bundle
 
-    result = await db.execute(query)
-    return result.scalar_one_or_none()
+    Returns:
+        Select yielding (project row, *columns)
+    """
+    return (
+        select(PROJECT_WITH_CLIENT_COLUMNS, *columns)
+        .join(ClientProfile, Project.client_profile_id == ClientProfile.id)
+    )
 
 
-async def increment_view_count(db: AsyncSession, project: Project) -> Project:
+def project_sort_column(sort_by: str, near: Optional[Tuple[float, float]] = None):
     """
-    Increment the view count for a project.
+    Resolve the column a project listing is ordered by.
 
     Args:
-        db: Database session
-        project: Project instance
+        sort_by: Sort field name
+        near: (latitude, longitude) that "distance" sorting measures from
 
     Returns:
-        Updated Project instance
+        Column to sort by
     """
-    project.view_count += 1
-    await db.flush()
-    await db.refresh(project)
-    return project
+    sort_column = Project.created_at  # Default
+    if sort_by == "distance" and near is not None:
+        # Requires the client join of select_projects_with_client()
+        sort_column = distance_km(ClientProfile.latitude, ClientProfile.longitude, near)
+    elif sort_by == "budget":
+        sort_column = Project.budget_min
+    elif sort_by == "deadline":
+        sort_column = Project.deadline_date
+    elif sort_by == "proposals":
+        sort_column = Project.proposal_count
+    elif sort_by == "views":
+        sort_column = Project.view_count
+    elif sort_by == "created_at":
+        sort_column = Project.created_at
 
+    return sort_column
 
-async def list_projects(
-    db: AsyncSession,
+
+def build_project_conditions(
     status: Optional[str] = None,
     category: Optional[str] = None,
     video_type: Optional[str] = None,
     experience_level: Optional[str] = None,
     min_budget: Optional[float] = None,
     max_budget: Optional[float] = None,
+    budget_mode: ProjectBudgetMode = ProjectBudgetMode.overlap,
+    near: Optional[Tuple[float, float]] = None,
+    radius_km: Optional[float] = None,
     search: Optional[str] = None,
-    client_profile_id: Optional[UUID] = None,
-    sort_by: str = "created_at",
-    sort_order: str = "desc",
-    skip: int = 0,
-    limit: int = 20
-) -> Tuple[List[Project], int]:
+    client_profile_id: Optional[UUID] = None
+) -> list:
     """
-    List projects with pagination, search, and filters.
+    Build the WHERE conditions shared by project listings and facets.
 
     Args:
-        db: Database session
         status: Filter by project status
         category: Filter by category
         video_type: Filter by video type
         experience_level: Filter by experience level
         min_budget: Minimum budget filter
         max_budget: Maximum budget filter
+        budget_mode: How the budget filters match the project's budget range
+        near: (latitude, longitude) to search around; requires radius_km
+        radius_km: Maximum distance of the project's client from near
         search: Search term for title and description
         client_profile_id: Filter by specific client
-        sort_by: Field to sort by
-        sort_order: Sort order (asc or desc)
-        skip: Number of records to skip
-        limit: Maximum number of records to return
 
     Returns:
-        Tuple of (list of projects, total count)
+        List of SQL conditions
     """
-    # Build base query with client relationship loaded
-    query = select(Project).options(selectinload(Project.client))
-    count_query = select(func.count()).select_from(Project)
-
     # Build WHERE conditions
     conditions = []
 
@@ -117,28 +187,25 @@ async def list_projects(
     if client_profile_id:
         conditions.append(Project.client_profile_id == client_profile_id)
 
-    # Budget range filter
-    if min_budget is not None:
-        # Check both budget_min and budget_max for range budgets
-        conditions.append(
-            or_(
-                Project.budget_min >= min_budget,
-                and_(
-                    Project.budget_max.isnot(None),
-                    Project.budget_max >= min_budget
-                )
-            )
+    # Budget range filter: one range operator on budget_range (GiST-indexed)
+    if min_budget is not None or max_budget is not None:
+        budget_filter = Range(
+            Decimal(str(min_budget)) if min_budget is not None else None,
+            Decimal(str(max_budget)) if max_budget is not None else None,
+            bounds="[]",
         )
+        if budget_mode == ProjectBudgetMode.within:
+            conditions.append(Project.budget_range.contained_by(budget_filter))
+        else:
+            conditions.append(Project.budget_range.overlaps(budget_filter))
 
-    if max_budget is not None:
-        # For max budget filter, check that minimum budget is within range
+    # Distance filter: a semi-join on clients served by idx_client_profiles_location
+    if near is not None and radius_km is not None:
         conditions.append(
-            or_(
-                Project.budget_min <= max_budget,
-                and_(
-                    Project.budget_max.isnot(None),
-                    Project.budget_max <= max_budget
-                )
+            Project.client_profile_id.in_(
+                select(ClientProfile.id)
+                .where(within_radius(ClientProfile.latitude, ClientProfile.longitude, near, radius_km))
+                .correlate(None)
             )
         )
 
@@ -152,41 +219,340 @@ async def list_projects(
             )
         )
 
-    # Apply conditions to queries
-    if conditions:
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
+    return conditions
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
 
-    # Apply sorting
-    sort_column = Project.created_at  # Default
-    if sort_by == "budget":
-        sort_column = Project.budget_min
-    elif sort_by == "deadline":
-        sort_column = Project.deadline_date
-    elif sort_by == "proposals":
-        sort_column = Project.proposal_count
-    elif sort_by == "views":
-        sort_column = Project.view_count
-    elif sort_by == "created_at":
-        sort_column = Project.created_at
+async def get_project_by_id(
+    db: AsyncSession,
+    project_id: UUID,
+    include_client: bool = True
+) -> Optional[Project]:
+    """
+    Get a project by its ID.
 
-    if sort_order == "asc":
-        query = query.order_by(asc(sort_column))
-    else:
-        query = query.order_by(desc(sort_column))
+    Args:
+        db: Database session
+        project_id: Project UUID
+        include_client: Whether to include client relationship
+
+    Returns:
+        Project instance or None if not found
+    """
+    query = select(Project).where(Project.id == project_id)
+
+    if include_client:
+        query = query.options(selectinload(Project.client))
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_project_with_client(db: AsyncSession, project_id: UUID) -> Optional[Row]:
+    """
+    Get the response columns of a project and its client.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+
+    Returns:
+        Row of PROJECT_WITH_CLIENT_COLUMNS or None if not found
+    """
+    result = await db.execute(
+        select_projects_with_client().where(Project.id == project_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def add_view_counts(db: AsyncSession, counts: Dict[UUID, int]) -> int:
+    """
+    Add buffered view increments to many projects in one statement.
+
+    Issues a single ``UPDATE ... FROM unnest(ids, views)`` with the batch
+    bound as two array parameters, so its size is not limited by the
+    driver's bind parameter limit. Rows are listed in id order so concurrent
+    flushes take row locks in the same order.
+
+    Args:
+        db: Database session
+        counts: Project ID -> number of views to add
+
+    Returns:
+        Number of rows updated
+    """
+    if not counts:
+        return 0
+
+    ids, views = zip(*sorted(counts.items()))
+    increments = func.unnest(
+        literal(list(ids), ARRAY(PGUUID(as_uuid=True))),
+        literal(list(views), ARRAY(Integer)),
+    ).table_valued("id", "views").render_derived(name="increments")
+
+    table = Project.__table__
+    result = await db.execute(
+        update(table)
+        .where(table.c.id == increments.c.id)
+        .values(view_count=func.coalesce(table.c.view_count, 0) + increments.c.views)
+    )
+    return result.rowcount
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+
+async def list_projects(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    video_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    budget_mode: ProjectBudgetMode = ProjectBudgetMode.overlap,
+    near: Optional[Tuple[float, float]] = None,
+    radius_km: Optional[float] = None,
+    search: Optional[str] = None,
+    client_profile_id: Optional[UUID] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> Tuple[List[Row], int, Optional[str]]:
+    """
+    List projects with pagination, search, and filters.
+
+    Pages are addressed either by ``skip`` or, when ``cursor`` is set, by
+    keyset pagination on (sort key, id), which costs the same on every page.
+
+    Args:
+        db: Database session
+        status: Filter by project status
+        category: Filter by category
+        video_type: Filter by video type
+        experience_level: Filter by experience level
+        min_budget: Minimum budget filter
+        max_budget: Maximum budget filter
+        budget_mode: How the budget filters match the project's budget range
+        near: (latitude, longitude) to search around; requires radius_km
+        radius_km: Maximum distance of the project's client from near
+        search: Search term for title and description
+        client_profile_id: Filter by specific client
+        sort_by: Field to sort by
+        sort_order: Sort order (asc or desc)
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        cursor: Keyset cursor from a previous page (overrides skip)
+
+    Returns:
+        Tuple of (project rows, total count, cursor for the next page or None);
+        rows carry the PROJECT_WITH_CLIENT_COLUMNS fields
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another sort
+    """
+    sort_column = project_sort_column(sort_by, near)
+
+    # Select the response columns joined to the client; the sort key is
+    # selected alongside each project so the next cursor can be built from it
+    query = select_projects_with_client(sort_column.label("sort_value"))
+
+    conditions = build_project_conditions(
+        status=status,
+        category=category,
+        video_type=video_type,
+        experience_level=experience_level,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
+        search=search,
+        client_profile_id=client_profile_id,
+    )
+
+    # Apply conditions to query
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    # Resolve the total per the configured count strategy; exact counts ride
+    # along with the page as a window column
+    counter = ListingCounter(
+        settings.PROJECT_LIST_COUNT_STRATEGY,
+        Project,
+        conditions,
+        count_cache_key("projects", {
+            "status": status,
+            "category": category,
+            "video_type": video_type,
+            "experience_level": experience_level,
+            "min_budget": min_budget,
+            "max_budget": max_budget,
+            "budget_mode": budget_mode,
+            "near": "{},{}".format(*near) if near else None,
+            "radius_km": radius_km,
+            "search": search,
+            "client_profile_id": client_profile_id,
+        }),
+    )
+    await counter.prepare(db)
+    query = counter.apply(query, keyset=bool(cursor))
+
+    # Apply sorting (id breaks ties so keyset positions are unique)
+    query = query.order_by(*keyset_order_by(sort_column, Project.id, sort_order))
+
+    # Apply pagination, fetching one extra row to detect a next page
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order, sort_column)
+        query = query.where(
+            keyset_condition(sort_column, Project.id, sort_order, value, last_id)
+        )
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit + 1)
 
     # Execute query
     result = await db.execute(query)
-    projects = result.scalars().all()
+    rows = result.all()
+    total = await counter.resolve(db, rows, skip)
+    projects, next_cursor = next_page_cursor(rows, limit, sort_by, sort_order)
 
-    return list(projects), total
+    return projects, total, next_cursor
+
+
+async def stream_projects(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    video_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    budget_mode: ProjectBudgetMode = ProjectBudgetMode.overlap,
+    near: Optional[Tuple[float, float]] = None,
+    radius_km: Optional[float] = None,
+    search: Optional[str] = None,
+    client_profile_id: Optional[UUID] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    batch_size: int = 1000
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Stream every project matching the listing filters through a server-side
+    cursor.
+
+    Args:
+        db: Database session (its transaction stays open while streaming)
+        status: Filter by project status
+        category: Filter by category
+        video_type: Filter by video type
+        experience_level: Filter by experience level
+        min_budget: Minimum budget filter
+        max_budget: Maximum budget filter
+        budget_mode: How the budget filters match the project's budget range
+        near: (latitude, longitude) to search around; requires radius_km
+        radius_km: Maximum distance of the project's client from near
+        search: Search term for title and description
+        client_profile_id: Filter by specific client
+        sort_by: Field to sort by
+        sort_order: Sort order (asc or desc)
+        batch_size: Rows fetched from the cursor at a time
+
+    Yields:
+        Batches of at most batch_size rows carrying the
+        PROJECT_WITH_CLIENT_COLUMNS fields
+    """
+    sort_column = project_sort_column(sort_by, near)
+
+    query = select_projects_with_client()
+
+    conditions = build_project_conditions(
+        status=status,
+        category=category,
+        video_type=video_type,
+        experience_level=experience_level,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
+        search=search,
+        client_profile_id=client_profile_id,
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    query = query.order_by(*keyset_order_by(sort_column, Project.id, sort_order))
+
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def get_project_facets(
+    db: AsyncSession,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    video_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    budget_mode: ProjectBudgetMode = ProjectBudgetMode.overlap,
+    near: Optional[Tuple[float, float]] = None,
+    radius_km: Optional[float] = None,
+    search: Optional[str] = None,
+    client_profile_id: Optional[UUID] = None
+) -> Tuple[int, Dict[str, Dict[Any, int]]]:
+    """
+    Count projects per category, video type, experience level, budget bucket
+    and required skill.
+
+    All facets are computed in one GROUPING SETS aggregation under the same
+    conditions as list_projects.
+
+    Args:
+        db: Database session
+        status: Filter by project status
+        category: Filter by category
+        video_type: Filter by video type
+        experience_level: Filter by experience level
+        min_budget: Minimum budget filter
+        max_budget: Maximum budget filter
+        budget_mode: How the budget filters match the project's budget range
+        near: (latitude, longitude) to search around; requires radius_km
+        radius_km: Maximum distance of the project's client from near
+        search: Search term for title and description
+        client_profile_id: Filter by specific client
+
+    Returns:
+        Tuple of (total matching projects, facet name -> {value: count});
+        budget buckets are keyed by their bucket index
+    """
+    conditions = build_project_conditions(
+        status=status,
+        category=category,
+        video_type=video_type,
+        experience_level=experience_level,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        budget_mode=budget_mode,
+        near=near,
+        radius_km=radius_km,
+        search=search,
+        client_profile_id=client_profile_id,
+    )
+
+    return await count_facets(
+        db,
+        Project,
+        Project.id,
+        dimensions={
+            "category": Project.category,
+            "video_type": Project.video_type,
+            "experience_level": Project.experience_level,
+            "budget_range": bucket_expression(Project.budget_min),
+        },
+        conditions=conditions,
+        array_dimensions={"skills": Project.required_skills},
+    )
 
 
 async def get_projects_by_client(
@@ -195,10 +561,14 @@ async def get_projects_by_client(
     skip: int = 0,
     limit: int = 20,
     status: Optional[str] = None
-) -> Tuple[List[Project], int]:
+) -> Tuple[List[Row], int, bool]:
     """
     Get all projects for a specific client.
 
+    The page, its client columns and (with the exact count strategy) the
+    total are fetched in a single query. One extra row is fetched to tell
+    whether another page follows, independently of how the total is counted.
+
     Args:
         db: Database session
         client_profile_id: Client profile UUID
@@ -207,7 +577,8 @@ async def get_projects_by_client(
         status: Optional status filter
 
     Returns:
-        Tuple of (list of projects, total count)
+        Tuple of (project rows with client columns, total count, whether more
+        rows follow the page)
     """
     # Build query
     conditions = [Project.client_profile_id == client_profile_id]
@@ -215,18 +586,25 @@ async def get_projects_by_client(
     if status:
         conditions.append(Project.status == status)
 
-    query = select(Project).where(and_(*conditions))
-    count_query = select(func.count()).select_from(Project).where(and_(*conditions))
+    query = select_projects_with_client().where(and_(*conditions))
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    counter = ListingCounter(
+        settings.CLIENT_PROJECTS_COUNT_STRATEGY,
+        Project,
+        conditions,
+        count_cache_key("client_projects", {"client_profile_id": client_profile_id, "status": status}),
+    )
+    await counter.prepare(db)
+    query = counter.apply(query)
 
-    # Apply pagination and sorting
-    query = query.order_by(desc(Project.created_at)).offset(skip).limit(limit)
+    # Apply pagination and sorting (served by idx_projects_client_created_at)
+    query = query.order_by(desc(Project.created_at), desc(Project.id)).offset(skip).limit(limit + 1)
 
     # Execute query
     result = await db.execute(query)
-    projects = result.scalars().all()
+    rows = result.all()
+    total = await counter.resolve(db, rows, skip)
+    has_more = len(rows) > limit
+    projects = [row[0] for row in rows[:limit]]
 
-    return list(projects), total
+    return projects, total, has_more
@@ -0,0 +1,164 @@
+"""CRUD operations for proposals."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, Proposal
+
+
+async def submit_proposal(
+    db: AsyncSession,
+    project_id: UUID,
+    creator_profile_id: UUID,
+    values: Dict[str, Any]
+) -> Optional[Row]:
+    """
+    Insert a proposal and increment its project's proposal_count in one
+    statement.
+
+    The INSERT ... SELECT only produces a row while the project is open, and
+    ``ON CONFLICT DO NOTHING`` on ``idx_proposals_unique`` skips repeat
+    submissions; the UPDATE then adds one to the counter of exactly the
+    projects that received a proposal. No count is read and written back,
+    so concurrent submissions never lose an increment.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        creator_profile_id: Submitting creator's profile UUID
+        values: Proposal columns (cover_letter, proposed_budget,
+            proposed_timeline_days, attachments, portfolio_samples)
+
+    Returns:
+        Row of the new proposal's columns plus the project's updated
+        proposal_count, or None when nothing was inserted (project missing
+        or not open, or the creator already submitted a proposal)
+    """
+    proposals = Proposal.__table__
+    projects = Project.__table__
+
+    columns = {
+        name: literal(value, proposals.c[name].type)
+        for name, value in {"id": uuid4(), "creator_profile_id": creator_profile_id, **values}.items()
+    }
+    # Defaults are spelled out: Python-side column defaults are not applied
+    # to an INSERT nested in a CTE
+    columns.update(status=literal("pending"), created_at=func.now(), updated_at=func.now())
+    source = select(
+        projects.c.id.label("project_id"),
+        *[value.label(name) for name, value in columns.items()],
+    ).where(projects.c.id == project_id, projects.c.status == "open")
+
+    inserted = (
+        insert(proposals)
+        .from_select(["project_id", *columns], source)
+        .on_conflict_do_nothing(index_elements=["project_id", "creator_profile_id"])
+        .returning(*proposals.c)
+        .cte("inserted")
+    )
+    counted = (
+        update(projects)
+        .where(projects.c.id == inserted.c.project_id)
+        # The model's Python-side onupdate cannot be evaluated inside a CTE;
+        # the update_projects_updated_at trigger stamps the row instead
+        .values(
+            proposal_count=func.coalesce(projects.c.proposal_count, 0) + 1,
+            updated_at=projects.c.updated_at,
+        )
+        .returning(projects.c.id, projects.c.proposal_count)
+        .cte("counted")
+    )
+
+    result = await db.execute(
+        select(inserted, counted.c.proposal_count)
+        .join(counted, counted.c.id == inserted.c.project_id)
+    )
+    return result.first()
+
+
+async def get_submission_state(
+    db: AsyncSession,
+    project_id: UUID,
+    creator_profile_id: UUID
+) -> Optional[Row]:
+    """
+    Explain why a proposal submission inserted nothing.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        creator_profile_id: Creator profile UUID
+
+    Returns:
+        Row of (status, already_submitted) for the project, or None if the
+        project does not exist
+    """
+    already_submitted = exists().where(
+        Proposal.project_id == project_id,
+        Proposal.creator_profile_id == creator_profile_id,
+    )
+    result = await db.execute(
+        select(Project.status, already_submitted.label("already_submitted"))
+        .where(Project.id == project_id)
+    )
+    return result.first()
+
+
+async def reconcile_proposal_counts(
+    db: AsyncSession,
+    after: Optional[UUID],
+    limit: int
+) -> Tuple[Optional[UUID], int]:
+    """
+    Correct proposal_count for one batch of projects in a single UPDATE.
+
+    The counter is moved by the drift observed in the statement's snapshot
+    (actual count minus stored count) rather than overwritten, so a
+    submission committing while the batch runs keeps its increment.
+
+    Args:
+        db: Database session
+        after: Last project ID of the previous batch (None to start)
+        limit: Projects per batch
+
+    Returns:
+        Tuple of (last project ID of this batch or None when done, number of
+        projects corrected)
+    """
+    query = select(Project.id).order_by(Project.id).limit(limit)
+    if after is not None:
+        query = query.where(Project.id > after)
+    batch: List[UUID] = list((await db.execute(query)).scalars().all())
+    if not batch:
+        return None, 0
+
+    projects = Project.__table__
+    counts = (
+        select(
+            Project.id,
+            Project.proposal_count.label("stored"),
+            func.count(Proposal.id).label("actual"),
+        )
+        .outerjoin(Proposal, Proposal.project_id == Project.id)
+        .where(Project.id.in_(batch))
+        .group_by(Project.id)
+        .subquery("counts")
+    )
+    result = await db.execute(
+        update(projects)
+        .where(
+            projects.c.id == counts.c.id,
+            counts.c.actual != func.coalesce(counts.c.stored, 0),
+        )
+        .values(
+            proposal_count=func.coalesce(projects.c.proposal_count, 0)
+            + counts.c.actual - func.coalesce(counts.c.stored, 0),
+            updated_at=projects.c.updated_at,
+        )
+    )
+    return batch[-1], result.rowcount
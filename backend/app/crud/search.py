@@ -0,0 +1,120 @@
+"""Cross-entity full-text search."""
+
+from typing import List, Sequence
+
+from sqlalchemy import Float, Text, and_, cast, func, literal, null, select, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.client import client_search_vector
+from app.crud.creator import creator_search_vector
+from app.crud.gig import gig_search_query, gig_search_vector
+from app.crud.project import project_search_vector
+from app.models.client import ClientProfile
+from app.models.creator import CreatorProfile
+from app.models.gig import Gig
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.search import SearchResultType
+
+# ts_rank_cd normalization 32 maps every rank to rank / (rank + 1), so ranks
+# of differently shaped documents share the [0, 1) scale they are merged on
+RANK_NORMALIZATION = 32
+
+
+def _search_branch(
+    result_type: SearchResultType,
+    vector,
+    ts_query,
+    limit: int,
+    id_column,
+    title,
+    subtitle,
+    image_url,
+    slug=None,
+    conditions: Sequence = (),
+    join=None
+):
+    """
+    Build one member of the search UNION: the type's top matches by rank.
+
+    The match is ``vector @@ ts_query``, served by the type's full-text GIN
+    index; only those rows are ranked.
+    """
+    rank = func.ts_rank_cd(vector, ts_query, RANK_NORMALIZATION, type_=Float)
+    query = select(
+        literal(result_type.value).label("type"),
+        id_column.label("id"),
+        cast(title, Text).label("title"),
+        cast(subtitle, Text).label("subtitle"),
+        cast(image_url, Text).label("image_url"),
+        cast(slug if slug is not None else null(), Text).label("slug"),
+        rank.label("rank"),
+    )
+    if join is not None:
+        query = query.join(*join)
+    return (
+        query
+        .where(vector.op("@@")(ts_query), *conditions)
+        .order_by(rank.desc(), id_column)
+        .limit(limit)
+    )
+
+
+async def search_all(
+    db: AsyncSession,
+    search: str,
+    types: Sequence[SearchResultType],
+    limit_per_type: int
+) -> List[Row]:
+    """
+    Search gigs, projects, creators and clients in one ranked query.
+
+    Each requested type contributes its top ``limit_per_type`` matches to a
+    ``UNION ALL``; the union is ordered by rank.
+
+    Args:
+        db: Database session
+        search: Search string (web search syntax: quoted phrases, OR, -term)
+        types: Entity types to search
+        limit_per_type: Maximum results per type
+
+    Returns:
+        Rows of (type, id, title, subtitle, image_url, slug, rank), most
+        relevant first
+    """
+    ts_query = gig_search_query(search)
+    active_user = and_(User.status == "active", User.deleted_at.is_(None))
+
+    branches = {
+        SearchResultType.gig: lambda: _search_branch(
+            SearchResultType.gig, gig_search_vector(), ts_query, limit_per_type,
+            Gig.id, Gig.title, Gig.category, Gig.thumbnail_url, Gig.slug,
+            conditions=[Gig.status == "active"],
+        ),
+        SearchResultType.project: lambda: _search_branch(
+            SearchResultType.project, project_search_vector(), ts_query, limit_per_type,
+            Project.id, Project.title, Project.category, null(),
+            conditions=[Project.status == "open"],
+        ),
+        SearchResultType.creator: lambda: _search_branch(
+            SearchResultType.creator, creator_search_vector(), ts_query, limit_per_type,
+            CreatorProfile.id, CreatorProfile.display_name, CreatorProfile.tagline,
+            CreatorProfile.profile_image_url,
+            conditions=[active_user],
+            join=(User, User.id == CreatorProfile.user_id),
+        ),
+        SearchResultType.client: lambda: _search_branch(
+            SearchResultType.client, client_search_vector(), ts_query, limit_per_type,
+            ClientProfile.id, ClientProfile.company_name, ClientProfile.industry,
+            ClientProfile.company_logo_url,
+            conditions=[active_user],
+            join=(User, User.id == ClientProfile.user_id),
+        ),
+    }
+
+    results = union_all(*[branches[result_type]() for result_type in types]).subquery("results")
+    result = await db.execute(
+        select(results).order_by(results.c.rank.desc(), results.c.type, results.c.id)
+    )
+    return result.all()
@@ -1,12 +1,17 @@
-"""CRUD operations for User model."""
+"""CRUD operations for User model.
+
+Every function that changes a user drops its cached principal
+(app.core.principal_cache) once the change is committed.
+"""
 
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.core.principal_cache import principal_cache
 from app.core.security import hash_password
 
 
@@ -63,7 +68,7 @@ async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
     # Create new user with hashed password
     db_user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password(user_data.password),
         user_type=user_data.user_type,
         phone_number=user_data.phone_number,
         status="pending_verification",  # New users start with pending_verification
@@ -111,6 +116,7 @@ async def update_user(
         setattr(user, field, value)
 
     await db.commit()
+    await principal_cache.invalidate(user_id)
     await db.refresh(user)
 
     return user
@@ -132,6 +138,7 @@ async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
 
     user.status = "deleted"
     await db.commit()
+    await principal_cache.invalidate(user_id)
 
     return True
 
@@ -153,6 +160,7 @@ async def verify_user_email(db: AsyncSession, user_id: UUID) -> Optional[User]:
     user.email_verified = True
     user.status = "active"
     await db.commit()
+    await principal_cache.invalidate(user_id)
     await db.refresh(user)
 
     return user
@@ -177,6 +185,33 @@ async def update_last_login(db: AsyncSession, user_id: UUID) -> Optional[User]:
     user.last_login_at = datetime.utcnow()
     user.login_count += 1
     await db.commit()
+    await principal_cache.invalidate(user_id)
     await db.refresh(user)
 
     return user
+
+
+async def increment_token_version(db: AsyncSession, user_id: UUID) -> Optional[int]:
+    """Increment a user's token version, revoking every token issued so far.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+
+    Returns:
+        New token version if the user exists, None otherwise
+    """
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+    )
+    version = result.scalar_one_or_none()
+    if version is None:
+        return None
+
+    await db.commit()
+    await principal_cache.invalidate(user_id)
+
+    return version
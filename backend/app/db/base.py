@@ -1,7 +1,7 @@
 """Database configuration and session management."""
 
 from typing import AsyncGenerator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -60,6 +60,9 @@ async def init_db() -> None:
     Note: In production, use Alembic migrations instead.
     """
     async with engine.begin() as conn:
+        # Model indexes use ll_to_earth() (client location search)
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS cube"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS earthdistance"))
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -0,0 +1,86 @@
+"""EXPLAIN support for SQLAlchemy statements."""
+
+import json
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """
+    Wrap a statement in ``EXPLAIN (FORMAT JSON, ...)``.
+
+    Bind parameters of the wrapped statement are preserved, so the plan is
+    produced for exactly the query the application would run.
+    """
+
+    inherit_cache = False
+
+    def __init__(
+        self,
+        statement: ClauseElement,
+        analyze: bool = False,
+        buffers: bool = False
+    ):
+        """
+        Args:
+            statement: Statement to explain
+            analyze: Execute the statement and report actual timings
+            buffers: Report shared buffer usage (requires analyze)
+        """
+        self.statement = statement
+        self.analyze = analyze
+        self.buffers = buffers
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = ["FORMAT JSON"]
+    if element.analyze:
+        options.append("ANALYZE")
+    if element.buffers:
+        options.append("BUFFERS")
+    return f"EXPLAIN ({', '.join(options)}) " + compiler.process(element.statement, **kw)
+
+
+async def explain(
+    db: AsyncSession,
+    statement: ClauseElement,
+    analyze: bool = False,
+    buffers: bool = False
+) -> dict[str, Any]:
+    """
+    Return the JSON plan PostgreSQL produces for a statement.
+
+    Args:
+        db: Database session
+        statement: Statement to explain
+        analyze: Execute the statement and report actual timings
+        buffers: Report shared buffer usage
+
+    Returns:
+        Top-level plan document (containing "Plan" and timing keys)
+    """
+    result = await db.execute(Explain(statement, analyze=analyze, buffers=buffers))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def estimate_row_count(db: AsyncSession, statement: ClauseElement) -> Optional[int]:
+    """
+    Return the planner's row estimate for a statement without executing it.
+
+    Args:
+        db: Database session
+        statement: SELECT statement to estimate
+
+    Returns:
+        Estimated number of rows, or None if the plan carries no estimate
+    """
+    plan = await explain(db, statement)
+    rows = plan.get("Plan", {}).get("Plan Rows")
+    return int(rows) if rows is not None else None
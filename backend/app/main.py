@@ -1,12 +1,28 @@
 """ReelByte FastAPI application entry point."""
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import ValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.core.config import settings
 from app.db.base import init_db, close_db
+from app.core.redis import close_redis
+from app.core.metrics import render_metrics
+from app.core.passwords import password_hasher
+from app.core.token_revocation import (
+    start_token_revocation_sync,
+    stop_token_revocation_sync,
+)
+from app.services.gig_index import gig_index_listener
+from app.services.view_counter import start_view_counters, stop_view_counters
+from app.services.matching_service import start_match_refresher, stop_match_refresher
+from app.services.proposal_service import (
+    start_proposal_count_reconciler,
+    stop_proposal_count_reconciler,
+)
 from app.api.v1.router import api_router
 
 
@@ -17,13 +33,28 @@ async def lifespan(app: FastAPI):
     print("Starting up ReelByte API...")
     await init_db()
     print("Database initialized")
+    if settings.GIG_MEMORY_INDEX_ENABLED:
+        await gig_index_listener.start()
+        print("Gig index listener started")
+    start_view_counters()
+    start_token_revocation_sync()
+    start_proposal_count_reconciler()
+    if settings.MATCHING_ENABLED:
+        start_match_refresher()
 
     yield
 
     # Shutdown
     print("Shutting down ReelByte API...")
+    await gig_index_listener.stop()
+    await stop_view_counters()
+    await stop_token_revocation_sync()
+    await stop_proposal_count_reconciler()
+    await stop_match_refresher()
     await close_db()
     print("Database connections closed")
+    await close_redis()
+    password_hasher.shutdown()
 
 
 # Create FastAPI application
@@ -53,6 +84,21 @@ if not settings.DEBUG:
         allowed_hosts=settings.ALLOWED_HOSTS
     )
 
+
+@app.exception_handler(ValidationError)
+async def search_filters_error_handler(request: Request, exc: ValidationError):
+    """Reject invalid listing filters (built inside the handlers) with 400.
+
+    Any other model failing validation is a server error and propagates.
+    """
+    if not exc.title.endswith("SearchFilters"):
+        raise exc
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": exc.errors(include_url=False, include_context=False, include_input=False)},
+    )
+
+
 # Include API v1 router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -78,6 +124,12 @@ async def health():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus metrics of this worker process."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
 
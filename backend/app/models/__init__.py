@@ -10,6 +10,7 @@ from app.models.transaction import Transaction
 from app.models.message import Conversation, ConversationParticipant, Message
 from app.models.review import Review
 from app.models.notification import Notification
+from app.models.match import ProjectMatchTerm, CreatorMatchTerm, ProjectMatch, MatchRefreshQueue
 
 __all__ = [
     # User
@@ -37,4 +38,9 @@ __all__ = [
     "Review",
     # Notification
     "Notification",
+    # Matching
+    "ProjectMatchTerm",
+    "CreatorMatchTerm",
+    "ProjectMatch",
+    "MatchRefreshQueue",
 ]
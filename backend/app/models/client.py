@@ -5,7 +5,9 @@ from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, ForeignKey
+from sqlalchemy import (
+    Boolean, Float, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, ForeignKey, Index, text
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -45,6 +47,10 @@ class ClientProfile(Base):
     website_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Location (WGS84 degrees), used for distance search on projects
+    latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
     # Statistics
     total_jobs_posted: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     total_spent: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), default=Decimal("0"), server_default="0")
@@ -90,6 +96,19 @@ class ClientProfile(Base):
             "company_size IN ('1-10', '11-50', '51-200', '201-500', '501-1000', '1000+')",
             name="check_company_size",
         ),
+        # Radius search (app.utils.geo.within_radius); needs cube + earthdistance
+        Index(
+            "idx_client_profiles_location",
+            text("ll_to_earth(latitude, longitude)"),
+            postgresql_using="gist",
+            postgresql_where=text("latitude IS NOT NULL AND longitude IS NOT NULL"),
+        ),
+        # Must stay in sync with crud.client.client_search_vector()
+        Index(
+            "idx_client_profiles_full_text",
+            text("to_tsvector('english', company_name || ' ' || coalesce(industry, ''))"),
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
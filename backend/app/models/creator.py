@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, ForeignKey, Index
+from sqlalchemy import Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -115,7 +115,7 @@ class CreatorProfile(Base):
         back_populates="creator",
     )
 
-    # Constraints
+    # Constraints and Indexes
     __table_args__ = (
         CheckConstraint(
             "availability_status IN ('available', 'busy', 'unavailable')",
@@ -125,6 +125,37 @@ class CreatorProfile(Base):
             "verification_level IN ('none', 'basic', 'pro', 'elite')",
             name="check_verification_level",
         ),
+        # Keyset pagination: one (sort key, id) index per sort_by, plus partial
+        # copies for the default "available now" discovery view
+        Index("idx_creator_profiles_rating_id", "average_rating", "id"),
+        Index("idx_creator_profiles_jobs_completed_id", "total_jobs_completed", "id"),
+        Index("idx_creator_profiles_created_at_id", "created_at", "id"),
+        Index("idx_creator_profiles_hourly_rate_id", "hourly_rate", "id"),
+        Index(
+            "idx_creator_profiles_available_rating_id", "average_rating", "id",
+            postgresql_where=text("availability_status = 'available'"),
+        ),
+        Index(
+            "idx_creator_profiles_available_jobs_completed_id", "total_jobs_completed", "id",
+            postgresql_where=text("availability_status = 'available'"),
+        ),
+        Index(
+            "idx_creator_profiles_available_created_at_id", "created_at", "id",
+            postgresql_where=text("availability_status = 'available'"),
+        ),
+        Index(
+            "idx_creator_profiles_available_hourly_rate_id", "hourly_rate", "id",
+            postgresql_where=text("availability_status = 'available'"),
+        ),
+        # Must stay in sync with crud.creator.creator_search_vector()
+        Index(
+            "idx_creator_profiles_full_text",
+            text(
+                "to_tsvector('english', display_name || ' ' || coalesce(tagline, '') "
+                "|| ' ' || coalesce(bio, ''))"
+            ),
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
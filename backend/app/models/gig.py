@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, ForeignKey, Index, text
+from sqlalchemy import Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, CheckConstraint, Computed, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -59,6 +59,16 @@ class Gig(Base):
     premium_delivery_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     premium_revisions: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
+    # Cheapest and most expensive tier (LEAST/GREATEST skip NULL tiers)
+    min_package_price: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        Computed("LEAST(basic_price, standard_price, premium_price)", persisted=True),
+    )
+    max_package_price: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        Computed("GREATEST(basic_price, standard_price, premium_price)", persisted=True),
+    )
+
     # Details
     category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     subcategory: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -120,6 +130,21 @@ class Gig(Base):
         ),
         Index("idx_gigs_published_at", "published_at", postgresql_where=text("status = 'active'")),
         Index("idx_gigs_search_tags", "search_tags", postgresql_using="gin"),
+        # Byte-wise ordering for the slug suffix range scan in crud.gig.allocate_slugs()
+        Index("idx_gigs_slug_pattern", "slug", postgresql_ops={"slug": "varchar_pattern_ops"}),
+        # Keyset pagination: one (status, sort key, id) index per sort_by
+        Index("idx_gigs_status_created_at_id", "status", "created_at", "id"),
+        Index("idx_gigs_status_basic_price_id", "status", "basic_price", "id"),
+        Index("idx_gigs_status_order_count_id", "status", "order_count", "id"),
+        Index("idx_gigs_status_view_count_id", "status", "view_count", "id"),
+        Index("idx_gigs_status_min_package_price_id", "status", "min_package_price", "id"),
+        Index("idx_gigs_status_max_package_price_id", "status", "max_package_price", "id"),
+        # Must stay in sync with crud.gig.gig_search_vector()
+        Index(
+            "idx_gigs_full_text",
+            text("to_tsvector('english', title || ' ' || description)"),
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,102 @@
+"""Creator–project matching models.
+
+Projects and creators are described by sparse, L2-normalized term vectors
+(``skill:<name>`` and ``category:<name>`` terms), so the cosine similarity of
+a pair is the sum of weight products over their shared terms. Scored pairs
+are stored in ``project_matches``: the top ``MATCH_TOP_K`` creators of every
+open project together with the top ``MATCH_TOP_K`` projects of every creator.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Float, String, TIMESTAMP, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class ProjectMatchTerm(Base):
+    """One non-zero entry of an open project's match vector."""
+
+    __tablename__ = "project_match_terms"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    term: Mapped[str] = mapped_column(String(120), primary_key=True)
+    weight: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("idx_project_match_terms_term", "term"),
+    )
+
+
+class CreatorMatchTerm(Base):
+    """One non-zero entry of an available creator's match vector."""
+
+    __tablename__ = "creator_match_terms"
+
+    creator_profile_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("creator_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    term: Mapped[str] = mapped_column(String(120), primary_key=True)
+    weight: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("idx_creator_match_terms_term", "term"),
+    )
+
+
+class ProjectMatch(Base):
+    """Precomputed match score of a creator for a project."""
+
+    __tablename__ = "project_matches"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    creator_profile_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("creator_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    # Top-k reads from either side
+    __table_args__ = (
+        Index("idx_project_matches_project_score", "project_id", "score"),
+        Index("idx_project_matches_creator_score", "creator_profile_id", "score"),
+    )
+
+
+class MatchRefreshQueue(Base):
+    """
+    Projects and creators whose matches are stale.
+
+    Rows are added by triggers on projects, creator skills/categories/profiles
+    and users, and consumed by the matching refresher.
+    """
+
+    __tablename__ = "match_refresh_queue"
+
+    entity_type: Mapped[str] = mapped_column(String(20), primary_key=True)  # project or creator
+    entity_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    queued_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -7,9 +7,9 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     Boolean, Integer, String, Text, TIMESTAMP, DECIMAL, Date,
-    CheckConstraint, ForeignKey, Index, text
+    CheckConstraint, Computed, ForeignKey, Index, text
 )
-from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY, NUMRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -57,6 +57,18 @@ class Project(Base):
     budget_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     budget_min: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(10, 2), nullable=True)
     budget_max: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(10, 2), nullable=True)
+    # [budget_min, budget_max] as one range; a single bound (fixed/hourly
+    # budgets) gives the point range at that value, no budget gives NULL.
+    # LEAST/GREATEST keep inverted bounds from failing the insert
+    budget_range: Mapped[Optional[Range[Decimal]]] = mapped_column(
+        NUMRANGE,
+        Computed(
+            "CASE WHEN budget_min IS NULL AND budget_max IS NULL THEN NULL "
+            "ELSE numrange(LEAST(budget_min, budget_max), GREATEST(budget_min, budget_max), '[]') END",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
     # Timeline
     deadline_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -132,9 +144,21 @@ class Project(Base):
             name="check_project_status",
         ),
         Index("idx_projects_published_at", "published_at", postgresql_where="status = 'open'"),
-        # TODO: Add via Alembic migration - GIN indexes need special handling
-        # Index("idx_projects_required_skills", "required_skills", postgresql_using="gin"),
-        # Index("idx_projects_full_text", ..., postgresql_using="gin"),
+        # Keyset pagination: one (status, sort key, id) index per sort_by
+        Index("idx_projects_status_created_at_id", "status", "created_at", "id"),
+        Index("idx_projects_status_budget_min_id", "status", "budget_min", "id"),
+        Index("idx_projects_status_deadline_date_id", "status", "deadline_date", "id"),
+        Index("idx_projects_status_proposal_count_id", "status", "proposal_count", "id"),
+        Index("idx_projects_status_view_count_id", "status", "view_count", "id"),
+        # Client dashboard listing, newest first
+        Index("idx_projects_client_created_at", "client_profile_id", "created_at", "id"),
+        Index("idx_projects_budget_range", "budget_range", postgresql_using="gist"),
+        Index("idx_projects_required_skills", "required_skills", postgresql_using="gin"),
+        Index(
+            "idx_projects_full_text",
+            text("to_tsvector('english', title || ' ' || description)"),
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -59,6 +59,9 @@ class User(Base):
     last_login_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
     login_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
+    # Token revocation (tokens issued under an older version are rejected)
+    token_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
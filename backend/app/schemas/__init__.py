@@ -9,6 +9,7 @@ from app.schemas.user import (
     UserLogin,
     UserUpdate,
     UserResponse,
+    UserPrincipal,
     UserPublicProfile,
     Token,
     TokenData,
@@ -34,6 +35,7 @@ from app.schemas.creator import (
     PortfolioItemUpdate,
     PortfolioItemResponse,
     CreatorSearchFilters,
+    CreatorsListResponse,
 )
 
 # Client profile schemas
@@ -114,6 +116,7 @@ __all__ = [
     "UserLogin",
     "UserUpdate",
     "UserResponse",
+    "UserPrincipal",
     "UserPublicProfile",
     "Token",
     "TokenData",
@@ -136,6 +139,7 @@ __all__ = [
     "PortfolioItemUpdate",
     "PortfolioItemResponse",
     "CreatorSearchFilters",
+    "CreatorsListResponse",
     # Client schemas
     "ClientProfileCreate",
     "ClientProfileUpdate",
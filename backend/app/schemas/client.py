@@ -23,6 +23,8 @@ class ClientProfileCreate(BaseModel):
     company_size: Optional[str] = Field(None, description="Company size range")
     website_url: Optional[HttpUrl] = Field(None, description="Company website URL")
     description: Optional[str] = Field(None, max_length=2000, description="Company description")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Location latitude")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Location longitude")
 
     @field_validator("company_size")
     @classmethod
@@ -44,6 +46,8 @@ class ClientProfileUpdate(BaseModel):
     company_size: Optional[str] = None
     website_url: Optional[HttpUrl] = None
     description: Optional[str] = Field(None, max_length=2000)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
     @field_validator("company_size")
     @classmethod
@@ -69,6 +73,8 @@ class ClientProfileResponse(BaseModel):
     company_size: Optional[str]
     website_url: Optional[str]
     description: Optional[str]
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     # Statistics
     total_jobs_posted: int
@@ -156,6 +156,12 @@ class CreatorPublicProfile(BaseModel):
     created_at: datetime
 
 
+class CreatorMatch(CreatorPublicProfile):
+    """Public creator profile recommended for a project."""
+
+    match_score: float = Field(..., description="Match score in [0, 1]; higher is better")
+
+
 # ============================================================================
 # Creator Skills Schemas
 # ============================================================================
@@ -300,6 +306,7 @@ class CreatorSearchFilters(BaseModel):
     # Pagination
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page (overrides page)")
 
     # Sorting
     sort_by: str = Field(default="rating", description="Sort field")
@@ -321,3 +328,15 @@ class CreatorSearchFilters(BaseModel):
         if v not in {"asc", "desc"}:
             raise ValueError("sort_order must be 'asc' or 'desc'")
         return v
+
+
+class CreatorsListResponse(BaseModel):
+    """Response for creator search with pagination."""
+
+    creators: List[CreatorPublicProfile]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
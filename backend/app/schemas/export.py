@@ -0,0 +1,11 @@
+"""
+Bulk export schemas shared by the listing export endpoints.
+"""
+
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """Encoding of a streamed export."""
+    ndjson = "ndjson"  # One JSON object per line, same shape as the listing items
+    csv = "csv"  # Nested objects flattened to "parent.field" columns
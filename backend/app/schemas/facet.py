@@ -0,0 +1,21 @@
+"""
+Facet count schemas shared by the listing filter panels.
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class FacetCount(BaseModel):
+    """Number of matching records for one facet value."""
+    value: str
+    count: int
+
+
+class RangeFacetCount(BaseModel):
+    """Number of matching records within a numeric range [min, max)."""
+    min: Optional[Decimal] = None  # None: no lower bound
+    max: Optional[Decimal] = None  # None: no upper bound
+    count: int
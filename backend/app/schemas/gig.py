@@ -8,7 +8,9 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator, computed_field
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator, model_validator, computed_field
+
+from app.schemas.facet import FacetCount, RangeFacetCount
 
 
 class CreatorSummary(BaseModel):
@@ -54,6 +56,12 @@ class GigStatus(str, Enum):
     draft = "draft"
 
 
+class GigSearchMode(str, Enum):
+    """How the free-text search term is matched."""
+    fulltext = "fulltext"  # Ranked full-text search (uses idx_gigs_full_text)
+    substring = "substring"  # Legacy ILIKE substring match
+
+
 # ============================================================================
 # Gig Package Schemas
 # ============================================================================
@@ -229,6 +237,10 @@ class GigResponse(BaseModel):
     premium_delivery_days: Optional[int]
     premium_revisions: Optional[int]
 
+    # Cheapest and most expensive package
+    min_package_price: Optional[Decimal] = None
+    max_package_price: Optional[Decimal] = None
+
     # Details
     category: str
     subcategory: Optional[str]
@@ -354,6 +366,29 @@ class GigsListResponse(BaseModel):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
+
+
+class GigFacetsResponse(BaseModel):
+    """Per-facet counts of gigs matching the current filters."""
+    total: int
+    categories: List[FacetCount]
+    subcategories: List[FacetCount]
+    video_types: List[FacetCount]
+    price_ranges: List[RangeFacetCount]  # Buckets of basic_price
+    tags: List[FacetCount]  # Most frequent search tags
+
+
+class GigSuggestion(BaseModel):
+    """One autocomplete completion."""
+    text: str
+    kind: str  # title, tag, category or subcategory
+
+
+class GigSuggestResponse(BaseModel):
+    """Autocomplete completions for a partially typed query."""
+    query: str
+    suggestions: List[GigSuggestion]
 
 
 # ============================================================================
@@ -365,6 +400,7 @@ class GigSearchFilters(BaseModel):
 
     # Search query
     search: Optional[str] = Field(None, description="Text search in title, description, tags")
+    search_mode: GigSearchMode = Field(default=GigSearchMode.fulltext, description="Search matching mode")
 
     # Filters
     category: Optional[str] = Field(None, description="Filter by category")
@@ -377,12 +413,17 @@ class GigSearchFilters(BaseModel):
     min_price: Optional[float] = Field(None, ge=0, description="Minimum price")
     max_price: Optional[float] = Field(None, ge=0, description="Maximum price")
 
+    # Tier-aware price range: gigs offering at least one package in range
+    package_min_price: Optional[float] = Field(None, ge=0, description="Some package costs at least this (within package_max_price when both are set)")
+    package_max_price: Optional[float] = Field(None, ge=0, description="Some package costs at most this (at least package_min_price when both are set)")
+
     # Tags
     tags: Optional[List[str]] = Field(None, description="Filter by tags (OR logic)")
 
     # Pagination
     skip: int = Field(default=0, ge=0, description="Number of records to skip")
     limit: int = Field(default=20, ge=1, le=100, description="Number of records to return")
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page (overrides skip)")
 
     # Sorting
     sort_by: str = Field(default="created_at", description="Sort field")
@@ -392,7 +433,10 @@ class GigSearchFilters(BaseModel):
     @classmethod
     def validate_sort_by(cls, v: str) -> str:
         """Validate sort field."""
-        allowed_fields = {"created_at", "price", "popularity", "views"}
+        allowed_fields = {
+            "created_at", "price", "popularity", "views", "relevance",
+            "min_package_price", "max_package_price",
+        }
         if v not in allowed_fields:
             raise ValueError(f"sort_by must be one of: {', '.join(allowed_fields)}")
         return v
@@ -405,6 +449,15 @@ class GigSearchFilters(BaseModel):
             raise ValueError("sort_order must be 'asc' or 'desc'")
         return v
 
+    @model_validator(mode="after")
+    def validate_relevance_sort(self) -> "GigSearchFilters":
+        """Relevance is the full-text rank, so it needs a full-text search."""
+        if self.sort_by == "relevance" and (
+            not self.search or self.search_mode != GigSearchMode.fulltext
+        ):
+            raise ValueError("sort_by=relevance requires a search in fulltext mode")
+        return self
+
 
 # ============================================================================
 # Gig Order Schemas
@@ -4,10 +4,14 @@ Project schemas for job postings, proposals, and contracts.
 
 from datetime import date, datetime
 from decimal import Decimal
+from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator
+from pydantic import AliasChoices, BaseModel, Field, HttpUrl, ConfigDict, field_validator, model_validator
+
+from app.schemas.creator import CreatorMatch
+from app.schemas.facet import FacetCount, RangeFacetCount
 
 
 # ============================================================================
@@ -227,7 +231,7 @@ class ProposalResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    job_id: UUID
+    job_id: UUID = Field(..., validation_alias=AliasChoices("job_id", "project_id"))
     creator_profile_id: UUID
 
     # Proposal Details
@@ -249,13 +253,19 @@ class ProposalResponse(BaseModel):
     accepted_at: Optional[datetime]
 
 
+class ProposalSubmitted(ProposalResponse):
+    """Schema for a newly submitted proposal."""
+
+    project_proposal_count: int = Field(..., description="Proposals the job has received, including this one")
+
+
 class ProposalListResponse(BaseModel):
     """Schema for proposal list item (summary view)."""
 
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    job_id: UUID
+    job_id: UUID = Field(..., validation_alias=AliasChoices("job_id", "project_id"))
     creator_profile_id: UUID
     proposed_budget: Decimal
     proposed_timeline_days: int
@@ -510,6 +520,36 @@ class ProjectWithClient(BaseModel):
             self.clientProfile = self.client
 
 
+class RecommendedProject(ProjectWithClient):
+    """Project recommended to a creator."""
+
+    match_score: float = Field(..., description="Match score in [0, 1]; higher is better")
+
+
+class RecommendedProjectsResponse(BaseModel):
+    """A creator's best matching open projects, best first."""
+
+    projects: List[RecommendedProject]
+
+
+class ProjectCreatorMatchesResponse(BaseModel):
+    """A project's best matching creators, best first."""
+
+    creators: List[CreatorMatch]
+
+
+class ProjectBudgetMode(str, Enum):
+    """
+    How min_budget/max_budget match a project's budget range.
+
+    A project's range is [budget_min, budget_max]; fixed and hourly budgets
+    (or ranges with a single bound set) are the single point at the value
+    given. Projects without any budget never match a budget filter.
+    """
+    overlap = "overlap"  # Any part of the project's range lies within the filter
+    within = "within"  # The whole project range lies within the filter
+
+
 class ProjectSearchFilters(BaseModel):
     """Filters for searching projects."""
 
@@ -519,12 +559,27 @@ class ProjectSearchFilters(BaseModel):
     experience_level: Optional[str] = None
     min_budget: Optional[float] = None
     max_budget: Optional[float] = None
+    budget_mode: ProjectBudgetMode = ProjectBudgetMode.overlap
+    near: Optional[str] = None  # "lat,lon" of the searcher
+    radius_km: Optional[float] = None  # Distance from near; defaults when near is set
     search: Optional[str] = None
     client_profile_id: Optional[UUID] = None
     sort_by: str = "created_at"
     sort_order: str = "desc"
     skip: int = 0
     limit: int = 20
+    cursor: Optional[str] = None  # Keyset cursor, overrides skip
+
+    @model_validator(mode="after")
+    def validate_budget_bounds(self) -> "ProjectSearchFilters":
+        """Reject an inverted budget range (Postgres cannot build it)."""
+        if (
+            self.min_budget is not None
+            and self.max_budget is not None
+            and self.min_budget > self.max_budget
+        ):
+            raise ValueError("min_budget must be less than or equal to max_budget")
+        return self
 
 
 class ProjectsListResponse(BaseModel):
@@ -535,3 +590,16 @@ class ProjectsListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
+
+
+class ProjectFacetsResponse(BaseModel):
+    """Per-facet counts of projects matching the current filters."""
+
+    total: int
+    categories: List[FacetCount]
+    video_types: List[FacetCount]
+    experience_levels: List[FacetCount]
+    budget_ranges: List[RangeFacetCount]  # Buckets of budget_min
+    skills: List[FacetCount]  # Most frequent required skills
@@ -0,0 +1,36 @@
+"""
+Unified search schemas.
+"""
+
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SearchResultType(str, Enum):
+    """Entity type of a search result."""
+    gig = "gig"
+    project = "project"
+    creator = "creator"
+    client = "client"
+
+
+class SearchResult(BaseModel):
+    """One matching gig, project, creator or client."""
+
+    type: SearchResultType
+    id: UUID
+    title: str  # Gig/project title, creator display name or company name
+    subtitle: Optional[str] = None  # Category, creator tagline or client industry
+    image_url: Optional[str] = None  # Gig thumbnail, creator avatar or company logo
+    slug: Optional[str] = None  # Gigs only
+    rank: float = Field(..., description="Relevance in [0, 1); comparable across types")
+
+
+class SearchResponse(BaseModel):
+    """Results of all requested types, most relevant first."""
+
+    query: str
+    results: List[SearchResult]
@@ -89,6 +89,12 @@ class UserResponse(BaseModel):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class UserPrincipal(UserResponse):
+    """Authenticated user as cached for the request path (see app.core.principal_cache)."""
+
+    deleted_at: Optional[datetime] = Field(None, description="Soft deletion timestamp")
+
+
 class UserPublicProfile(BaseModel):
     """Schema for public user information (minimal data)."""
 
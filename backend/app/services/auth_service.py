@@ -6,9 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models.user import User
-from app.schemas.user import UserCreate
+from app.schemas.user import UserCreate, UserPrincipal
 from app.schemas.auth import TokenData
 from app.crud import user as user_crud
+from app.core.principal_cache import principal_cache
+from app.core.token_revocation import token_revocations
 from app.core.security import (
     verify_password,
     create_access_token,
@@ -61,7 +63,7 @@ async def authenticate_user(
         return None
 
     # Verify password
-    if not verify_password(password, user.password_hash):
+    if not await verify_password(password, user.password_hash):
         return None
 
     # Check if user is active
@@ -102,6 +104,7 @@ async def create_user_tokens(user: User) -> Dict[str, str]:
         "sub": str(user.id),
         "email": user.email,
         "user_type": user.user_type,
+        "token_version": user.token_version,
     }
 
     access_token = create_access_token(token_data)
@@ -170,6 +173,13 @@ async def refresh_access_token(
             detail="User account is inactive",
         )
 
+    # Refresh tokens outlive the in-memory revocations; check the stored version
+    if payload.get("token_version", 0) < user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+
     # Create new tokens
     return await create_user_tokens(user)
 
@@ -177,15 +187,18 @@ async def refresh_access_token(
 async def get_current_user_from_token(
     db: AsyncSession,
     token_payload: Dict[str, Any]
-) -> User:
+) -> UserPrincipal:
     """Get the current user from a decoded token payload.
 
+    The user is read through the principal cache, so most requests resolve it
+    without querying the users table.
+
     Args:
         db: Database session
         token_payload: Decoded JWT token payload
 
     Returns:
-        User object
+        Cached principal of the user
 
     Raises:
         HTTPException: If user not found or inactive
@@ -197,15 +210,17 @@ async def get_current_user_from_token(
             detail="Invalid token",
         )
 
-    # Get user from database
+    # Get user from the cache, falling back to the database
     try:
         user_uuid = UUID(user_id)
-        user = await user_crud.get_user_by_id(db, user_uuid)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
+    user = await principal_cache.get_or_load(
+        user_uuid, lambda: user_crud.get_user_by_id(db, user_uuid)
+    )
 
     if not user:
         raise HTTPException(
@@ -214,7 +229,7 @@ async def get_current_user_from_token(
         )
 
     # Check if user is active
-    if user.status not in ["active", "pending_verification"]:
+    if user.status not in ["active", "pending_verification"] or user.deleted_at is not None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is inactive",
@@ -224,11 +239,11 @@ async def get_current_user_from_token(
 
 
 async def logout_user(db: AsyncSession, user_id: UUID) -> bool:
-    """Logout a user.
+    """Logout a user from every session.
 
-    Note: With JWT tokens, actual logout is handled client-side by discarding the tokens.
-    This function can be used for server-side cleanup like invalidating sessions
-    or adding tokens to a blacklist in Redis (not implemented here).
+    Increments the user's token version, so every access and refresh token
+    issued so far is rejected. Other workers learn of it within
+    TOKEN_REVOCATION_POLL_SECONDS (see app.core.token_revocation).
 
     Args:
         db: Database session
@@ -240,16 +255,13 @@ async def logout_user(db: AsyncSession, user_id: UUID) -> bool:
     Raises:
         HTTPException: If user not found
     """
-    user = await user_crud.get_user_by_id(db, user_id)
-    if not user:
+    version = await user_crud.increment_token_version(db, user_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # In a production system, you might want to:
-    # 1. Add the token to a Redis blacklist
-    # 2. Store a logout timestamp and check it on token validation
-    # 3. Implement short-lived tokens with refresh tokens
+    await token_revocations.revoke(user_id, version)
 
     return True
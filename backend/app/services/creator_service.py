@@ -0,0 +1,110 @@
+"""Business logic for creator profile operations."""
+
+import math
+from typing import Any, Dict
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import ResponseCache
+from app.core.config import settings
+from app.crud import creator as creator_crud
+from app.schemas.creator import CreatorPublicProfile, CreatorSearchFilters, CreatorsListResponse
+from app.utils.pagination import InvalidCursorError
+
+# Cached CreatorsListResponse pages; entries expire after LISTING_CACHE_TTL
+creator_search_cache = ResponseCache("creators:search", ttl=settings.LISTING_CACHE_TTL)
+
+
+async def search_creators(
+    db: AsyncSession,
+    filters: CreatorSearchFilters
+) -> CreatorsListResponse:
+    """
+    Search creators with filters and pagination.
+
+    Responses are served from the listing cache when possible; concurrent
+    misses for the same parameters share a single database query.
+
+    Args:
+        db: Database session
+        filters: Search and filter parameters
+
+    Returns:
+        CreatorsListResponse with creators and pagination info
+
+    Raises:
+        HTTPException: If the pagination cursor is invalid
+    """
+    async def load() -> CreatorsListResponse:
+        try:
+            creators, total, next_cursor = await creator_crud.search_creators(db, filters)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        total_pages = math.ceil(total / filters.page_size) if total > 0 else 0
+
+        return CreatorsListResponse(
+            creators=[CreatorPublicProfile.model_validate(creator) for creator in creators],
+            total=total,
+            page=filters.page,
+            page_size=filters.page_size,
+            total_pages=total_pages,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
+        )
+
+    return await creator_search_cache.get_or_load(
+        filters.model_dump(), CreatorsListResponse, load
+    )
+
+
+async def get_current_creator_profile_id(
+    db: AsyncSession,
+    current_user: Dict[str, Any],
+    action: str
+) -> UUID:
+    """
+    Resolve the creator profile of the authenticated user.
+
+    Access tokens carry the user (``sub``) and ``user_type``; the profile is
+    looked up by user ID.
+
+    Args:
+        db: Database session
+        current_user: Decoded access token payload
+        action: What the caller is doing, for the 403 message
+
+    Returns:
+        Creator profile UUID
+
+    Raises:
+        HTTPException: 403 if the user is not a creator, 400 if they have no
+            creator profile yet
+    """
+    if current_user.get("user_type") not in ["creator", "both"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only creators can {action}"
+        )
+
+    try:
+        user_id = UUID(current_user.get("sub"))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+
+    creator_profile_id = await creator_crud.get_creator_profile_id_by_user_id(db, user_id)
+    if creator_profile_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Creator profile not found"
+        )
+
+    return creator_profile_id
@@ -0,0 +1,468 @@
+"""In-process index of active gigs.
+
+When ``GIG_MEMORY_INDEX_ENABLED`` is set, every API process keeps the active
+gigs in memory and answers the common browse queries (status ``active`` plus
+category, subcategory, video type, creator, price range, tags and plain-word
+search) without touching the database. It holds:
+
+- an inverted token index over title and description, and exact-value
+  postings for ``search_tags`` (the ``tags`` filter);
+- postings for category, subcategory, video type and creator;
+- sorted ``(key, id)`` arrays for ``basic_price``, ``order_count``,
+  ``view_count`` and ``created_at``, used both for range filters and for
+  ordering and keyset pagination.
+
+The index is kept current through ``LISTEN/NOTIFY``: a trigger on ``gigs``
+publishes the id of every changed row, and the listener re-reads changed gigs
+in small batches. View count flushes do not notify (the trigger ignores
+updates of only ``view_count``), so view counts and the ``views`` ordering
+lag by up to ``GIG_INDEX_RELOAD_SECONDS``: the index is fully reloaded on
+(re)connect and at that interval, which also refreshes denormalized creator
+data. While the
+listener is disconnected the index reports itself as not ready and listings
+fall back to SQL.
+
+Text search uses PostgreSQL's own lexemes, so it matches the SQL listing
+exactly: each gig's title and description are indexed by the lexemes of
+``to_tsvector('english', ...)`` (``tsvector_to_array``), and search words are
+mapped to lexemes through a vocabulary of ``to_tsvector('english', word)`` for
+every word seen in a gig, read with the gigs. Searches containing a word
+outside the vocabulary, quoted phrases, ``OR``/``-`` operators, substring mode
+and relevance ordering go to SQL.
+"""
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from app.core.config import settings
+from app.crud import gig as gig_crud
+from app.db.base import AsyncSessionLocal, engine
+from app.schemas.gig import GigResponse, GigsListResponse, GigSearchFilters, GigSearchMode, GigStatus
+from app.utils.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_PLAIN_SEARCH_RE = re.compile(r"^[A-Za-z0-9\s]+$")
+
+# Sort fields answered from the sorted arrays, mapped to GigResponse attributes
+SORT_FIELDS = {
+    "created_at": "created_at",
+    "price": "basic_price",
+    "popularity": "order_count",
+    "views": "view_count",
+}
+
+
+def words(text: Optional[str]) -> Set[str]:
+    """Split text into lowercase alphanumeric words (vocabulary candidates)."""
+    if not text:
+        return set()
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def gig_words(gig: GigResponse) -> Set[str]:
+    """Return the words of a gig's title and description."""
+    return words(gig.title) | words(gig.description)
+
+
+def _sort_key(value) -> Tuple[int, object]:
+    """Order keys like PostgreSQL: NULL sorts after every value."""
+    return (1, 0) if value is None else (0, value)
+
+
+class ActiveGigIndex:
+    """Postings and sorted arrays over the active gigs."""
+
+    def __init__(self):
+        self.ready = False
+        self._gigs: Dict[UUID, GigResponse] = {}
+        self._tokens: Dict[str, Set[UUID]] = {}
+        self._lexemes: Dict[UUID, Tuple[str, ...]] = {}
+        # Search word -> its lexemes under the english configuration
+        self.vocabulary: Dict[str, Tuple[str, ...]] = {}
+        self._tags: Dict[str, Set[UUID]] = {}
+        self._postings: Dict[str, Dict[object, Set[UUID]]] = {
+            "category": {},
+            "subcategory": {},
+            "video_type": {},
+            "creator_profile_id": {},
+        }
+        self._sorted: Dict[str, List[Tuple[Tuple[int, object], UUID]]] = {
+            attribute: [] for attribute in SORT_FIELDS.values()
+        }
+
+    def __len__(self) -> int:
+        return len(self._gigs)
+
+    @classmethod
+    def build(
+        cls,
+        gigs: Iterable[GigResponse],
+        lexemes: Mapping[UUID, Sequence[str]],
+        vocabulary: Mapping[str, Sequence[str]]
+    ) -> "ActiveGigIndex":
+        """
+        Build an index from scratch.
+
+        Args:
+            gigs: Active gigs
+            lexemes: Lexemes of each gig's search vector
+            vocabulary: Lexemes of the words of the gigs
+
+        Returns:
+            New ActiveGigIndex (not yet marked ready)
+        """
+        index = cls()
+        index.learn(vocabulary)
+        for gig in gigs:
+            index._add(gig, lexemes.get(gig.id, ()), keep_sorted=False)
+        for entries in index._sorted.values():
+            entries.sort()
+        return index
+
+    def learn(self, vocabulary: Mapping[str, Sequence[str]]) -> None:
+        """
+        Add words to the search vocabulary.
+
+        Args:
+            vocabulary: Lexemes of each word
+        """
+        for word, lexemes in vocabulary.items():
+            self.vocabulary[word] = tuple(lexemes)
+
+    def _add(self, gig: GigResponse, lexemes: Sequence[str], keep_sorted: bool = True) -> None:
+        self._gigs[gig.id] = gig
+        self._lexemes[gig.id] = tuple(lexemes)
+
+        for lexeme in lexemes:
+            self._tokens.setdefault(lexeme, set()).add(gig.id)
+        for tag in gig.search_tags or []:
+            self._tags.setdefault(tag, set()).add(gig.id)
+        for field, postings in self._postings.items():
+            value = getattr(gig, field)
+            if value is not None:
+                postings.setdefault(value, set()).add(gig.id)
+
+        for attribute, entries in self._sorted.items():
+            entry = (_sort_key(getattr(gig, attribute)), gig.id)
+            if keep_sorted:
+                bisect.insort(entries, entry)
+            else:
+                entries.append(entry)
+
+    @staticmethod
+    def _discard(postings: Dict[object, Set[UUID]], key, gig_id: UUID) -> None:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(gig_id)
+            if not ids:
+                del postings[key]
+
+    def remove(self, gig_id: UUID) -> None:
+        """
+        Drop a gig from the index if present.
+
+        Args:
+            gig_id: Gig UUID
+        """
+        gig = self._gigs.pop(gig_id, None)
+        if gig is None:
+            return
+
+        for lexeme in self._lexemes.pop(gig_id, ()):
+            self._discard(self._tokens, lexeme, gig_id)
+        for tag in gig.search_tags or []:
+            self._discard(self._tags, tag, gig_id)
+        for field, postings in self._postings.items():
+            self._discard(postings, getattr(gig, field), gig_id)
+
+        for attribute, entries in self._sorted.items():
+            entry = (_sort_key(getattr(gig, attribute)), gig_id)
+            position = bisect.bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+
+    def upsert(self, gig: GigResponse, lexemes: Sequence[str]) -> None:
+        """
+        Insert or replace a gig; gigs that are no longer active are removed.
+
+        Args:
+            gig: Current state of the gig
+            lexemes: Lexemes of the gig's search vector
+        """
+        self.remove(gig.id)
+        if gig.status == GigStatus.active.value:
+            self._add(gig, lexemes)
+
+    def can_answer(self, filters: GigSearchFilters) -> bool:
+        """
+        Check whether a search can be answered from the index.
+
+        Args:
+            filters: Search and filter parameters
+
+        Returns:
+            True if the index is ready and covers the filter shape
+        """
+        if not self.ready:
+            return False
+        if filters.status != GigStatus.active or filters.sort_by not in SORT_FIELDS:
+            return False
+        if filters.package_min_price is not None or filters.package_max_price is not None:
+            return False
+        if filters.search:
+            return (
+                filters.search_mode == GigSearchMode.fulltext
+                and _PLAIN_SEARCH_RE.match(filters.search) is not None
+                and " or " not in f" {filters.search.lower()} "
+                and all(word in self.vocabulary for word in words(filters.search))
+            )
+        return True
+
+    def _range_ids(self, attribute: str, low, high) -> Set[UUID]:
+        entries = self._sorted[attribute]
+        start = 0 if low is None else bisect.bisect_left(entries, ((0, low),))
+        end = (
+            bisect.bisect_left(entries, ((1, 0),)) if high is None
+            else bisect.bisect_right(entries, ((0, high), UUID(int=(1 << 128) - 1)))
+        )
+        return {gig_id for _, gig_id in entries[start:end]}
+
+    def _candidates(self, filters: GigSearchFilters) -> Optional[Set[UUID]]:
+        """Return matching ids, or None when no filter narrows the set."""
+        sets: List[Set[UUID]] = []
+
+        for field in ("category", "subcategory", "video_type", "creator_profile_id"):
+            value = getattr(filters, field)
+            if value:
+                sets.append(self._postings[field].get(value, set()))
+
+        if filters.tags:
+            tagged: Set[UUID] = set()
+            for tag in filters.tags:
+                tagged |= self._tags.get(tag, set())
+            sets.append(tagged)
+
+        if filters.search:
+            lexemes = {
+                lexeme for word in words(filters.search) for lexeme in self.vocabulary[word]
+            }
+            if not lexemes:
+                # Only stopwords: the SQL tsquery is empty and matches nothing
+                return set()
+            sets.extend(self._tokens.get(lexeme, set()) for lexeme in lexemes)
+
+        if filters.min_price is not None or filters.max_price is not None:
+            sets.append(self._range_ids("basic_price", filters.min_price, filters.max_price))
+
+        if not sets:
+            return None
+
+        sets.sort(key=len)
+        candidates = set(sets[0])
+        for other in sets[1:]:
+            candidates &= other
+            if not candidates:
+                break
+        return candidates
+
+    def query(self, filters: GigSearchFilters) -> GigsListResponse:
+        """
+        Answer a gig listing from the index (see can_answer).
+
+        Ordering, ties and cursors match the SQL listing, so cursors can be
+        used across both paths.
+
+        Args:
+            filters: Search and filter parameters
+
+        Returns:
+            GigsListResponse
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or for another sort
+        """
+        attribute = SORT_FIELDS[filters.sort_by]
+        entries = self._sorted[attribute]
+        descending = filters.sort_order == "desc"
+        candidates = self._candidates(filters)
+        total = len(self._gigs) if candidates is None else len(candidates)
+
+        # Few candidates: sort them directly instead of walking the array
+        if candidates is not None and len(candidates) * 8 < len(entries):
+            ordered = sorted(
+                (_sort_key(getattr(self._gigs[gig_id], attribute)), gig_id)
+                for gig_id in candidates
+            )
+            candidates = None
+        else:
+            ordered = entries
+
+        if filters.cursor:
+            value, last_id = decode_cursor(
+                filters.cursor,
+                filters.sort_by,
+                filters.sort_order,
+                gig_crud.gig_sort_column(filters),
+            )
+            position = (_sort_key(value), last_id)
+            if descending:
+                start = bisect.bisect_left(ordered, position) - 1
+            else:
+                start = bisect.bisect_right(ordered, position)
+            skip = 0
+        else:
+            start = len(ordered) - 1 if descending else 0
+            skip = filters.skip
+
+        step = -1 if descending else 1
+        page: List[GigResponse] = []
+        position = start
+        while 0 <= position < len(ordered) and len(page) <= filters.limit:
+            gig_id = ordered[position][1]
+            position += step
+            if candidates is not None and gig_id not in candidates:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            page.append(self._gigs[gig_id])
+
+        has_more = len(page) > filters.limit
+        page = page[:filters.limit]
+        next_cursor = None
+        if has_more:
+            last = page[-1]
+            next_cursor = encode_cursor(
+                filters.sort_by, filters.sort_order, getattr(last, attribute), last.id
+            )
+
+        return GigsListResponse(
+            gigs=page,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=next_cursor
+        )
+
+
+class GigIndexListener:
+    """Keeps an ActiveGigIndex current from gig change notifications."""
+
+    def __init__(self):
+        self.index = ActiveGigIndex()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start listening in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and mark the index as not ready."""
+        self.index.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            self._queue.put_nowait(UUID(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed gig change payload: %r", payload)
+
+    async def _reload(self) -> None:
+        """Replace the index with a fresh snapshot of active gigs."""
+        # Notifications queued so far are covered by the snapshot
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        async with AsyncSessionLocal() as db:
+            gigs = await gig_crud.get_active_gigs(db)
+            responses = [GigResponse.model_validate(gig) for gig in gigs]
+            lexemes = await gig_crud.get_gig_lexemes(db)
+            vocabulary = await gig_crud.get_word_lexemes(
+                db, sorted(set().union(*map(gig_words, responses)))
+            )
+
+        index = await asyncio.to_thread(ActiveGigIndex.build, responses, lexemes, vocabulary)
+        index.ready = True
+        self.index = index
+        logger.info("Loaded %d active gigs into the in-process index", len(index))
+
+    async def _apply(self, gig_ids: Set[UUID]) -> None:
+        """Re-read changed gigs and update the index."""
+        async with AsyncSessionLocal() as db:
+            gigs = await gig_crud.get_gigs_by_ids(db, list(gig_ids))
+            responses = [GigResponse.model_validate(gig) for gig in gigs]
+            lexemes = await gig_crud.get_gig_lexemes(db, [response.id for response in responses])
+            new_words = set().union(*map(gig_words, responses)) - self.index.vocabulary.keys()
+            vocabulary = await gig_crud.get_word_lexemes(db, sorted(new_words))
+
+        self.index.learn(vocabulary)
+        found = set()
+        for response in responses:
+            found.add(response.id)
+            self.index.upsert(response, lexemes.get(response.id, ()))
+        for gig_id in gig_ids - found:
+            self.index.remove(gig_id)
+
+    async def _consume(self, connection) -> None:
+        """Apply notifications in batches until the connection closes."""
+        reloaded_at = time.monotonic()
+        while not connection.is_closed():
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                if time.monotonic() - reloaded_at > settings.GIG_INDEX_RELOAD_SECONDS:
+                    await self._reload()
+                    reloaded_at = time.monotonic()
+                continue
+
+            # Coalesce bursts (bulk updates notify once per row)
+            await asyncio.sleep(settings.GIG_INDEX_BATCH_WINDOW_MS / 1000)
+            gig_ids = {first}
+            while not self._queue.empty():
+                gig_ids.add(self._queue.get_nowait())
+            await self._apply(gig_ids)
+
+    async def _run(self) -> None:
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(settings.GIG_INDEX_CHANNEL, self._on_notify)
+                await self._reload()
+                delay = 1.0
+                await self._consume(connection)
+                logger.warning("Gig index listener connection closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Gig index listener failed; retrying in %.0fs", delay)
+            finally:
+                self.index.ready = False
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+
+gig_index_listener = GigIndexListener()
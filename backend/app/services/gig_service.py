@@ -1,19 +1,61 @@
 """Business logic for gig operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from uuid import UUID
 import re
 from datetime import datetime
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import gig as gig_crud
 from app.schemas.gig import (
     GigCreate, GigUpdate, GigResponse, GigsListResponse,
-    GigSearchFilters, GigPackageResponse
+    GigSearchFilters, GigPackageResponse, GigFacetsResponse
 )
+from app.schemas.facet import FacetCount, RangeFacetCount
 from app.models.gig import Gig
+from app.core.cache import ResponseCache
+from app.services.gig_index import gig_index_listener
+from app.services.suggest_service import gig_suggestions
+from app.services.view_counter import gig_view_counter
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.schemas.export import ExportFormat
+from app.utils.export import encode_export
+from app.utils.facets import bucket_range, top_values
+from app.utils.pagination import InvalidCursorError
+
+# Cached GigsListResponse pages and facet counts, invalidated on every gig write
+gig_list_cache = ResponseCache("gigs:list", ttl=settings.LISTING_CACHE_TTL)
+gig_facets_cache = ResponseCache("gigs:facets", ttl=settings.LISTING_CACHE_TTL)
+
+# Maximum number of tag values returned by the facets endpoint
+FACET_TAG_LIMIT = 30
+
+# Slug allocations tried before giving up on concurrent inserts of the same title
+SLUG_ALLOCATION_ATTEMPTS = 3
+
+# Search filter fields that only select a page or its order
+PAGE_FIELDS = {"skip", "limit", "cursor", "sort_by", "sort_order"}
+
+
+async def invalidate_gig_listings(db: AsyncSession) -> None:
+    """
+    Commit pending gig changes and drop cached gig listings and facets.
+
+    The commit happens first so a concurrent cache miss cannot re-cache a
+    page read before the write became visible. The autocomplete index is
+    marked stale as well.
+
+    Args:
+        db: Database session holding the write
+    """
+    await db.commit()
+    await gig_list_cache.invalidate()
+    await gig_facets_cache.invalidate()
+    gig_suggestions.mark_stale()
 
 
 def generate_slug(title: str, creator_id: UUID) -> str:
@@ -49,24 +91,119 @@ async def list_gigs(
     """
     List gigs with pagination, search, and filters.
 
+    Common browse queries are answered from the in-process gig index when it
+    is enabled. Otherwise responses are served from the listing cache when
+    possible; concurrent misses for the same parameters share a single
+    database query.
+
     Args:
         db: Database session
         filters: Search and filter parameters
 
     Returns:
         GigsListResponse with gigs and pagination info
+
+    Raises:
+        HTTPException: If the pagination cursor is invalid
     """
-    gigs, total = await gig_crud.list_gigs(db, filters)
+    index = gig_index_listener.index
+    if settings.GIG_MEMORY_INDEX_ENABLED and index.can_answer(filters):
+        try:
+            return index.query(filters)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    async def load() -> GigsListResponse:
+        try:
+            gigs, total, next_cursor = await gig_crud.list_gigs(db, filters)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Convert to response models
+        gig_responses = [GigResponse.model_validate(gig) for gig in gigs]
+
+        return GigsListResponse(
+            gigs=gig_responses,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
+        )
 
-    # Convert to response models
-    gig_responses = [GigResponse.model_validate(gig) for gig in gigs]
+    return await gig_list_cache.get_or_load(filters.model_dump(), GigsListResponse, load)
 
-    return GigsListResponse(
-        gigs=gig_responses,
-        total=total,
-        skip=filters.skip,
-        limit=filters.limit,
-        has_more=(filters.skip + filters.limit) < total
+
+async def export_gigs(filters: GigSearchFilters, export_format: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Export every gig matching the search filters as NDJSON or CSV.
+
+    The body is produced while it is being sent, so it reads from a session
+    of its own rather than the request's. The first batch is read before
+    this returns, so query errors surface as a regular error response.
+
+    Args:
+        filters: Search and filter parameters (pagination fields are ignored)
+        export_format: Output encoding
+
+    Returns:
+        Async iterator over chunks of the response body
+    """
+    async def batches() -> AsyncIterator[List[GigResponse]]:
+        async with AsyncSessionLocal() as db:
+            async for gigs in gig_crud.stream_gigs(db, filters, settings.EXPORT_BATCH_SIZE):
+                yield [GigResponse.model_validate(gig) for gig in gigs]
+
+    return await encode_export(batches(), GigResponse, export_format)
+
+
+async def get_gig_facets(
+    db: AsyncSession,
+    filters: GigSearchFilters
+) -> GigFacetsResponse:
+    """
+    Get per-facet gig counts for the filter panel.
+
+    Cached like the listings and invalidated together with them.
+
+    Args:
+        db: Database session
+        filters: Current search and filter parameters
+
+    Returns:
+        GigFacetsResponse
+    """
+    async def load() -> GigFacetsResponse:
+        total, facets = await gig_crud.get_gig_facets(db, filters)
+
+        def values(name: str, limit: Optional[int] = None) -> List[FacetCount]:
+            return [
+                FacetCount(value=value, count=count)
+                for value, count in top_values(facets[name], limit)
+            ]
+
+        price_ranges = []
+        for index, count in sorted(facets["price_range"].items()):
+            lower, upper = bucket_range(index)
+            price_ranges.append(RangeFacetCount(min=lower, max=upper, count=count))
+
+        return GigFacetsResponse(
+            total=total,
+            categories=values("category"),
+            subcategories=values("subcategory"),
+            video_types=values("video_type"),
+            price_ranges=price_ranges,
+            tags=values("tags", FACET_TAG_LIMIT)
+        )
+
+    return await gig_facets_cache.get_or_load(
+        filters.model_dump(exclude=PAGE_FIELDS), GigFacetsResponse, load
     )
 
 
@@ -97,11 +234,15 @@ async def get_gig_by_id(
             detail="Gig not found"
         )
 
-    # Increment view count if requested
+    response = GigResponse.model_validate(gig)
+
+    # Views are buffered and written in batches; include this process's
+    # unflushed views so the viewer sees their own view counted
     if increment_views:
-        gig = await gig_crud.increment_view_count(db, gig)
+        gig_view_counter.record(gig.id)
+    response.view_count = (gig.view_count or 0) + gig_view_counter.unflushed(gig.id)
 
-    return GigResponse.model_validate(gig)
+    return response
 
 
 async def get_gig_packages(
@@ -182,23 +323,31 @@ async def create_gig(
     Raises:
         HTTPException: If validation fails
     """
-    # Generate slug
     base_slug = generate_slug(gig_data.title, creator_profile_id)
-    slug = base_slug
-
-    # Ensure slug is unique
-    counter = 1
-    while await gig_crud.check_slug_exists(db, slug):
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
-    # Create gig
-    gig = await gig_crud.create_gig(
-        db=db,
-        gig_data=gig_data,
-        creator_profile_id=creator_profile_id,
-        slug=slug
-    )
+
+    # Allocate a free slug in one query; a concurrent request may claim the
+    # same slug first, in which case the unique constraint fails and we retry
+    for _ in range(SLUG_ALLOCATION_ATTEMPTS):
+        [slug] = await gig_crud.allocate_slugs(db, [base_slug])
+        try:
+            async with db.begin_nested():
+                gig = await gig_crud.create_gig(
+                    db=db,
+                    gig_data=gig_data,
+                    creator_profile_id=creator_profile_id,
+                    slug=slug
+                )
+            break
+        except IntegrityError:
+            if not await gig_crud.check_slug_exists(db, slug):
+                raise
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Could not allocate a unique slug, please retry"
+        )
+
+    await invalidate_gig_listings(db)
 
     return GigResponse.model_validate(gig)
 
@@ -241,6 +390,7 @@ async def update_gig(
 
     # Update gig
     updated_gig = await gig_crud.update_gig(db, gig, gig_update)
+    await invalidate_gig_listings(db)
 
     return GigResponse.model_validate(updated_gig)
 
@@ -288,6 +438,7 @@ async def delete_gig(
 
     # Delete gig
     await gig_crud.delete_gig(db, gig)
+    await invalidate_gig_listings(db)
 
     return {"message": "Gig deleted successfully"}
 
@@ -0,0 +1,242 @@
+"""Creator–project matching.
+
+Every open project and every available creator has a sparse term vector
+(skills and categories, see app.models.match). Matches are precomputed: each
+project's top ``MATCH_TOP_K`` creators and each creator's top ``MATCH_TOP_K``
+projects are stored in ``project_matches``, so both recommendation endpoints
+are a single indexed read.
+
+A full recompute scores ``MATCH_BATCH_SIZE`` projects (then creators) per SQL
+statement. After that, triggers queue every project or creator whose inputs
+change and the background refresher re-scores only those: their own lists
+are rebuilt, and they are merged into the counterpart lists they now rank in.
+A counterpart that loses an entry keeps a shorter list until the next full
+recompute; the remaining entries are still its best matches.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import match as match_crud
+from app.crud import project as project_crud
+from app.db.base import AsyncSessionLocal
+from app.schemas.creator import CreatorMatch
+from app.schemas.project import (
+    ProjectCreatorMatchesResponse,
+    RecommendedProject,
+    RecommendedProjectsResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock held exclusively by a full recompute and shared by refreshes
+MATCH_LOCK_KEY = 0x6D61746368  # "match"
+
+
+async def recompute_all_matches(db: AsyncSession) -> Optional[int]:
+    """
+    Rebuild every term vector and every stored match.
+
+    Runs in the caller's transaction: readers keep seeing the previous
+    matches until it commits.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of match rows written, or None if another recompute or
+        refresh holds the lock
+    """
+    if not await db.scalar(select(func.pg_try_advisory_xact_lock(MATCH_LOCK_KEY))):
+        return None
+
+    # Changes queued so far are covered by the rebuild below
+    await match_crud.clear_refresh_queue(db, await db.scalar(select(func.now())))
+
+    await match_crud.rebuild_project_vectors(db)
+    await match_crud.rebuild_creator_vectors(db)
+    await match_crud.delete_all_matches(db)
+
+    written = 0
+    for entity, store in (
+        ("project", match_crud.store_project_top_matches),
+        ("creator", match_crud.store_creator_top_matches),
+    ):
+        after = None
+        while True:
+            ids = await match_crud.get_vector_ids_page(db, entity, after, settings.MATCH_BATCH_SIZE)
+            if not ids:
+                break
+            written += await store(db, ids, settings.MATCH_TOP_K)
+            after = ids[-1]
+
+    return written
+
+
+async def refresh_matches(
+    db: AsyncSession,
+    project_ids: Sequence[UUID] = (),
+    creator_ids: Sequence[UUID] = ()
+) -> None:
+    """
+    Re-score changed projects and creators.
+
+    Args:
+        db: Database session
+        project_ids: Projects whose status, category, skills, budget or
+            experience level changed
+        creator_ids: Creators whose skills, categories, rate, experience or
+            availability changed
+    """
+    k = settings.MATCH_TOP_K
+
+    if project_ids:
+        project_ids = list(project_ids)
+        await match_crud.rebuild_project_vectors(db, project_ids)
+        await match_crud.delete_matches(db, project_ids=project_ids)
+        await match_crud.store_project_top_matches(db, project_ids, k)
+        await match_crud.merge_into_other_side(db, k, project_ids=project_ids)
+
+    if creator_ids:
+        creator_ids = list(creator_ids)
+        await match_crud.rebuild_creator_vectors(db, creator_ids)
+        await match_crud.delete_matches(db, creator_ids=creator_ids)
+        await match_crud.store_creator_top_matches(db, creator_ids, k)
+        await match_crud.merge_into_other_side(db, k, creator_ids=creator_ids)
+
+
+async def refresh_queued_matches(db: AsyncSession) -> int:
+    """
+    Apply one batch of queued changes.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of queued projects and creators refreshed
+    """
+    if not await db.scalar(select(func.pg_try_advisory_xact_lock_shared(MATCH_LOCK_KEY))):
+        return 0  # A full recompute is running and will cover the queue
+
+    project_ids, creator_ids = await match_crud.claim_refresh_queue(db, settings.MATCH_REFRESH_BATCH)
+    await refresh_matches(db, project_ids, creator_ids)
+    return len(project_ids) + len(creator_ids)
+
+
+# ============================================================================
+# Background refresher
+# ============================================================================
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_periodically() -> None:
+    bootstrapped = False
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                if not bootstrapped and not await match_crud.has_matches(db):
+                    written = await recompute_all_matches(db)
+                    if written is not None:
+                        logger.info("Computed %d creator-project matches", written)
+                else:
+                    await refresh_queued_matches(db)
+                await db.commit()
+            bootstrapped = True
+        except Exception:
+            logger.exception("Failed to refresh creator-project matches; will retry")
+
+        await asyncio.sleep(settings.MATCH_REFRESH_SECONDS)
+
+
+def start_match_refresher() -> None:
+    """Start the background match refresh loop."""
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_periodically())
+
+
+async def stop_match_refresher() -> None:
+    """Stop the background match refresh loop."""
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+async def get_recommended_projects(
+    db: AsyncSession,
+    creator_profile_id: UUID,
+    limit: int = 20
+) -> RecommendedProjectsResponse:
+    """
+    Get the open projects that best match a creator.
+
+    Args:
+        db: Database session
+        creator_profile_id: Creator profile UUID
+        limit: Maximum number of projects
+
+    Returns:
+        RecommendedProjectsResponse, best match first
+    """
+    rows = await match_crud.get_recommended_projects(db, creator_profile_id, limit)
+
+    projects: List[RecommendedProject] = [
+        RecommendedProject.model_validate({
+            **row[0]._asdict(),
+            "client": row[0].client._asdict(),
+            "match_score": row.match_score,
+        })
+        for row in rows
+    ]
+    return RecommendedProjectsResponse(projects=projects)
+
+
+async def get_project_matches(
+    db: AsyncSession,
+    project_id: UUID,
+    limit: int = 20
+) -> ProjectCreatorMatchesResponse:
+    """
+    Get the creators that best match a project.
+
+    Args:
+        db: Database session
+        project_id: Project UUID
+        limit: Maximum number of creators
+
+    Returns:
+        ProjectCreatorMatchesResponse, best match first
+
+    Raises:
+        HTTPException: If project not found
+    """
+    rows = await match_crud.get_matched_creators(db, project_id, limit)
+
+    if not rows and not await project_crud.get_project_by_id(db, project_id, include_client=False):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    creators = [
+        CreatorMatch.model_validate({**row.creator._asdict(), "match_score": row.match_score})
+        for row in rows
+    ]
+    return ProjectCreatorMatchesResponse(creators=creators)
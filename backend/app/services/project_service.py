@@ -1,19 +1,100 @@
 """Business logic for project operations."""
 
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 import math
 
 from fastapi import HTTPException, status
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import project as project_crud
+from app.core.cache import ResponseCache
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.services.view_counter import project_view_counter
+from app.utils.pagination import InvalidCursorError
 from app.schemas.project import (
     ProjectWithClient,
     ProjectSearchFilters,
     ProjectsListResponse,
+    ProjectFacetsResponse,
     ClientSummary
 )
+from app.schemas.export import ExportFormat
+from app.schemas.facet import FacetCount, RangeFacetCount
+from app.utils.export import encode_export
+from app.utils.facets import bucket_range, top_values
+from app.utils.geo import parse_lat_lon
+
+# Cached ProjectsListResponse pages and facet counts; entries expire after
+# LISTING_CACHE_TTL
+project_list_cache = ResponseCache("projects:list", ttl=settings.LISTING_CACHE_TTL)
+project_facets_cache = ResponseCache("projects:facets", ttl=settings.LISTING_CACHE_TTL)
+
+# Maximum number of skill values returned by the facets endpoint
+FACET_SKILL_LIMIT = 30
+
+# Search filter fields that only select a page or its order
+PAGE_FIELDS = {"skip", "limit", "cursor", "sort_by", "sort_order"}
+
+# Radius used when `near` is given without `radius_km`
+DEFAULT_NEAR_RADIUS_KM = 10.0
+
+
+def resolve_location(
+    filters: ProjectSearchFilters
+) -> Tuple[Optional[Tuple[float, float]], Optional[float]]:
+    """
+    Validate the distance search parameters of a project query.
+
+    Args:
+        filters: Search and filter parameters
+
+    Returns:
+        Tuple of ((latitude, longitude) or None, radius in km or None)
+
+    Raises:
+        HTTPException: If near is malformed, or radius_km or distance sorting
+            is requested without near
+    """
+    if filters.near is None:
+        if filters.radius_km is not None or filters.sort_by == "distance":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="radius_km and sort_by=distance require near=lat,lon"
+            )
+        return None, None
+
+    try:
+        near = parse_lat_lon(filters.near)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return near, filters.radius_km or DEFAULT_NEAR_RADIUS_KM
+
+
+def project_response(row: Row, client: Optional[ClientSummary] = None) -> ProjectWithClient:
+    """
+    Build a ProjectWithClient from a row of PROJECT_WITH_CLIENT_COLUMNS.
+
+    Rows are validated as dicts: pydantic's attribute-based validation probes
+    every field alias with getattr and is several times slower.
+
+    Args:
+        row: Project row with its nested client row
+        client: Already built summary of the row's client, reused instead of
+            validating row.client again
+
+    Returns:
+        ProjectWithClient
+    """
+    return ProjectWithClient.model_validate(
+        {**row._asdict(), "client": client or row.client._asdict()}
+    )
 
 
 async def list_projects(
@@ -23,85 +104,170 @@ async def list_projects(
     """
     List projects with pagination, search, and filters.
 
+    Responses are served from the listing cache when possible; concurrent
+    misses for the same parameters share a single database query.
+
     Args:
         db: Database session
         filters: Search and filter parameters
 
     Returns:
         ProjectsListResponse with projects and pagination info
+
+    Raises:
+        HTTPException: If the pagination cursor or location parameters are invalid
     """
-    projects, total = await project_crud.list_projects(
-        db,
-        status=filters.status,
-        category=filters.category,
-        video_type=filters.video_type,
-        experience_level=filters.experience_level,
-        min_budget=filters.min_budget,
-        max_budget=filters.max_budget,
-        search=filters.search,
-        client_profile_id=filters.client_profile_id,
-        sort_by=filters.sort_by,
-        sort_order=filters.sort_order,
-        skip=filters.skip,
-        limit=filters.limit
-    )
+    near, radius_km = resolve_location(filters)
 
-    # Convert to response models with nested client data
-    project_responses = []
-    for project in projects:
-        # Create client summary from nested relationship
-        client_summary = ClientSummary(
-            id=project.client.id,
-            user_id=project.client.user_id,
-            company_name=project.client.company_name,
-            company_logo_url=project.client.company_logo_url,
-            industry=project.client.industry,
-            website_url=project.client.website_url,
-            is_verified=project.client.is_verified,
-            total_jobs_posted=project.client.total_jobs_posted,
-            average_rating=project.client.average_rating,
-            total_reviews=project.client.total_reviews,
-            description=project.client.description
+    async def load() -> ProjectsListResponse:
+        try:
+            projects, total, next_cursor = await project_crud.list_projects(
+                db,
+                status=filters.status,
+                category=filters.category,
+                video_type=filters.video_type,
+                experience_level=filters.experience_level,
+                min_budget=filters.min_budget,
+                max_budget=filters.max_budget,
+                budget_mode=filters.budget_mode,
+                near=near,
+                radius_km=radius_km,
+                search=filters.search,
+                client_profile_id=filters.client_profile_id,
+                sort_by=filters.sort_by,
+                sort_order=filters.sort_order,
+                skip=filters.skip,
+                limit=filters.limit,
+                cursor=filters.cursor
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        project_responses = [project_response(project) for project in projects]
+
+        # Calculate pagination info
+        page = (filters.skip // filters.limit) + 1
+        total_pages = math.ceil(total / filters.limit) if total > 0 else 0
+
+        return ProjectsListResponse(
+            projects=project_responses,
+            total=total,
+            page=page,
+            page_size=filters.limit,
+            total_pages=total_pages,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
         )
 
-        # Create project response with client
-        project_response = ProjectWithClient(
-            id=project.id,
-            client_profile_id=project.client_profile_id,
-            title=project.title,
-            description=project.description,
-            category=project.category,
-            video_type=project.video_type,
-            video_duration_preference=project.video_duration_preference,
-            platform_preference=project.platform_preference,
-            budget_type=project.budget_type,
-            budget_min=project.budget_min,
-            budget_max=project.budget_max,
-            deadline_date=project.deadline_date,
-            estimated_duration_days=project.estimated_duration_days,
-            required_skills=project.required_skills,
-            experience_level=project.experience_level,
-            view_count=project.view_count,
-            proposal_count=project.proposal_count,
-            status=project.status,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            published_at=project.published_at,
-            closed_at=project.closed_at,
-            client=client_summary
+    return await project_list_cache.get_or_load(
+        filters.model_dump(), ProjectsListResponse, load
+    )
+
+
+async def export_projects(filters: ProjectSearchFilters, export_format: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Export every project matching the search filters as NDJSON or CSV.
+
+    The body is produced while it is being sent, so it reads from a session
+    of its own rather than the request's. The first batch is read before
+    this returns, so query errors surface as a regular error response.
+
+    Args:
+        filters: Search and filter parameters (pagination fields are ignored)
+        export_format: Output encoding
+
+    Returns:
+        Async iterator over chunks of the response body
+
+    Raises:
+        HTTPException: If the location parameters are invalid
+    """
+    near, radius_km = resolve_location(filters)
+
+    async def batches() -> AsyncIterator[List[ProjectWithClient]]:
+        async with AsyncSessionLocal() as db:
+            async for rows in project_crud.stream_projects(
+                db,
+                status=filters.status,
+                category=filters.category,
+                video_type=filters.video_type,
+                experience_level=filters.experience_level,
+                min_budget=filters.min_budget,
+                max_budget=filters.max_budget,
+                budget_mode=filters.budget_mode,
+                near=near,
+                radius_km=radius_km,
+                search=filters.search,
+                client_profile_id=filters.client_profile_id,
+                sort_by=filters.sort_by,
+                sort_order=filters.sort_order,
+                batch_size=settings.EXPORT_BATCH_SIZE
+            ):
+                yield [project_response(row) for row in rows]
+
+    return await encode_export(batches(), ProjectWithClient, export_format)
+
+
+async def get_project_facets(
+    db: AsyncSession,
+    filters: ProjectSearchFilters
+) -> ProjectFacetsResponse:
+    """
+    Get per-facet project counts for the filter panel.
+
+    Args:
+        db: Database session
+        filters: Current search and filter parameters
+
+    Returns:
+        ProjectFacetsResponse
+
+    Raises:
+        HTTPException: If the location parameters are invalid
+    """
+    near, radius_km = resolve_location(filters)
+
+    async def load() -> ProjectFacetsResponse:
+        total, facets = await project_crud.get_project_facets(
+            db,
+            status=filters.status,
+            category=filters.category,
+            video_type=filters.video_type,
+            experience_level=filters.experience_level,
+            min_budget=filters.min_budget,
+            max_budget=filters.max_budget,
+            budget_mode=filters.budget_mode,
+            near=near,
+            radius_km=radius_km,
+            search=filters.search,
+            client_profile_id=filters.client_profile_id
         )
-        project_responses.append(project_response)
 
-    # Calculate pagination info
-    page = (filters.skip // filters.limit) + 1
-    total_pages = math.ceil(total / filters.limit) if total > 0 else 0
+        def values(name: str, limit: Optional[int] = None) -> List[FacetCount]:
+            return [
+                FacetCount(value=value, count=count)
+                for value, count in top_values(facets[name], limit)
+            ]
 
-    return ProjectsListResponse(
-        projects=project_responses,
-        total=total,
-        page=page,
-        page_size=filters.limit,
-        total_pages=total_pages
+        budget_ranges = []
+        for index, count in sorted(facets["budget_range"].items()):
+            lower, upper = bucket_range(index)
+            budget_ranges.append(RangeFacetCount(min=lower, max=upper, count=count))
+
+        return ProjectFacetsResponse(
+            total=total,
+            categories=values("category"),
+            video_types=values("video_type"),
+            experience_levels=values("experience_level"),
+            budget_ranges=budget_ranges,
+            skills=values("skills", FACET_SKILL_LIMIT)
+        )
+
+    return await project_facets_cache.get_or_load(
+        filters.model_dump(exclude=PAGE_FIELDS), ProjectFacetsResponse, load
     )
 
 
@@ -124,7 +290,7 @@ async def get_project_by_id(
     Raises:
         HTTPException: If project not found
     """
-    project = await project_crud.get_project_by_id(db, project_id, include_client=True)
+    project = await project_crud.get_project_with_client(db, project_id)
 
     if not project:
         raise HTTPException(
@@ -132,51 +298,15 @@ async def get_project_by_id(
             detail="Project not found"
         )
 
-    # Increment view count if requested
+    response = project_response(project)
+
+    # Views are buffered and written in batches; include this process's
+    # unflushed views so the viewer sees their own view counted
     if increment_views:
-        project = await project_crud.increment_view_count(db, project)
-
-    # Create client summary
-    client_summary = ClientSummary(
-        id=project.client.id,
-        user_id=project.client.user_id,
-        company_name=project.client.company_name,
-        company_logo_url=project.client.company_logo_url,
-        industry=project.client.industry,
-        website_url=project.client.website_url,
-        is_verified=project.client.is_verified,
-        total_jobs_posted=project.client.total_jobs_posted,
-        average_rating=project.client.average_rating,
-        total_reviews=project.client.total_reviews,
-        description=project.client.description
-    )
+        project_view_counter.record(project.id)
+    response.view_count = (project.view_count or 0) + project_view_counter.unflushed(project.id)
 
-    # Create project response
-    return ProjectWithClient(
-        id=project.id,
-        client_profile_id=project.client_profile_id,
-        title=project.title,
-        description=project.description,
-        category=project.category,
-        video_type=project.video_type,
-        video_duration_preference=project.video_duration_preference,
-        platform_preference=project.platform_preference,
-        budget_type=project.budget_type,
-        budget_min=project.budget_min,
-        budget_max=project.budget_max,
-        deadline_date=project.deadline_date,
-        estimated_duration_days=project.estimated_duration_days,
-        required_skills=project.required_skills,
-        experience_level=project.experience_level,
-        view_count=project.view_count,
-        proposal_count=project.proposal_count,
-        status=project.status,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        published_at=project.published_at,
-        closed_at=project.closed_at,
-        client=client_summary
-    )
+    return response
 
 
 async def get_client_projects(
@@ -189,6 +319,8 @@ async def get_client_projects(
     """
     Get all projects for a specific client.
 
+    The page and its client are loaded in one query.
+
     Args:
         db: Database session
         client_profile_id: Client profile UUID
@@ -199,53 +331,15 @@ async def get_client_projects(
     Returns:
         ProjectsListResponse
     """
-    projects, total = await project_crud.get_projects_by_client(
+    projects, total, has_more = await project_crud.get_projects_by_client(
         db, client_profile_id, skip, limit, status
     )
 
-    # Convert to response models
+    # Every row belongs to the same client: build its summary once and share it
     project_responses = []
-    for project in projects:
-        client_summary = ClientSummary(
-            id=project.client.id,
-            user_id=project.client.user_id,
-            company_name=project.client.company_name,
-            company_logo_url=project.client.company_logo_url,
-            industry=project.client.industry,
-            website_url=project.client.website_url,
-            is_verified=project.client.is_verified,
-            total_jobs_posted=project.client.total_jobs_posted,
-            average_rating=project.client.average_rating,
-            total_reviews=project.client.total_reviews,
-            description=project.client.description
-        )
-
-        project_response = ProjectWithClient(
-            id=project.id,
-            client_profile_id=project.client_profile_id,
-            title=project.title,
-            description=project.description,
-            category=project.category,
-            video_type=project.video_type,
-            video_duration_preference=project.video_duration_preference,
-            platform_preference=project.platform_preference,
-            budget_type=project.budget_type,
-            budget_min=project.budget_min,
-            budget_max=project.budget_max,
-            deadline_date=project.deadline_date,
-            estimated_duration_days=project.estimated_duration_days,
-            required_skills=project.required_skills,
-            experience_level=project.experience_level,
-            view_count=project.view_count,
-            proposal_count=project.proposal_count,
-            status=project.status,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            published_at=project.published_at,
-            closed_at=project.closed_at,
-            client=client_summary
-        )
-        project_responses.append(project_response)
+    if projects:
+        client = ClientSummary.model_validate(projects[0].client._asdict())
+        project_responses = [project_response(project, client) for project in projects]
 
     page = (skip // limit) + 1
     total_pages = math.ceil(total / limit) if total > 0 else 0
@@ -255,5 +349,6 @@ async def get_client_projects(
         total=total,
         page=page,
         page_size=limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        has_more=has_more
     )
@@ -0,0 +1,134 @@
+"""Proposal submission and proposal counter maintenance.
+
+``projects.proposal_count`` is maintained by the submission statement itself
+(see ``proposal_crud.submit_proposal``): the proposal insert and the counter
+increment run as one statement, and the transaction commits straight away.
+Concurrent proposals to the same project therefore queue on its row lock
+only for the duration of that statement and commit, not for the rest of the
+request, so a burst on a popular project stays a short, ordered sequence of
+single-row increments.
+
+Counters can still drift (proposals deleted or inserted by hand, restored
+backups); a background job corrects them in bulk.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import proposal as proposal_crud
+from app.db.base import AsyncSessionLocal
+from app.schemas.project import ProposalCreate, ProposalSubmitted
+
+logger = logging.getLogger(__name__)
+
+
+async def submit_proposal(
+    db: AsyncSession,
+    proposal_data: ProposalCreate,
+    creator_profile_id: UUID
+) -> ProposalSubmitted:
+    """
+    Submit a proposal for an open project.
+
+    Args:
+        db: Database session
+        proposal_data: Proposal submission data
+        creator_profile_id: Submitting creator's profile UUID
+
+    Returns:
+        ProposalSubmitted with the project's updated proposal count
+
+    Raises:
+        HTTPException: If project not found, not open, or the creator
+            already submitted a proposal for it
+    """
+    values: Dict[str, Any] = proposal_data.model_dump(mode="json", exclude={"job_id"})
+    values["proposed_budget"] = proposal_data.proposed_budget
+
+    row = await proposal_crud.submit_proposal(db, proposal_data.job_id, creator_profile_id, values)
+    if row is not None:
+        # Release the project's row lock now rather than after the response
+        await db.commit()
+        return ProposalSubmitted.model_validate({
+            **row._asdict(),
+            "project_proposal_count": row.proposal_count,
+        })
+
+    state = await proposal_crud.get_submission_state(db, proposal_data.job_id, creator_profile_id)
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    if state.already_submitted:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already submitted a proposal for this project"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Project is not open for proposals"
+    )
+
+
+async def reconcile_proposal_counts() -> int:
+    """
+    Recompute every project's proposal_count, one batch per transaction.
+
+    Returns:
+        Number of projects whose counter was corrected
+    """
+    corrected = 0
+    after: Optional[UUID] = None
+    while True:
+        async with AsyncSessionLocal() as db:
+            after, batch_corrected = await proposal_crud.reconcile_proposal_counts(
+                db, after, settings.PROPOSAL_COUNT_RECONCILE_BATCH
+            )
+            await db.commit()
+        corrected += batch_corrected
+        if after is None:
+            return corrected
+
+
+# ============================================================================
+# Background reconciler
+# ============================================================================
+
+_reconcile_task: Optional[asyncio.Task] = None
+
+
+async def _reconcile_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.PROPOSAL_COUNT_RECONCILE_SECONDS)
+        try:
+            corrected = await reconcile_proposal_counts()
+            if corrected:
+                logger.warning("Corrected proposal_count drift on %d projects", corrected)
+        except Exception:
+            logger.exception("Failed to reconcile proposal counts; will retry")
+
+
+def start_proposal_count_reconciler() -> None:
+    """Start the background proposal counter reconciliation loop."""
+    global _reconcile_task
+    if _reconcile_task is None:
+        _reconcile_task = asyncio.create_task(_reconcile_periodically())
+
+
+async def stop_proposal_count_reconciler() -> None:
+    """Stop the background proposal counter reconciliation loop."""
+    global _reconcile_task
+    if _reconcile_task is not None:
+        _reconcile_task.cancel()
+        try:
+            await _reconcile_task
+        except asyncio.CancelledError:
+            pass
+        _reconcile_task = None
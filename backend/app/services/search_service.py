@@ -0,0 +1,47 @@
+"""Business logic for unified search."""
+
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import ResponseCache
+from app.core.config import settings
+from app.crud import search as search_crud
+from app.schemas.search import SearchResponse, SearchResult, SearchResultType
+
+# Cached SearchResponses; entries expire after LISTING_CACHE_TTL
+search_cache = ResponseCache("search", ttl=settings.LISTING_CACHE_TTL)
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    types: List[SearchResultType],
+    limit_per_type: int
+) -> SearchResponse:
+    """
+    Search gigs, projects, creators and clients at once.
+
+    Args:
+        db: Database session
+        query: Search string
+        types: Entity types to search (duplicates are ignored)
+        limit_per_type: Maximum results per type
+
+    Returns:
+        SearchResponse with results of all types in merged relevance order
+    """
+    types = sorted(set(types), key=list(SearchResultType).index)
+
+    async def load() -> SearchResponse:
+        rows = await search_crud.search_all(db, query, types, limit_per_type)
+        return SearchResponse(
+            query=query,
+            results=[SearchResult.model_validate(row._asdict()) for row in rows]
+        )
+
+    return await search_cache.get_or_load(
+        {"query": query, "types": types, "limit_per_type": limit_per_type},
+        SearchResponse,
+        load
+    )
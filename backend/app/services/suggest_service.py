@@ -0,0 +1,125 @@
+"""Business logic for gig search autocomplete."""
+
+import asyncio
+import logging
+import math
+import time
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.crud import gig as gig_crud
+from app.db.base import AsyncSessionLocal
+from app.schemas.gig import GigSuggestion, GigSuggestResponse
+from app.utils.suggest import SuggestionIndex
+
+logger = logging.getLogger(__name__)
+
+# Largest number of suggestions one request may ask for
+MAX_SUGGESTIONS = 20
+
+
+def build_suggestion_terms(rows) -> List[Tuple[str, str, float]]:
+    """
+    Turn active gig rows into weighted autocomplete terms.
+
+    Titles are weighted by order count; tags and categories by the number of
+    gigs using them (the index sums duplicate terms).
+
+    Args:
+        rows: Rows from gig_crud.get_active_gig_terms
+
+    Returns:
+        List of (text, kind, weight) tuples
+    """
+    terms = []
+    for title, search_tags, category, subcategory, order_count in rows:
+        terms.append((title, "title", 1 + math.log1p(order_count or 0)))
+        for tag in search_tags or []:
+            terms.append((tag, "tag", 1.0))
+        if category:
+            terms.append((category, "category", 1.0))
+        if subcategory:
+            terms.append((subcategory, "subcategory", 1.0))
+    return terms
+
+
+class GigSuggestionIndex:
+    """
+    Process-wide autocomplete index over active gigs.
+
+    The index is built on first use and then rebuilt in the background once
+    it is older than SUGGEST_REFRESH_SECONDS or a gig write marked it stale;
+    requests keep being answered from the previous index meanwhile, so no
+    lookup ever waits on the database after the first build.
+    """
+
+    def __init__(self):
+        self._index: Optional[SuggestionIndex] = None
+        self._built_at = 0.0
+        self._stale = False
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def mark_stale(self) -> None:
+        """Schedule a rebuild on the next lookup."""
+        self._stale = True
+
+    def _needs_refresh(self) -> bool:
+        age = time.monotonic() - self._built_at
+        return self._stale or age > settings.SUGGEST_REFRESH_SECONDS
+
+    async def _rebuild(self) -> None:
+        self._stale = False
+        async with AsyncSessionLocal() as db:
+            rows = await gig_crud.get_active_gig_terms(db)
+
+        terms = build_suggestion_terms(rows)
+        # Building is CPU-bound; keep it off the event loop
+        self._index = await asyncio.to_thread(SuggestionIndex, terms, MAX_SUGGESTIONS)
+        self._built_at = time.monotonic()
+
+    async def _refresh(self) -> None:
+        try:
+            await self._rebuild()
+        except Exception:
+            self._stale = True
+            logger.exception("Failed to rebuild gig suggestion index")
+
+    async def get(self) -> SuggestionIndex:
+        """
+        Return the current index, building it if none exists yet.
+
+        Returns:
+            SuggestionIndex
+        """
+        if self._index is None:
+            async with self._lock:
+                if self._index is None:
+                    await self._rebuild()
+        elif self._needs_refresh() and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+        return self._index
+
+
+gig_suggestions = GigSuggestionIndex()
+
+
+async def suggest_gigs(query: str, limit: int = 8) -> GigSuggestResponse:
+    """
+    Get prefix and typo-tolerant completions for the gig search box.
+
+    Args:
+        query: Text typed so far
+        limit: Maximum number of suggestions
+
+    Returns:
+        GigSuggestResponse
+    """
+    index = await gig_suggestions.get()
+    terms = index.suggest(query, limit)
+
+    return GigSuggestResponse(
+        query=query,
+        suggestions=[GigSuggestion(text=term.text, kind=term.kind) for term in terms]
+    )
@@ -0,0 +1,174 @@
+"""Write-behind view counters for gigs and projects.
+
+Detail page views are buffered in process memory and written periodically as
+one bulk ``UPDATE ... FROM unnest(...)`` per entity type, instead of an
+UPDATE, flush and refresh per view. A popular gig therefore no longer
+serializes its viewers on a row lock.
+
+Counts served to this process include its own unflushed views, which gives
+approximate read-your-writes: a viewer sees their view counted immediately,
+views buffered by other workers appear after their next flush. Views still
+buffered when a process dies without the lifespan shutdown hook are lost.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import gig as gig_crud
+from app.crud import project as project_crud
+from app.db.base import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE classes worth retrying: connection exceptions, transaction
+# rollback (serialization failures, deadlocks), operator intervention
+_TRANSIENT_SQLSTATE_PREFIXES = ("08", "40", "57")
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Check whether a failed write may succeed if retried unchanged.
+
+    Args:
+        error: Exception raised by the write
+
+    Returns:
+        True for lost connections, timeouts, deadlocks and the like
+    """
+    if isinstance(error, (OSError, TimeoutError, OperationalError, InterfaceError)):
+        return True
+    if isinstance(error, DBAPIError):
+        if error.connection_invalidated:
+            return True
+        sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+        return bool(sqlstate) and sqlstate.startswith(_TRANSIENT_SQLSTATE_PREFIXES)
+    return False
+
+
+class ViewCounter:
+    """Buffers view increments for one entity type."""
+
+    def __init__(
+        self,
+        name: str,
+        apply: Callable[[AsyncSession, Dict[UUID, int]], Awaitable[int]]
+    ):
+        """
+        Args:
+            name: Entity name used in log messages
+            apply: Crud function writing a batch of increments
+        """
+        self.name = name
+        self._apply = apply
+        self._pending: Counter = Counter()
+        self._flushing: Counter = Counter()
+        self._lock = asyncio.Lock()
+
+    def record(self, row_id: UUID) -> None:
+        """
+        Buffer one view.
+
+        Args:
+            row_id: ID of the viewed row
+        """
+        self._pending[row_id] += 1
+
+    def unflushed(self, row_id: UUID) -> int:
+        """
+        Return views of a row this process has buffered but not yet committed.
+
+        Args:
+            row_id: Row ID
+
+        Returns:
+            Number of views to add to the stored count
+        """
+        return self._pending[row_id] + self._flushing[row_id]
+
+    async def flush(self) -> int:
+        """
+        Write all buffered views in a single statement.
+
+        On a transient failure (see is_transient) the batch is merged back
+        into the buffer and retried on the next flush; any other failure
+        would repeat forever, so the batch is logged and dropped. A cancelled
+        flush also merges the batch back, so it is not lost.
+
+        Returns:
+            Number of rows updated
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            self._flushing, self._pending = self._pending, Counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    updated = await self._apply(db, dict(self._flushing))
+                    await db.commit()
+            except Exception as e:
+                if is_transient(e):
+                    logger.warning("Failed to flush %s view counts; will retry: %s", self.name, e)
+                    self._pending.update(self._flushing)
+                else:
+                    logger.exception(
+                        "Dropping %d %s view counts that cannot be written",
+                        sum(self._flushing.values()), self.name,
+                    )
+                updated = 0
+            except asyncio.CancelledError:
+                self._pending.update(self._flushing)
+                raise
+            finally:
+                self._flushing = Counter()
+
+            return updated
+
+
+gig_view_counter = ViewCounter("gig", gig_crud.add_view_counts)
+project_view_counter = ViewCounter("project", project_crud.add_view_counts)
+
+_view_counters = (gig_view_counter, project_view_counter)
+_flush_task: Optional[asyncio.Task] = None
+
+
+async def flush_view_counters() -> None:
+    """Flush every view counter."""
+    for counter in _view_counters:
+        await counter.flush()
+
+
+async def _flush_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.VIEW_COUNT_FLUSH_SECONDS)
+        # Shielded so stopping the loop never interrupts a write; the final
+        # flush in stop_view_counters waits for it on the counters' locks
+        await asyncio.shield(flush_view_counters())
+
+
+def start_view_counters() -> None:
+    """Start the background flush loop."""
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_periodically())
+
+
+async def stop_view_counters() -> None:
+    """Stop the flush loop and write any remaining buffered views."""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+
+    await flush_view_counters()
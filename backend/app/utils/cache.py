@@ -0,0 +1,93 @@
+"""In-process caching helpers."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached.
+    Expired entries are dropped lazily on access. Not shared across worker
+    processes.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after being set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for a key, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional per-entry TTL overriding the cache default
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a key and return its value if it was cached and still valid.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing or expired
+
+        Returns:
+            Removed value or default
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+_MISSING = object()
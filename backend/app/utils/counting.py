@@ -0,0 +1,208 @@
+"""Total-count strategies for paginated listings.
+
+Listings report a ``total`` alongside each page. How that number is obtained
+is selectable per endpoint:
+
+- ``exact``: ``count(*) OVER ()`` is selected with the page itself, so the
+  total arrives in the same round trip as the rows.
+- ``estimated``: the planner's row estimate from ``EXPLAIN`` is used when it
+  is at least ``COUNT_ESTIMATE_THRESHOLD`` rows (broad or unfiltered queries,
+  where an exact count is both expensive and rarely meaningful). Narrower
+  queries fall back to ``exact``.
+- ``cached``: an exact count is computed once per normalized filter set and
+  reused for ``COUNT_CACHE_TTL_SECONDS``.
+
+Keyset (cursor) pages cannot use the window, since their WHERE clause only
+matches rows after the cursor. Under every strategy they reuse the total
+cached for the same filter set, which the first page stores, and only count
+separately on a miss.
+"""
+
+import json
+from enum import Enum
+from typing import Any, Hashable, Optional, Sequence
+
+from sqlalchemy import and_, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.db.explain import estimate_row_count
+from app.utils.cache import TTLCache
+
+TOTAL_COUNT_LABEL = "total_count"
+
+# Filter fields that select a page rather than the matching row set
+PAGINATION_FIELDS = frozenset({"page", "page_size", "skip", "limit", "cursor", "sort_by", "sort_order"})
+
+
+class CountStrategy(str, Enum):
+    """How a listing's total count is computed."""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+
+
+count_cache = TTLCache(
+    maxsize=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl=settings.COUNT_CACHE_TTL_SECONDS,
+)
+
+
+def count_cache_key(namespace: str, filters: dict[str, Any]) -> Hashable:
+    """
+    Build a cache key for a listing's filter set.
+
+    Pagination and sort fields are dropped, unset filters are ignored and list
+    values are sorted, so equivalent requests share one entry.
+
+    Args:
+        namespace: Listing name (e.g. "gigs")
+        filters: Filter values of the request
+
+    Returns:
+        Hashable cache key
+    """
+    normalized = {}
+    for name, value in filters.items():
+        if name in PAGINATION_FIELDS or value is None or value == []:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(str(item) for item in value)
+        elif isinstance(value, Enum):
+            value = value.value
+        normalized[name] = value
+
+    return namespace, json.dumps(normalized, sort_keys=True, default=str)
+
+
+class ListingCounter:
+    """
+    Resolves the total count of one listing query under a CountStrategy.
+
+    Usage from a crud function::
+
+        counter = ListingCounter(strategy, Gig, conditions, cache_key)
+        await counter.prepare(db)
+        query = counter.apply(query, keyset=cursor is not None)
+        rows = (await db.execute(query)).all()
+        total = await counter.resolve(db, rows, skip)
+    """
+
+    def __init__(
+        self,
+        strategy: CountStrategy | str,
+        entity,
+        conditions: Sequence,
+        cache_key: Optional[Hashable] = None
+    ):
+        """
+        Args:
+            strategy: Count strategy to use
+            entity: Mapped class (or selectable) the listing selects from
+            conditions: WHERE conditions of the listing
+            cache_key: Key for the cached strategy (see count_cache_key)
+        """
+        self.strategy = CountStrategy(strategy)
+        self.entity = entity
+        self.conditions = list(conditions)
+        self.cache_key = cache_key
+        self.total: Optional[int] = None
+        self._windowed = False
+
+    def _count_query(self) -> Select:
+        query = select(func.count()).select_from(self.entity)
+        if self.conditions:
+            query = query.where(and_(*self.conditions))
+        return query
+
+    async def _exact_count(self, db: AsyncSession) -> int:
+        result = await db.execute(self._count_query())
+        return result.scalar_one()
+
+    async def prepare(self, db: AsyncSession) -> None:
+        """
+        Resolve the total up front when the strategy allows it.
+
+        Cached counts are looked up (and computed on a miss); estimates are
+        taken from the planner. Exact counts are left to the page query.
+
+        Args:
+            db: Database session
+        """
+        if self.strategy == CountStrategy.CACHED:
+            if self.cache_key is not None:
+                self.total = count_cache.get(self.cache_key)
+            if self.total is None:
+                self.total = await self._exact_count(db)
+                if self.cache_key is not None:
+                    count_cache.set(self.cache_key, self.total)
+
+        elif self.strategy == CountStrategy.ESTIMATED:
+            # Constant column: the plan is only needed for its row estimate
+            rows_query = select(literal_column("1")).select_from(self.entity)
+            if self.conditions:
+                rows_query = rows_query.where(and_(*self.conditions))
+            estimate = await estimate_row_count(db, rows_query)
+            if estimate is not None and estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+                self.total = estimate
+
+    def apply(self, query: Select, keyset: bool = False) -> Select:
+        """
+        Add a ``count(*) OVER ()`` column to the page query if still needed.
+
+        The window is evaluated before LIMIT/OFFSET, so it counts every
+        matching row. It is skipped for keyset pages, whose WHERE clause only
+        matches rows after the cursor.
+
+        Args:
+            query: Page query
+            keyset: Whether the page is addressed by a keyset cursor
+
+        Returns:
+            Page query, possibly with an extra total_count column
+        """
+        if self.total is not None or keyset:
+            return query
+
+        self._windowed = True
+        return query.add_columns(func.count().over().label(TOTAL_COUNT_LABEL))
+
+    async def resolve(self, db: AsyncSession, rows: Sequence, skip: int = 0) -> int:
+        """
+        Return the total count, querying only if nothing else provided it.
+
+        Pages without the window column (keyset pages) take the total cached
+        for the filter set by an earlier page and count only on a miss.
+
+        Args:
+            db: Database session
+            rows: Rows returned by the page query
+            skip: Offset the page was fetched with
+
+        Returns:
+            Total number of matching rows
+        """
+        if self.total is not None:
+            return self.total
+
+        if self._windowed:
+            if rows:
+                self.total = getattr(rows[0], TOTAL_COUNT_LABEL)
+            elif skip == 0:
+                self.total = 0
+            if self.total is not None and self.cache_key is not None:
+                # For the keyset pages that follow
+                count_cache.set(self.cache_key, self.total)
+
+        if self.total is None and self.cache_key is not None:
+            self.total = count_cache.get(self.cache_key)
+
+        if self.total is None:
+            # Keyset page, or an offset past the last row, without a cached total
+            self.total = await self._exact_count(db)
+            if self.cache_key is not None:
+                count_cache.set(self.cache_key, self.total)
+
+        return self.total
+
@@ -0,0 +1,134 @@
+"""Streaming NDJSON and CSV encoding for bulk exports.
+
+Exports receive their rows from a server-side cursor one batch at a time
+(``yield_per``) and encode each batch into a single chunk of the response
+body, so memory use is bounded by the batch size rather than the export size.
+
+The first batch is read before the response starts, so a query that cannot
+run still gets a regular error response. A failure after that can no longer
+change the status: NDJSON exports end with an ``{"error": ...}`` line, and CSV
+exports (which have no room for one) abort the connection before the final
+chunk, so clients see an incomplete transfer rather than a short file.
+"""
+
+import csv
+import io
+import json
+import logging
+import typing
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from app.schemas.export import ExportFormat
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MEDIA_TYPES: Dict[ExportFormat, str] = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+# Separator for list values inside one CSV cell
+CSV_LIST_SEPARATOR = "|"
+
+
+def _nested_model(annotation: Any) -> Any:
+    """Return the BaseModel class of a field annotation, unwrapping Optional."""
+    candidates = typing.get_args(annotation) or (annotation,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def csv_columns(model: Type[BaseModel], prefix: str = "") -> List[str]:
+    """
+    List the CSV columns of a response model, flattening nested models.
+
+    Args:
+        model: Response model of each exported item
+        prefix: Column prefix of a nested model
+
+    Returns:
+        Column names, e.g. ["id", ..., "client.id", ...]
+    """
+    columns: List[str] = []
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested is not None:
+            columns.extend(csv_columns(nested, f"{prefix}{name}."))
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten model_dump(mode="json") output to csv_columns() keys."""
+    flat: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            flat[f"{prefix}{key}"] = CSV_LIST_SEPARATOR.join(
+                item if isinstance(item, str) else json.dumps(item) for item in value
+            )
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+async def _encode_batches(
+    first: Optional[Sequence[BaseModel]],
+    batches: AsyncIterator[Sequence[BaseModel]],
+    model: Type[BaseModel],
+    export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode the prefetched first batch and the rest of the stream."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=csv_columns(model), extrasaction="ignore")
+    if export_format == ExportFormat.csv:
+        writer.writeheader()
+        yield buffer.getvalue().encode()
+
+    batch = first
+    try:
+        while batch is not None:
+            if export_format == ExportFormat.ndjson:
+                yield b"".join(item.model_dump_json().encode() + b"\n" for item in batch)
+            else:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(_flatten(item.model_dump(mode="json")) for item in batch)
+                yield buffer.getvalue().encode()
+            batch = await anext(batches, None)
+    except Exception:
+        logger.exception("Export of %s failed after the response started", model.__name__)
+        if export_format != ExportFormat.ndjson:
+            raise
+        yield json.dumps({"error": "Export failed; the lines above are incomplete"}).encode() + b"\n"
+
+
+async def encode_export(
+    batches: AsyncIterator[Sequence[BaseModel]],
+    model: Type[BaseModel],
+    export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches of response models as a streamed NDJSON or CSV body.
+
+    Reads the first batch before returning, so errors running the query
+    propagate to the caller while the response has not started yet.
+
+    Args:
+        batches: Batches of items, as read from the cursor
+        model: Response model of the items (defines the CSV header)
+        export_format: Output encoding
+
+    Returns:
+        Async iterator yielding one chunk of the response body per batch
+        (CSV: header first), ending with an error trailer (NDJSON) or an
+        exception (CSV) if reading fails later on
+    """
+    first = await anext(batches, None)
+    return _encode_batches(first, batches, model, export_format)
@@ -0,0 +1,146 @@
+"""Faceted count aggregation.
+
+All facets of a listing are counted in a single ``GROUPING SETS`` query over
+the filtered rows, instead of one query per facet option. Array columns (tags,
+skills) are expanded with a lateral ``unnest``; counts use ``count(DISTINCT
+id)`` so that expansion does not inflate the other facets.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Numeric, and_, distinct, func, literal, select, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Upper bounds of the price/budget buckets; the last bucket is open-ended
+PRICE_BUCKET_BOUNDS: Tuple[Decimal, ...] = (
+    Decimal("50"),
+    Decimal("100"),
+    Decimal("250"),
+    Decimal("500"),
+    Decimal("1000"),
+)
+
+
+def bucket_expression(column, bounds: Sequence[Decimal] = PRICE_BUCKET_BOUNDS):
+    """
+    Map a numeric column to its bucket index with width_bucket.
+
+    Index 0 holds values below bounds[0]; index i holds values in
+    [bounds[i - 1], bounds[i]); index len(bounds) is open-ended.
+
+    Args:
+        column: Numeric column to bucket
+        bounds: Ascending bucket boundaries
+
+    Returns:
+        SQL expression yielding the bucket index
+    """
+    return func.width_bucket(column, literal(list(bounds), ARRAY(Numeric)))
+
+
+def bucket_range(
+    index: int,
+    bounds: Sequence[Decimal] = PRICE_BUCKET_BOUNDS
+) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+    """
+    Return the (min, max) range of a bucket index from bucket_expression.
+
+    Args:
+        index: Bucket index
+        bounds: Boundaries the index was computed with
+
+    Returns:
+        Tuple of (inclusive minimum or None, exclusive maximum or None)
+    """
+    lower = bounds[index - 1] if index > 0 else None
+    upper = bounds[index] if index < len(bounds) else None
+    return lower, upper
+
+
+async def count_facets(
+    db: AsyncSession,
+    entity,
+    id_column,
+    dimensions: Dict[str, Any],
+    conditions: Sequence,
+    array_dimensions: Optional[Dict[str, Any]] = None
+) -> Tuple[int, Dict[str, Dict[Any, int]]]:
+    """
+    Count rows per value of several dimensions in one query.
+
+    Args:
+        db: Database session
+        entity: Mapped class to aggregate
+        id_column: Primary key column, used for distinct counting
+        dimensions: Facet name -> scalar column or expression
+        conditions: WHERE conditions of the current filter set
+        array_dimensions: Facet name -> array column, counted per element
+
+    Returns:
+        Tuple of (total matching rows, facet name -> {value: count}); NULL
+        values are omitted
+    """
+    query = select().select_from(entity)
+    expressions = dict(dimensions)
+
+    for name, array_column in (array_dimensions or {}).items():
+        elements = func.unnest(array_column).table_valued("value").lateral(f"{name}_elements")
+        query = query.outerjoin(elements, true())
+        expressions[name] = elements.c.value
+
+    names = list(expressions)
+    columns = [expressions[name] for name in names]
+
+    query = query.add_columns(
+        *[column.label(name) for name, column in zip(names, columns)],
+        func.grouping(*columns).label("grouping_id"),
+        func.count(distinct(id_column)).label("count"),
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    # One grouping set per facet, plus the empty set for the overall total
+    query = query.group_by(
+        func.grouping_sets(*[tuple_(column) for column in columns], tuple_())
+    )
+
+    result = await db.execute(query)
+
+    # grouping() sets a bit for every column *not* grouped; the first argument
+    # is the most significant bit
+    all_bits = (1 << len(names)) - 1
+    facet_by_mask = {
+        all_bits ^ (1 << (len(names) - 1 - position)): name
+        for position, name in enumerate(names)
+    }
+
+    total = 0
+    facets: Dict[str, Dict[Any, int]] = {name: {} for name in names}
+    for row in result.mappings():
+        mask = row["grouping_id"]
+        if mask == all_bits:
+            total = row["count"]
+            continue
+        name = facet_by_mask[mask]
+        value = row[name]
+        if value is not None:
+            facets[name][value] = row["count"]
+
+    return total, facets
+
+
+def top_values(counts: Dict[Any, int], limit: Optional[int] = None) -> List[Tuple[Any, int]]:
+    """
+    Order facet values by descending count, then by value.
+
+    Args:
+        counts: Value -> count mapping from count_facets
+        limit: Optional maximum number of values
+
+    Returns:
+        List of (value, count) tuples
+    """
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    return ordered[:limit] if limit is not None else ordered
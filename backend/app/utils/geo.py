@@ -0,0 +1,84 @@
+"""Distance search helpers backed by PostgreSQL's cube/earthdistance extensions.
+
+Locations are stored as plain latitude/longitude columns and indexed with a
+GiST index on ``ll_to_earth(latitude, longitude)``. A radius filter is an
+``earth_box @> point`` test, which that index serves, refined by an exact
+``earth_distance`` comparison (the box is a superset of the sphere).
+"""
+
+from typing import Tuple
+
+from sqlalchemy import Float, and_, func, literal
+
+
+def parse_lat_lon(value: str) -> Tuple[float, float]:
+    """
+    Parse a "lat,lon" query value.
+
+    Args:
+        value: Latitude and longitude in decimal degrees, comma separated
+
+    Returns:
+        Tuple of (latitude, longitude)
+
+    Raises:
+        ValueError: If the value is malformed or out of range
+    """
+    parts = value.split(",")
+    if len(parts) != 2:
+        raise ValueError("near must be formatted as 'lat,lon'")
+
+    try:
+        latitude, longitude = float(parts[0]), float(parts[1])
+    except ValueError:
+        raise ValueError("near must be formatted as 'lat,lon'")
+
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError("near coordinates are out of range")
+
+    return latitude, longitude
+
+
+def earth_point(latitude, longitude):
+    """Build the ll_to_earth() expression for a latitude/longitude pair."""
+    return func.ll_to_earth(latitude, longitude)
+
+
+def within_radius(latitude_column, longitude_column, center: Tuple[float, float], radius_km: float):
+    """
+    Build a condition matching locations within radius_km of center.
+
+    Args:
+        latitude_column: Latitude column of the searched table
+        longitude_column: Longitude column of the searched table
+        center: (latitude, longitude) of the search center
+        radius_km: Search radius in kilometres
+
+    Returns:
+        SQL boolean expression; rows without coordinates never match
+    """
+    origin = earth_point(literal(center[0], Float), literal(center[1], Float))
+    point = earth_point(latitude_column, longitude_column)
+    radius_m = literal(radius_km * 1000, Float)
+
+    return and_(
+        func.earth_box(origin, radius_m).op("@>", is_comparison=True)(point),
+        func.earth_distance(origin, point) <= radius_m,
+    )
+
+
+def distance_km(latitude_column, longitude_column, center: Tuple[float, float]):
+    """
+    Build the great-circle distance in kilometres from center to a row.
+
+    Args:
+        latitude_column: Latitude column of the searched table
+        longitude_column: Longitude column of the searched table
+        center: (latitude, longitude) of the search center
+
+    Returns:
+        Float SQL expression
+    """
+    origin = earth_point(literal(center[0], Float), literal(center[1], Float))
+    point = earth_point(latitude_column, longitude_column)
+    return func.earth_distance(origin, point, type_=Float) / literal(1000, Float)
@@ -0,0 +1,220 @@
+"""Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe tokens encoding the active sort field, sort order,
+the sort key of the last row on the page and that row's id. The next page is
+then fetched with a row-value comparison against ``(sort_key, id)`` instead of
+an OFFSET, so the cost of a page does not grow with its depth.
+
+NULL sort keys follow PostgreSQL's default ordering (NULLS LAST for ASC,
+NULLS FIRST for DESC), i.e. NULL behaves as the largest value. This keeps every
+sort servable by a single ascending ``(sort_key, id)`` btree index, scanned
+forwards or backwards.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_, tuple_, asc, desc, literal
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for a different sort."""
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a sort key into a JSON-compatible value."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def _deserialize_value(raw: Any, python_type: type) -> Any:
+    """Convert a JSON value back into the sort key's Python type."""
+    if raw is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is date:
+        return date.fromisoformat(raw)
+    if python_type is Decimal:
+        return Decimal(raw)
+    if python_type is UUID:
+        return UUID(raw)
+    return python_type(raw)
+
+
+def _column_info(sort_column) -> Tuple[type, bool]:
+    """Return (python type, nullable) for a sort column or expression."""
+    column = getattr(sort_column, "expression", sort_column)
+    nullable = bool(getattr(column, "nullable", False))
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        python_type = float
+    return python_type, nullable
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: UUID) -> str:
+    """
+    Encode the position after a row into an opaque cursor token.
+
+    Args:
+        sort_by: Active sort field name
+        sort_order: Active sort order (asc or desc)
+        value: Sort key of the last returned row
+        row_id: ID of the last returned row
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {
+        "s": sort_by,
+        "o": sort_order,
+        "v": _serialize_value(value),
+        "id": str(row_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    token: str,
+    sort_by: str,
+    sort_order: str,
+    sort_column
+) -> Tuple[Any, UUID]:
+    """
+    Decode a cursor token issued by encode_cursor.
+
+    Args:
+        token: Cursor token from the client
+        sort_by: Sort field of the current request
+        sort_order: Sort order of the current request
+        sort_column: Column or expression used for sorting (for type coercion)
+
+    Returns:
+        Tuple of (sort key value, row id)
+
+    Raises:
+        InvalidCursorError: If the token is malformed or belongs to another sort
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort_by = payload["s"]
+        cursor_sort_order = payload["o"]
+        raw_value = payload["v"]
+        row_id = UUID(payload["id"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Malformed pagination cursor")
+
+    if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+        raise InvalidCursorError("Cursor does not match the requested sort order")
+
+    python_type, _ = _column_info(sort_column)
+    try:
+        value = _deserialize_value(raw_value, python_type)
+    except (ValueError, TypeError, ArithmeticError):
+        raise InvalidCursorError("Malformed pagination cursor")
+
+    return value, row_id
+
+
+def keyset_order_by(sort_column, id_column, sort_order: str) -> list:
+    """
+    Build the ORDER BY clause matching keyset_condition.
+
+    Args:
+        sort_column: Column or expression to sort by
+        id_column: Unique tie-breaker column
+        sort_order: Sort order (asc or desc)
+
+    Returns:
+        List of ORDER BY expressions
+    """
+    direction = asc if sort_order == "asc" else desc
+    return [direction(sort_column), direction(id_column)]
+
+
+def keyset_condition(
+    sort_column,
+    id_column,
+    sort_order: str,
+    value: Any,
+    last_id: UUID
+):
+    """
+    Build the WHERE condition selecting rows after the cursor position.
+
+    Args:
+        sort_column: Column or expression to sort by
+        id_column: Unique tie-breaker column
+        sort_order: Sort order (asc or desc)
+        value: Sort key of the last row on the previous page
+        last_id: ID of the last row on the previous page
+
+    Returns:
+        SQL boolean expression
+    """
+    _, nullable = _column_info(sort_column)
+    last_id_param = literal(last_id, id_column.type)
+
+    if sort_order == "asc":
+        # NULLS LAST: NULL rows come after every non-NULL row
+        if value is None:
+            return and_(sort_column.is_(None), id_column > last_id_param)
+        after = tuple_(sort_column, id_column) > tuple_(
+            literal(value, sort_column.type), last_id_param
+        )
+        return or_(after, sort_column.is_(None)) if nullable else after
+
+    # DESC NULLS FIRST: NULL rows come before every non-NULL row
+    if value is None:
+        return or_(
+            and_(sort_column.is_(None), id_column < last_id_param),
+            sort_column.isnot(None),
+        )
+    return tuple_(sort_column, id_column) < tuple_(
+        literal(value, sort_column.type), last_id_param
+    )
+
+
+def next_page_cursor(
+    rows: list,
+    limit: int,
+    sort_by: str,
+    sort_order: str
+) -> Tuple[list, Optional[str]]:
+    """
+    Trim an over-fetched page and compute the cursor for the next one.
+
+    Queries fetch ``limit + 1`` rows of ``(entity, sort_value)``; the extra row
+    only signals that another page exists.
+
+    Args:
+        rows: Result rows of (entity, sort_value), at most limit + 1
+        limit: Requested page size
+        sort_by: Active sort field name
+        sort_order: Active sort order
+
+    Returns:
+        Tuple of (entities on this page, next cursor or None if last page)
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    entities = [row[0] for row in rows]
+
+    if not has_more or not rows:
+        return entities, None
+
+    last_entity, last_value = rows[-1][0], rows[-1][1]
+    return entities, encode_cursor(sort_by, sort_order, last_value, last_entity.id)
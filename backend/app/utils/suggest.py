@@ -0,0 +1,248 @@
+"""In-memory index for typo-tolerant autocomplete.
+
+Terms (titles, tags, categories) are stored once; lookup keys are the
+normalized term plus, for multi-word terms, every word-start suffix, so "reel"
+completes "Pizza reel for restaurants". Keys live in one sorted list and a
+prefix lookup is a bisect followed by a short forward scan. Ranked results for
+very short prefixes, whose ranges are long, are precomputed at build time.
+
+When exact prefixes find too few results the query is corrected word by word
+against a trie of the indexed vocabulary using a bounded Levenshtein walk
+(the last word is matched as a prefix; the first character must match), and
+the corrected queries are looked up the same way.
+"""
+
+import bisect
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Prefixes up to this length get their top results precomputed
+SHORT_PREFIX_LENGTH = 3
+# Upper bound on keys scanned for one prefix lookup
+MAX_SCAN = 500
+# Corrections kept per query word during fuzzy lookup
+MAX_CORRECTIONS = 3
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and collapse a term into space-separated words."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def max_typos(word: str) -> int:
+    """Return the edit distance tolerated for a query word of this length."""
+    if len(word) < 3:
+        return 0
+    if len(word) < 6:
+        return 1
+    return 2
+
+
+@dataclass(frozen=True)
+class SuggestionTerm:
+    """One completion candidate."""
+    text: str
+    kind: str
+    weight: float
+
+
+class _WordTrie:
+    """Character trie of vocabulary words supporting bounded edit distance."""
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_WordTrie"] = {}
+        self.terminal = False
+
+    def insert(self, word: str) -> None:
+        node = self
+        for char in word:
+            node = node.children.setdefault(char, _WordTrie())
+        node.terminal = True
+
+    def search(self, query: str, max_distance: int, prefix: bool) -> List[Tuple[str, int]]:
+        """
+        Find vocabulary words (or word prefixes) within max_distance of query.
+
+        Candidates must share the query's first character.
+
+        Args:
+            query: Word to correct
+            max_distance: Maximum Levenshtein distance
+            prefix: Match query against word prefixes instead of whole words
+
+        Returns:
+            List of (word or prefix, distance), closest first
+        """
+        first_row = list(range(len(query) + 1))
+        matches: List[Tuple[str, int]] = []
+
+        # Typos in the first character are rare; requiring it to match keeps
+        # the walk to one subtree of the vocabulary
+        start = self.children.get(query[:1])
+        if start is None:
+            return matches
+
+        # Iterative DFS carrying the previous DP row (Levenshtein automaton)
+        stack = [(start, query[0], query[0], first_row)]
+        while stack:
+            node, char, path, previous = stack.pop()
+            row = [previous[0] + 1]
+            for column in range(1, len(query) + 1):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous[column] + 1,
+                    previous[column - 1] + (query[column - 1] != char),
+                ))
+
+            distance = row[-1]
+            if distance <= max_distance and (prefix or node.terminal):
+                matches.append((path, distance))
+                if prefix:
+                    # Deeper nodes are covered by the prefix lookup
+                    continue
+
+            if min(row) <= max_distance:
+                for next_char, child in node.children.items():
+                    stack.append((child, next_char, path + next_char, row))
+
+        matches.sort(key=lambda match: (match[1], len(match[0])))
+        return matches
+
+
+class SuggestionIndex:
+    """Immutable autocomplete index built from (text, kind, weight) terms."""
+
+    def __init__(self, terms: Iterable[Tuple[str, str, float]], result_limit: int = 20):
+        """
+        Args:
+            terms: (display text, kind, weight) tuples; duplicates of the same
+                normalized text and kind are merged by summing weights
+            result_limit: Largest number of results a lookup may request
+        """
+        merged: Dict[Tuple[str, str], List] = {}
+        for text, kind, weight in terms:
+            key = normalize(text)
+            if not key:
+                continue
+            entry = merged.get((key, kind))
+            if entry is None:
+                merged[(key, kind)] = [text.strip(), weight]
+            else:
+                entry[1] += weight
+
+        self.terms: List[SuggestionTerm] = []
+        keys: List[Tuple[str, int]] = []
+        self._vocabulary = _WordTrie()
+        self._words = set()
+
+        for (key, kind), (text, weight) in merged.items():
+            term_id = len(self.terms)
+            self.terms.append(SuggestionTerm(text=text, kind=kind, weight=weight))
+            words = key.split(" ")
+            for position in range(len(words)):
+                keys.append((" ".join(words[position:]), term_id))
+            for word in words:
+                if word not in self._words:
+                    self._words.add(word)
+                    self._vocabulary.insert(word)
+
+        keys.sort()
+        self._keys = [key for key, _ in keys]
+        self._term_ids = [term_id for _, term_id in keys]
+        self.result_limit = result_limit
+
+        # Precompute ranked results for short prefixes
+        self._short: Dict[str, List[int]] = {}
+        buckets: Dict[str, set] = {}
+        for key, term_id in keys:
+            for length in range(1, min(SHORT_PREFIX_LENGTH, len(key)) + 1):
+                buckets.setdefault(key[:length], set()).add(term_id)
+        for short_prefix, term_ids in buckets.items():
+            self._short[short_prefix] = self._rank(term_ids)[:result_limit]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _rank(self, term_ids: Iterable[int]) -> List[int]:
+        return sorted(term_ids, key=lambda term_id: (-self.terms[term_id].weight, self.terms[term_id].text))
+
+    def _prefix_ids(self, prefix: str, limit: int) -> List[int]:
+        """Return the best-weighted term ids having a key starting with prefix."""
+        if len(prefix) <= SHORT_PREFIX_LENGTH:
+            return self._short.get(prefix, [])[:limit]
+
+        start = bisect.bisect_left(self._keys, prefix)
+        found = set()
+        for position in range(start, min(start + MAX_SCAN, len(self._keys))):
+            if not self._keys[position].startswith(prefix):
+                break
+            found.add(self._term_ids[position])
+
+        return self._rank(found)[:limit]
+
+    def _corrections(self, query: str) -> List[Tuple[str, int]]:
+        """Return corrected versions of query with their total edit distance."""
+        words = query.split(" ")
+        options: List[List[Tuple[str, int]]] = []
+
+        for position, word in enumerate(words):
+            is_last = position == len(words) - 1
+            if not is_last and word in self._words:
+                options.append([(word, 0)])
+                continue
+            matches = self._vocabulary.search(word, max_typos(word), prefix=is_last)
+            if not matches:
+                return []
+            options.append(matches[:MAX_CORRECTIONS])
+
+        candidates: List[Tuple[str, int]] = [("", 0)]
+        for word_options in options:
+            candidates = [
+                ((f"{text} {word}" if text else word), distance + word_distance)
+                for text, distance in candidates
+                for word, word_distance in word_options
+            ]
+            candidates.sort(key=lambda candidate: candidate[1])
+            candidates = candidates[:MAX_CORRECTIONS * MAX_CORRECTIONS]
+
+        return [candidate for candidate in candidates if candidate[0] != query]
+
+    def suggest(self, query: str, limit: int = 8) -> List[SuggestionTerm]:
+        """
+        Return completions for a partially typed query.
+
+        Exact prefix matches come first (by weight); fuzzy matches fill the
+        remaining slots ordered by edit distance, then weight.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of suggestion terms
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        limit = min(limit, self.result_limit)
+
+        results = self._prefix_ids(prefix, limit)
+        if len(results) < limit:
+            seen = set(results)
+            for corrected, _ in self._corrections(prefix):
+                for term_id in self._prefix_ids(corrected, limit):
+                    if term_id not in seen:
+                        seen.add(term_id)
+                        results.append(term_id)
+                if len(results) >= limit:
+                    break
+
+        return [self.terms[term_id] for term_id in results[:limit]]
+
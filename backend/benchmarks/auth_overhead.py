@@ -0,0 +1,106 @@
+"""Benchmark: per-request cost of the authentication dependency.
+
+Measures ``get_current_user`` (bearer token -> claims) with the verified-token
+cache disabled (a full ``jwt.decode`` signature check per request, the
+previous behaviour) and enabled (``JWT_CACHE_ENABLED``), two ways:
+
+* ``dependency``: the dependency awaited directly, isolating its own cost;
+* ``endpoint``: requests through an ASGI app to a trivial endpoint with and
+  without ``Depends(get_current_user)``; the difference is the overhead a
+  busy authenticated endpoint pays per request.
+
+The same token is reused for every request, as the SPA does for the token's
+lifetime. No database or Redis is needed.
+
+Usage:
+    python -m benchmarks.auth_overhead [--rounds 20000] [--requests 3000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import Depends, FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import create_access_token, get_current_user
+
+
+def build_app() -> FastAPI:
+    bench = FastAPI()
+
+    @bench.get("/anonymous")
+    async def anonymous() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    @bench.get("/authenticated")
+    async def authenticated(current_user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, str]:
+        return {"status": "ok"}
+
+    return bench
+
+
+def set_cache(enabled: bool) -> None:
+    settings.JWT_CACHE_ENABLED = enabled
+    security._verified_tokens._entries.clear()
+
+
+async def time_dependency(token: str, rounds: int) -> float:
+    """Return mean microseconds per get_current_user call."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    await get_current_user(credentials)  # Warm up (and fill the cache)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await get_current_user(credentials)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+async def time_endpoint(client: httpx.AsyncClient, path: str, headers: Dict[str, str], requests: int) -> List[float]:
+    """Return per-request latencies in microseconds."""
+    for _ in range(50):  # Warm up
+        (await client.get(path, headers=headers)).raise_for_status()
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1e6)
+        response.raise_for_status()
+    return latencies
+
+
+async def run(rounds: int, requests: int) -> None:
+    token = create_access_token({"sub": str(uuid.uuid4()), "user_type": "creator", "token_version": 0})
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=build_app())
+
+    print(f"{'mode':<10} {'dependency':>14} {'endpoint p50':>14} {'endpoint mean':>14} {'auth overhead':>14}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, enabled in (("no cache", False), ("cache", True)):
+            set_cache(enabled)
+            dependency_us = await time_dependency(token, rounds)
+            baseline = await time_endpoint(client, "/anonymous", {}, requests)
+            authenticated = await time_endpoint(client, "/authenticated", headers, requests)
+            overhead = statistics.mean(authenticated) - statistics.mean(baseline)
+            print(
+                f"{label:<10} {dependency_us:11.1f} us {statistics.median(authenticated):11.1f} us "
+                f"{statistics.mean(authenticated):11.1f} us {overhead:11.1f} us"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20000, help="Direct dependency calls per mode")
+    parser.add_argument("--requests", type=int, default=3000, help="Endpoint requests per mode and path")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rounds, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,552 @@
+"""Query-plan regression suite for the gig and project listings.
+
+Seeds a configurable volume of synthetic gigs and projects into the database
+at ``DATABASE_URL``, then runs every supported filter against every sort
+(both orders, plus a keyset page) through the real crud functions
+(``list_gigs``/``get_gigs_by_creator`` in ``crud.gig`` and
+``list_projects``/``get_projects_by_client`` in ``crud.project``). For each case it records:
+
+* the ``EXPLAIN (ANALYZE, BUFFERS)`` plan of every SELECT the crud function
+  issued, with buffer hits/reads;
+* latency percentiles of the whole crud call.
+
+The run fails (exit code 1) when a plan contains a sequential scan on a
+guarded table, or when a case's p95 latency exceeds the budget. Cases with a
+known unindexed access path (ILIKE substring search) are reported but do not
+fail.
+
+Exact totals (``count(*) OVER ()``) visit every matching row, so broad
+filters legitimately seq scan at this volume; the suite therefore uses the
+``estimated`` count strategy unless ``--count-strategy`` says otherwise.
+
+Seeded rows belong to users with ``@bench.reelbyte.test`` emails and are
+removed with ``--cleanup`` (cascading through profiles to gigs/projects).
+Run against a disposable local database only.
+
+Usage:
+    python -m benchmarks.listing_plans --seed --gigs 1000000 --projects 200000
+    python -m benchmarks.listing_plans --runs 30 --p95-budget-ms 50 --report plans.json
+    python -m benchmarks.listing_plans --cleanup
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+import app.models  # noqa: F401  (registers all mappers)
+from app.core.config import settings
+from app.crud import gig as gig_crud
+from app.crud import project as project_crud
+from app.db.base import AsyncSessionLocal
+from app.db.explain import explain
+from app.schemas.gig import GigSearchFilters, GigSearchMode, GigStatus
+from app.schemas.project import ProjectBudgetMode
+
+BENCH_EMAIL_DOMAIN = "bench.reelbyte.test"
+
+GIG_CATEGORIES = ["Food & Beverage", "Lifestyle", "Travel", "Fashion", "Fitness", "Tech"]
+GIG_SUBCATEGORIES = ["Restaurants", "Cafes", "Bars", "Hotels", "Events"]
+VIDEO_TYPES = ["Instagram Reel", "TikTok", "YouTube Short", "Instagram Story"]
+TAGS = ["restaurant", "food", "amsterdam", "reel", "tiktok", "review", "brunch", "cocktails"]
+TITLE_WORDS = ["pizza", "sushi", "brunch", "coffee", "cocktail", "burger", "vegan", "bakery"]
+PROJECT_CATEGORIES = ["Social Media Content", "Promotional Video", "Event Coverage", "Menu Showcase"]
+EXPERIENCE_LEVELS = ["entry", "intermediate", "expert", "any"]
+SKILLS = ["food styling", "video editing", "color grading", "voice over", "drone", "photography"]
+
+# Tables whose sequential scan fails the run
+DEFAULT_GUARDED_TABLES = ("gigs", "projects")
+
+GIG_SORTS = [
+    "created_at", "price", "popularity", "views", "min_package_price", "max_package_price",
+]
+PROJECT_SORTS = ["created_at", "budget", "deadline", "proposals", "views"]
+SORT_ORDERS = ["desc", "asc"]
+
+
+# ============================================================================
+# Seeding
+# ============================================================================
+
+def _sql_array(values: Sequence[str]) -> str:
+    return "ARRAY[" + ", ".join("'" + value.replace("'", "''") + "'" for value in values) + "]"
+
+
+def pick_sql(values: Sequence[str], expression: str) -> str:
+    """SQL picking an element of values by an integer expression."""
+    return f"({_sql_array(values)})[1 + ({expression}) % {len(values)}]"
+
+
+SEED_USERS = f"""
+INSERT INTO users (email, password_hash, user_type, email_verified)
+SELECT :prefix || n || '@{BENCH_EMAIL_DOMAIN}', 'benchmark', :user_type, true
+FROM generate_series(0, :count - 1) AS n
+"""
+
+SEED_CREATORS = f"""
+INSERT INTO creator_profiles (user_id, display_name, tagline)
+SELECT id, 'Bench creator ' || split_part(email, '@', 1), 'Benchmark creator'
+FROM users
+WHERE email LIKE 'bench-creator-%@{BENCH_EMAIL_DOMAIN}'
+"""
+
+SEED_CLIENTS = f"""
+INSERT INTO client_profiles (user_id, company_name, industry, latitude, longitude)
+SELECT
+    id,
+    'Bench client ' || split_part(email, '@', 1),
+    'Food & Beverage',
+    -- Spread clients over a ~5x5 degree area around Amsterdam
+    50.0 + (hashtext(email) & 1023) / 1023.0 * 5.0,
+    2.5 + (hashtext(reverse(email)) & 1023) / 1023.0 * 5.0
+FROM users
+WHERE email LIKE 'bench-client-%@{BENCH_EMAIL_DOMAIN}'
+"""
+
+SEED_GIGS = f"""
+WITH creators AS (
+    SELECT cp.id, row_number() OVER (ORDER BY cp.id) - 1 AS n
+    FROM creator_profiles cp
+    JOIN users u ON u.id = cp.user_id
+    WHERE u.email LIKE 'bench-creator-%@{BENCH_EMAIL_DOMAIN}'
+)
+INSERT INTO gigs (
+    creator_profile_id, title, slug, description, category, subcategory, video_type,
+    basic_price, basic_delivery_days, standard_price, standard_delivery_days,
+    premium_price, premium_delivery_days, search_tags, status,
+    view_count, order_count, created_at, published_at
+)
+SELECT
+    c.id,
+    'Bench ' || {pick_sql(TITLE_WORDS, "g")} || ' ' || {pick_sql(VIDEO_TYPES, "g / 8")} || ' #' || g,
+    'bench-gig-' || g,
+    'Benchmark gig ' || g || ' featuring ' || {pick_sql(TITLE_WORDS, "g * 3")} || ' content.',
+    {pick_sql(GIG_CATEGORIES, "g * 7")},
+    {pick_sql(GIG_SUBCATEGORIES, "g * 11")},
+    {pick_sql(VIDEO_TYPES, "g")},
+    20 + (g * 37) % 1500,
+    3,
+    CASE WHEN g % 3 > 0 THEN 40 + (g * 53) % 2500 END,
+    CASE WHEN g % 3 > 0 THEN 5 END,
+    CASE WHEN g % 3 = 2 THEN 80 + (g * 71) % 4000 END,
+    CASE WHEN g % 3 = 2 THEN 7 END,
+    ARRAY[{pick_sql(TAGS, "g")}, {pick_sql(TAGS, "g * 5 + 1")}],
+    CASE WHEN g % 10 < 8 THEN 'active' WHEN g % 10 = 8 THEN 'paused' ELSE 'draft' END,
+    (g * 13) % 5000,
+    (g * 7) % 200,
+    now() - (g % 730) * interval '1 day' - (g % 86400) * interval '1 second',
+    now() - (g % 730) * interval '1 day'
+FROM generate_series(:start, :stop - 1) AS g
+JOIN creators c ON c.n = g % :creators
+"""
+
+SEED_PROJECTS = f"""
+WITH clients AS (
+    SELECT cp.id, row_number() OVER (ORDER BY cp.id) - 1 AS n
+    FROM client_profiles cp
+    JOIN users u ON u.id = cp.user_id
+    WHERE u.email LIKE 'bench-client-%@{BENCH_EMAIL_DOMAIN}'
+)
+INSERT INTO projects (
+    client_profile_id, title, description, category, video_type, budget_type,
+    budget_min, budget_max, deadline_date, required_skills, experience_level,
+    status, view_count, proposal_count, created_at, published_at
+)
+SELECT
+    c.id,
+    'Bench ' || {pick_sql(TITLE_WORDS, "p")} || ' project #' || p,
+    'Benchmark project ' || p || ' looking for ' || {pick_sql(TITLE_WORDS, "p * 3")} || ' content.',
+    {pick_sql(PROJECT_CATEGORIES, "p * 7")},
+    {pick_sql(VIDEO_TYPES, "p")},
+    CASE WHEN p % 3 = 0 THEN 'range' ELSE 'fixed' END,
+    50 + (p * 29) % 900,
+    CASE WHEN p % 3 = 0 THEN 50 + (p * 29) % 900 + 50 + (p * 17) % 500 END,
+    current_date + (p % 120),
+    ARRAY[{pick_sql(SKILLS, "p")}, {pick_sql(SKILLS, "p * 5 + 2")}],
+    {pick_sql(EXPERIENCE_LEVELS, "p * 3")},
+    CASE WHEN p % 10 < 7 THEN 'open' WHEN p % 10 < 9 THEN 'closed' ELSE 'draft' END,
+    (p * 13) % 3000,
+    (p * 7) % 40,
+    now() - (p % 365) * interval '1 day' - (p % 86400) * interval '1 second',
+    now() - (p % 365) * interval '1 day'
+FROM generate_series(:start, :stop - 1) AS p
+JOIN clients c ON c.n = p % :clients
+"""
+
+SEED_BATCH = 100_000
+
+
+async def seed(db: AsyncSession, gigs: int, projects: int, creators: int, clients: int) -> None:
+    """Insert the synthetic data set and refresh planner statistics."""
+    print(f"Seeding {creators} creators, {gigs} gigs, {clients} clients, {projects} projects")
+
+    await db.execute(text(SEED_USERS), {"prefix": "bench-creator-", "user_type": "creator", "count": creators})
+    await db.execute(text(SEED_USERS), {"prefix": "bench-client-", "user_type": "client", "count": clients})
+    await db.execute(text(SEED_CREATORS))
+    await db.execute(text(SEED_CLIENTS))
+    await db.commit()
+
+    # One NOTIFY per row would flood the gig index channel; the bulk load
+    # does not need the change triggers
+    await db.execute(text("ALTER TABLE gigs DISABLE TRIGGER USER"))
+    try:
+        for start in range(0, gigs, SEED_BATCH):
+            stop = min(start + SEED_BATCH, gigs)
+            await db.execute(text(SEED_GIGS), {"start": start, "stop": stop, "creators": creators})
+            await db.commit()
+            print(f"  gigs {stop}/{gigs}")
+    finally:
+        await db.execute(text("ALTER TABLE gigs ENABLE TRIGGER USER"))
+        await db.commit()
+
+    for start in range(0, projects, SEED_BATCH):
+        stop = min(start + SEED_BATCH, projects)
+        await db.execute(text(SEED_PROJECTS), {"start": start, "stop": stop, "clients": clients})
+        await db.commit()
+        print(f"  projects {stop}/{projects}")
+
+    for table in ("users", "creator_profiles", "client_profiles", "gigs", "projects"):
+        await db.execute(text(f"ANALYZE {table}"))
+    await db.commit()
+
+
+async def cleanup(db: AsyncSession) -> None:
+    """Delete all seeded rows."""
+    result = await db.execute(
+        text("DELETE FROM users WHERE email LIKE :pattern"),
+        {"pattern": f"%@{BENCH_EMAIL_DOMAIN}"},
+    )
+    await db.commit()
+    print(f"Removed {result.rowcount} benchmark users and their gigs/projects")
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+@dataclass
+class Case:
+    """One listing call to plan and time."""
+    name: str
+    run: Callable[[AsyncSession], Awaitable[Any]]
+    # Known unindexed access path: reported, never fails the run
+    allow_seq_scan: bool = False
+
+
+@dataclass
+class CaseResult:
+    name: str
+    latencies_ms: List[float]
+    plans: List[Dict[str, Any]] = field(default_factory=list)
+    seq_scans: List[str] = field(default_factory=list)
+    allow_seq_scan: bool = False
+
+    def percentile(self, percent: int) -> float:
+        if len(self.latencies_ms) < 2:
+            return self.latencies_ms[0]
+        return statistics.quantiles(self.latencies_ms, n=100, method="inclusive")[percent - 1]
+
+
+class RecordingSession:
+    """Session proxy recording the SELECT statements a crud function runs."""
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self.statements: List[Select] = []
+
+    async def execute(self, statement, *args, **kwargs):
+        if isinstance(statement, Select):
+            self.statements.append(statement)
+        return await self._db.execute(statement, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+async def sample_ids(db: AsyncSession) -> Dict[str, Any]:
+    """Pick a busy benchmark creator and client to filter by."""
+    creator = await db.scalar(text(f"""
+        SELECT g.creator_profile_id FROM gigs g
+        JOIN creator_profiles cp ON cp.id = g.creator_profile_id
+        JOIN users u ON u.id = cp.user_id
+        WHERE u.email LIKE 'bench-creator-%@{BENCH_EMAIL_DOMAIN}'
+        LIMIT 1
+    """))
+    client = await db.scalar(text(f"""
+        SELECT p.client_profile_id FROM projects p
+        JOIN client_profiles cp ON cp.id = p.client_profile_id
+        JOIN users u ON u.id = cp.user_id
+        WHERE u.email LIKE 'bench-client-%@{BENCH_EMAIL_DOMAIN}'
+        LIMIT 1
+    """))
+    if creator is None or client is None:
+        raise SystemExit("No benchmark data found; run with --seed first")
+    return {"creator": creator, "client": client}
+
+
+def gig_cases(ids: Dict[str, Any], limit: int) -> List[Case]:
+    filters: Dict[str, Dict[str, Any]] = {
+        "all": {},
+        "category": {"category": GIG_CATEGORIES[0]},
+        "subcategory": {"subcategory": GIG_SUBCATEGORIES[0]},
+        "video_type": {"video_type": VIDEO_TYPES[0]},
+        "price": {"min_price": 100, "max_price": 400},
+        "package_price": {"package_min_price": 200, "package_max_price": 600},
+        "tags": {"tags": [TAGS[0]]},
+        "creator": {"creator_profile_id": ids["creator"]},
+        "fulltext": {"search": TITLE_WORDS[0]},
+        "substring": {"search": TITLE_WORDS[0], "search_mode": GigSearchMode.substring},
+    }
+
+    cases = []
+    for filter_name, values in filters.items():
+        sorts = GIG_SORTS + (["relevance"] if filter_name == "fulltext" else [])
+        for sort_by in sorts:
+            for sort_order in SORT_ORDERS:
+                params = dict(values, status=GigStatus.active, sort_by=sort_by,
+                              sort_order=sort_order, limit=limit)
+                cases.append(Case(
+                    name=f"gigs {filter_name} sort={sort_by} {sort_order}",
+                    run=_gig_page(params),
+                    allow_seq_scan=filter_name == "substring",
+                ))
+
+    # Second page by keyset cursor, per sort
+    for sort_by in GIG_SORTS:
+        params = dict(status=GigStatus.active, sort_by=sort_by, sort_order="desc", limit=limit)
+        cases.append(Case(name=f"gigs all sort={sort_by} desc cursor", run=_gig_page(params, cursor=True)))
+
+    for status in (None, GigStatus.active.value):
+        cases.append(Case(
+            name=f"creator gigs status={status}",
+            run=lambda db, status=status: gig_crud.get_gigs_by_creator(
+                db, ids["creator"], 0, limit, status
+            ),
+        ))
+
+    return cases
+
+
+def _gig_page(params: Dict[str, Any], cursor: bool = False):
+    async def run(db):
+        filters = GigSearchFilters(**params)
+        if cursor:
+            _, _, next_cursor = await gig_crud.list_gigs(db, filters)
+            filters = filters.model_copy(update={"cursor": next_cursor})
+        return await gig_crud.list_gigs(db, filters)
+    return run
+
+
+def project_cases(ids: Dict[str, Any], limit: int) -> List[Case]:
+    filters: Dict[str, Dict[str, Any]] = {
+        "all": {},
+        "category": {"category": PROJECT_CATEGORIES[0]},
+        "video_type": {"video_type": VIDEO_TYPES[0]},
+        "experience": {"experience_level": EXPERIENCE_LEVELS[2]},
+        "budget_overlap": {"min_budget": 300, "max_budget": 400},
+        "budget_within": {"min_budget": 300, "max_budget": 400, "budget_mode": ProjectBudgetMode.within},
+        "client": {"client_profile_id": ids["client"]},
+        "near": {"near": (52.37, 4.89), "radius_km": 25},
+        "substring": {"search": TITLE_WORDS[0]},
+    }
+
+    cases = []
+    for filter_name, values in filters.items():
+        sorts = PROJECT_SORTS + (["distance"] if filter_name == "near" else [])
+        for sort_by in sorts:
+            for sort_order in SORT_ORDERS:
+                params = dict(values, status="open", sort_by=sort_by, sort_order=sort_order, limit=limit)
+                cases.append(Case(
+                    name=f"projects {filter_name} sort={sort_by} {sort_order}",
+                    run=_project_page(params),
+                    allow_seq_scan=filter_name == "substring",
+                ))
+
+    for sort_by in PROJECT_SORTS:
+        params = dict(status="open", sort_by=sort_by, sort_order="desc", limit=limit)
+        cases.append(Case(
+            name=f"projects all sort={sort_by} desc cursor",
+            run=_project_page(params, cursor=True),
+        ))
+
+    for status in (None, "open"):
+        cases.append(Case(
+            name=f"client projects status={status}",
+            run=lambda db, status=status: project_crud.get_projects_by_client(
+                db, ids["client"], 0, limit, status
+            ),
+        ))
+
+    return cases
+
+
+def _project_page(params: Dict[str, Any], cursor: bool = False):
+    async def run(db):
+        if cursor:
+            _, _, next_cursor = await project_crud.list_projects(db, **params)
+            return await project_crud.list_projects(db, **params, cursor=next_cursor)
+        return await project_crud.list_projects(db, **params)
+    return run
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def find_seq_scans(node: Dict[str, Any], guarded: Sequence[str]) -> List[str]:
+    """Return the guarded relations a plan tree scans sequentially."""
+    found = []
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in guarded:
+        found.append(node["Relation Name"])
+    for child in node.get("Plans", []):
+        found.extend(find_seq_scans(child, guarded))
+    return found
+
+
+async def run_case(db: AsyncSession, case: Case, runs: int, guarded: Sequence[str]) -> CaseResult:
+    # Warm up and capture the statements of one call
+    recorder = RecordingSession(db)
+    await case.run(recorder)
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await case.run(db)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    result = CaseResult(name=case.name, latencies_ms=latencies, allow_seq_scan=case.allow_seq_scan)
+    for statement in recorder.statements:
+        plan = await explain(db, statement, analyze=True, buffers=True)
+        top = plan["Plan"]
+        result.plans.append({
+            "execution_ms": plan.get("Execution Time"),
+            "shared_hit_blocks": top.get("Shared Hit Blocks"),
+            "shared_read_blocks": top.get("Shared Read Blocks"),
+            "plan": top,
+        })
+        result.seq_scans.extend(find_seq_scans(top, guarded))
+
+    # Read-only cases; never keep a transaction open across cases
+    await db.rollback()
+    return result
+
+
+def report(results: List[CaseResult], budget_ms: float) -> int:
+    """Print a summary table and return the number of failing cases."""
+    failures = 0
+    print(f"\n{'case':<58} {'p50':>8} {'p95':>8} {'p99':>8} {'buffers':>9}  status")
+    for result in results:
+        p95 = result.percentile(95)
+        buffers = sum(
+            (plan["shared_hit_blocks"] or 0) + (plan["shared_read_blocks"] or 0)
+            for plan in result.plans
+        )
+        problems = []
+        if result.seq_scans:
+            problems.append("seq scan: " + ",".join(sorted(set(result.seq_scans))))
+        if p95 > budget_ms:
+            problems.append(f"p95 over {budget_ms:g} ms")
+
+        if not problems:
+            status = "ok"
+        elif result.allow_seq_scan and p95 <= budget_ms:
+            status = "expected (" + "; ".join(problems) + ")"
+        else:
+            status = "FAIL (" + "; ".join(problems) + ")"
+            failures += 1
+
+        print(
+            f"{result.name:<58} {result.percentile(50):8.2f} {p95:8.2f} "
+            f"{result.percentile(99):8.2f} {buffers:9d}  {status}"
+        )
+
+    print(f"\n{len(results)} cases, {failures} failing")
+    return failures
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    async with AsyncSessionLocal() as db:
+        if args.cleanup:
+            await cleanup(db)
+            return 0
+
+        if args.seed:
+            await seed(
+                db,
+                gigs=args.gigs,
+                projects=args.projects,
+                creators=args.creators or max(args.gigs // 50, 1),
+                clients=args.clients or max(args.projects // 20, 1),
+            )
+
+        # Count strategy applies to every listing under test
+        settings.GIG_LIST_COUNT_STRATEGY = args.count_strategy
+        settings.PROJECT_LIST_COUNT_STRATEGY = args.count_strategy
+        settings.CREATOR_GIGS_COUNT_STRATEGY = args.count_strategy
+        settings.CLIENT_PROJECTS_COUNT_STRATEGY = args.count_strategy
+
+        ids = await sample_ids(db)
+        cases = gig_cases(ids, args.limit) + project_cases(ids, args.limit)
+        if args.match:
+            cases = [case for case in cases if args.match in case.name]
+
+        results = []
+        for case in cases:
+            results.append(await run_case(db, case, args.runs, args.guard))
+
+    failures = report(results, args.p95_budget_ms)
+
+    if args.report:
+        with open(args.report, "w") as handle:
+            json.dump([
+                {
+                    "case": result.name,
+                    "p50_ms": result.percentile(50),
+                    "p95_ms": result.percentile(95),
+                    "p99_ms": result.percentile(99),
+                    "seq_scans": result.seq_scans,
+                    "plans": result.plans,
+                }
+                for result in results
+            ], handle, indent=2, default=str)
+        print(f"Wrote plans to {args.report}")
+
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="Insert the synthetic data set first")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the synthetic data set and exit")
+    parser.add_argument("--gigs", type=int, default=1_000_000, help="Gigs to seed")
+    parser.add_argument("--projects", type=int, default=200_000, help="Projects to seed")
+    parser.add_argument("--creators", type=int, default=None, help="Creators to seed (default gigs/50)")
+    parser.add_argument("--clients", type=int, default=None, help="Clients to seed (default projects/20)")
+    parser.add_argument("--runs", type=int, default=20, help="Timed calls per case")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--p95-budget-ms", type=float, default=50.0, help="Latency budget per case")
+    parser.add_argument(
+        "--count-strategy", default="estimated", choices=["exact", "estimated", "cached"],
+        help="Listing count strategy to benchmark with",
+    )
+    parser.add_argument(
+        "--guard", nargs="+", default=list(DEFAULT_GUARDED_TABLES),
+        help="Tables that must never be sequentially scanned",
+    )
+    parser.add_argument("--match", help="Only run cases whose name contains this text")
+    parser.add_argument("--report", help="Write plans and percentiles to this JSON file")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Load test: latency of unrelated endpoints during a burst of password checks.
+
+Fires ``--logins`` concurrent password verifications (the bcrypt work of a
+login) and, while they run, requests ``GET /health`` in a steady loop through
+the ASGI app. ``/health`` latency is reported at rest and during the burst.
+
+* default: verifications go through ``verify_password``, i.e. the bounded
+  bcrypt pool in ``app.core.passwords``; ``/health`` should be unaffected.
+* ``--blocking``: verifications run bcrypt inline on the event loop, as
+  before the pool existed; every ``/health`` request queues behind them.
+
+No database is needed: requests go to the app in-process (without running its
+lifespan) and the hash is computed once at start.
+
+The run fails (exit code 1) when, in pool mode, the burst p99 exceeds the
+baseline p99 by more than ``--p99-budget-ms``.
+
+Usage:
+    python -m benchmarks.login_burst [--logins 32] [--samples 200]
+    python -m benchmarks.login_burst --blocking
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+
+from app.core import passwords
+from app.core.metrics import render_metrics
+from app.core.security import verify_password
+from app.main import app
+
+PASSWORD = "correct horse battery staple"
+SAMPLE_INTERVAL_SECONDS = 0.01
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank) of values."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(label: str, latencies_ms: List[float]) -> None:
+    print(
+        f"{label:<10} n={len(latencies_ms):<5} "
+        f"p50={statistics.median(latencies_ms):8.2f} ms  "
+        f"p99={percentile(latencies_ms, 99):8.2f} ms  "
+        f"max={max(latencies_ms):8.2f} ms"
+    )
+
+
+async def sample_health(client: httpx.AsyncClient, stop: asyncio.Event, limit: int) -> List[float]:
+    """
+    Request /health every SAMPLE_INTERVAL_SECONDS until stop is set.
+
+    Latency is measured from when each request was due, not from when the
+    event loop got round to sending it, so time a request spends stuck behind
+    a blocked loop is counted.
+    """
+    latencies: List[float] = []
+    while not stop.is_set() and len(latencies) < limit:
+        due = time.perf_counter() + SAMPLE_INTERVAL_SECONDS
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+        response = await client.get("/health")
+        latencies.append((time.perf_counter() - due) * 1000)
+        response.raise_for_status()
+    return latencies
+
+
+async def login(hashed: str, blocking: bool) -> bool:
+    if blocking:
+        await asyncio.sleep(0)  # Interleave with the sampler like a request would
+        return passwords._verify(PASSWORD, hashed)
+    return await verify_password(PASSWORD, hashed)
+
+
+async def run(logins: int, samples: int, blocking: bool, budget_ms: float) -> int:
+    hashed = passwords._hash(PASSWORD)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/health")  # Warm up
+
+        stop = asyncio.Event()
+        baseline = await sample_health(client, stop, samples)
+
+        sampler = asyncio.create_task(sample_health(client, stop, sys.maxsize))
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(login(hashed, blocking) for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        burst = await sampler
+
+    mode = "blocking (inline bcrypt)" if blocking else f"pool ({passwords.password_hasher.workers} workers)"
+    print(f"mode: {mode}, logins: {logins}, all verified: {all(results)}, burst took {elapsed:.2f} s")
+    summarize("baseline", baseline)
+    summarize("burst", burst)
+    if not blocking:
+        print()
+        print("\n".join(line for line in render_metrics().splitlines() if line.startswith("password_hash")))
+    passwords.password_hasher.shutdown()
+
+    regression = percentile(burst, 99) - percentile(baseline, 99)
+    if not blocking and regression > budget_ms:
+        print(f"FAIL: burst p99 is {regression:.2f} ms above baseline (budget {budget_ms} ms)")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent password checks")
+    parser.add_argument("--samples", type=int, default=200, help="Baseline /health requests")
+    parser.add_argument("--blocking", action="store_true", help="Run bcrypt on the event loop")
+    parser.add_argument("--p99-budget-ms", type=float, default=50.0, help="Allowed p99 regression")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args.logins, args.samples, args.blocking, args.p99_budget_ms)))
+
+
+if __name__ == "__main__":
+    main()
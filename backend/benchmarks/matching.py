@@ -0,0 +1,160 @@
+"""Benchmark of creator–project matching.
+
+Seeds benchmark creators (with skills, categories, rates and experience) and
+open projects, then times:
+
+* a full recompute (``matching_service.recompute_all_matches``);
+* an incremental refresh after ``--changed`` projects change their skills;
+* the recommended-projects read for a sample of creators.
+
+Seeded rows share the ``@bench.reelbyte.test`` users of
+``benchmarks.listing_plans`` and are removed with its ``--cleanup``. Run
+against a disposable local database only.
+
+Usage:
+    python -m benchmarks.matching --seed --creators 50000 --projects 100000
+    python -m benchmarks.matching --changed 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+
+import app.models  # noqa: F401  (registers all mappers)
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.services import matching_service
+from benchmarks.listing_plans import (
+    BENCH_EMAIL_DOMAIN,
+    PROJECT_CATEGORIES,
+    SKILLS,
+    pick_sql,
+    seed as seed_listings,
+)
+
+BENCH_CREATORS = f"""
+SELECT cp.id, row_number() OVER (ORDER BY cp.id) AS n
+FROM creator_profiles cp
+JOIN users u ON u.id = cp.user_id
+WHERE u.email LIKE 'bench-creator-%@{BENCH_EMAIL_DOMAIN}'
+"""
+
+SEED_CREATOR_DETAILS = f"""
+UPDATE creator_profiles cp
+SET hourly_rate = 25 + (c.n * 37) % 200,
+    years_of_experience = (c.n * 7) % 12
+FROM ({BENCH_CREATORS}) c
+WHERE cp.id = c.id
+"""
+
+SEED_CREATOR_SKILLS = f"""
+INSERT INTO creator_skills (creator_profile_id, skill_name, proficiency_level)
+SELECT c.id, skill, (ARRAY['beginner', 'intermediate', 'expert'])[1 + (c.n + s) % 3]
+FROM ({BENCH_CREATORS}) c
+CROSS JOIN generate_series(0, 2) AS s
+CROSS JOIN LATERAL (SELECT {pick_sql(SKILLS, "c.n * 3 + s * 2")} AS skill) picked
+ON CONFLICT DO NOTHING
+"""
+
+SEED_CREATOR_CATEGORIES = f"""
+INSERT INTO creator_categories (creator_profile_id, category, is_primary)
+SELECT c.id, {pick_sql(PROJECT_CATEGORIES, "c.n")}, true
+FROM ({BENCH_CREATORS}) c
+UNION ALL
+SELECT c.id, {pick_sql(PROJECT_CATEGORIES, "c.n + 1")}, false
+FROM ({BENCH_CREATORS}) c
+WHERE c.n % 2 = 0
+"""
+
+CHANGE_PROJECTS = f"""
+UPDATE projects p
+SET required_skills = ARRAY[{pick_sql(SKILLS, "changed.n + 1")}, {pick_sql(SKILLS, "changed.n + 4")}]
+FROM (
+    SELECT p.id, row_number() OVER (ORDER BY p.id) AS n
+    FROM projects p
+    JOIN client_profiles cp ON cp.id = p.client_profile_id
+    JOIN users u ON u.id = cp.user_id
+    WHERE u.email LIKE 'bench-client-%@{BENCH_EMAIL_DOMAIN}' AND p.status = 'open'
+    LIMIT :count
+) changed
+WHERE p.id = changed.id
+"""
+
+
+async def seed(creators: int, projects: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await seed_listings(db, gigs=0, projects=projects, creators=creators, clients=max(projects // 20, 1))
+        await db.execute(text(SEED_CREATOR_DETAILS))
+        await db.execute(text(SEED_CREATOR_SKILLS))
+        await db.execute(text(SEED_CREATOR_CATEGORIES))
+        for table in ("creator_profiles", "creator_skills", "creator_categories"):
+            await db.execute(text(f"ANALYZE {table}"))
+        await db.commit()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.seed:
+        await seed(args.creators, args.projects)
+
+    print(f"top_k={settings.MATCH_TOP_K} batch_size={settings.MATCH_BATCH_SIZE}")
+
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        written = await matching_service.recompute_all_matches(db)
+        await db.commit()
+        elapsed = time.perf_counter() - start
+        if written is None:
+            raise SystemExit("Another recompute holds the matching lock")
+        print(f"Full recompute: {written} matches in {elapsed:.1f}s")
+
+        await db.execute(text("ANALYZE project_matches"))
+        await db.commit()
+
+    if args.changed:
+        async with AsyncSessionLocal() as db:
+            await db.execute(text(CHANGE_PROJECTS), {"count": args.changed})
+            await db.commit()
+
+        settings.MATCH_REFRESH_BATCH = args.changed
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            refreshed = await matching_service.refresh_queued_matches(db)
+            await db.commit()
+            elapsed = time.perf_counter() - start
+        print(f"Incremental refresh: {refreshed} changed projects in {elapsed * 1000:.0f} ms")
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(text(f"{BENCH_CREATORS} LIMIT :limit"), {"limit": args.reads})
+        creator_ids = [row.id for row in result]
+
+        latencies = []
+        for creator_id in creator_ids:
+            start = time.perf_counter()
+            await matching_service.get_recommended_projects(db, creator_id, 20)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    if len(latencies) > 1:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        print(
+            f"Recommended projects ({len(latencies)} creators): "
+            f"p50 {quantiles[49]:.2f} ms, p95 {quantiles[94]:.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="Insert benchmark creators and projects first")
+    parser.add_argument("--creators", type=int, default=50_000, help="Creators to seed")
+    parser.add_argument("--projects", type=int, default=100_000, help="Projects to seed")
+    parser.add_argument("--changed", type=int, default=100, help="Projects changed before the incremental refresh")
+    parser.add_argument("--reads", type=int, default=200, help="Creators whose recommendations are read")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Microbenchmark: cost per item of building ProjectWithClient responses.
+
+Compares, for a page of 100 projects:
+
+* ``orm``: the previous path. Full ``Project``/``ClientProfile`` ORM objects
+  (including the attachments JSONB) are hydrated and copied field by field
+  into ``ClientSummary`` and ``ProjectWithClient``.
+* ``projection``: the current path. Rows holding only the response columns
+  (``crud.project.PROJECT_WITH_CLIENT_COLUMNS``) are validated directly by
+  ``project_service.project_response``.
+
+By default rows are synthesized in memory, isolating hydration and
+serialization from the database. With ``--database`` both queries run against
+``DATABASE_URL`` end to end (requires seeded projects).
+
+Usage:
+    python -m benchmarks.project_serialization [--items 100] [--rounds 200] [--database]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import desc, select
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import selectinload
+
+import app.models  # noqa: F401  (registers all mappers)
+from app.crud.project import (
+    CLIENT_SUMMARY_COLUMNS,
+    PROJECT_WITH_CLIENT_COLUMNS,
+    select_projects_with_client,
+)
+from app.models.client import ClientProfile
+from app.models.project import Project
+from app.schemas.project import ClientSummary, ProjectWithClient
+from app.services.project_service import project_response
+
+
+def client_values() -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "company_name": "Canal Side Kitchen",
+        "company_logo_url": "https://example.com/logo.png",
+        "industry": "Restaurants",
+        "website_url": "https://example.com",
+        "is_verified": True,
+        "total_jobs_posted": 12,
+        "average_rating": Decimal("4.70"),
+        "total_reviews": 31,
+        "description": "Family restaurant in the Jordaan serving seasonal dishes.",
+    }
+
+
+def project_values(client: dict, index: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": uuid.uuid4(),
+        "client_profile_id": client["id"],
+        "title": f"Instagram reel for our new autumn menu #{index}",
+        "description": "We are looking for a food creator to film a 30 second reel. " * 4,
+        "category": "Food & Beverage",
+        "video_type": "Instagram Reel",
+        "video_duration_preference": "15-30s",
+        "platform_preference": "Instagram",
+        "budget_type": "fixed",
+        "budget_min": Decimal("350.00"),
+        "budget_max": Decimal("500.00"),
+        "deadline_date": date(2025, 12, 1),
+        "estimated_duration_days": 7,
+        "required_skills": ["food styling", "video editing", "color grading"],
+        "experience_level": "intermediate",
+        "view_count": 120 + index,
+        "proposal_count": index % 9,
+        "status": "open",
+        "created_at": now,
+        "updated_at": now,
+        "published_at": now,
+        "closed_at": None,
+    }
+
+
+def build_orm_path(page: list) -> list:
+    """Previous path: hydrate ORM objects, copy fields into the schemas."""
+    responses = []
+    for client_data, project_data in page:
+        client = ClientProfile(**client_data)
+        project = Project(
+            **project_data,
+            attachments={"urls": ["https://example.com/brief.pdf"] * 3},
+        )
+        project.client = client
+
+        client_summary = ClientSummary(
+            id=project.client.id,
+            user_id=project.client.user_id,
+            company_name=project.client.company_name,
+            company_logo_url=project.client.company_logo_url,
+            industry=project.client.industry,
+            website_url=project.client.website_url,
+            is_verified=project.client.is_verified,
+            total_jobs_posted=project.client.total_jobs_posted,
+            average_rating=project.client.average_rating,
+            total_reviews=project.client.total_reviews,
+            description=project.client.description
+        )
+        responses.append(ProjectWithClient(
+            id=project.id,
+            client_profile_id=project.client_profile_id,
+            title=project.title,
+            description=project.description,
+            category=project.category,
+            video_type=project.video_type,
+            video_duration_preference=project.video_duration_preference,
+            platform_preference=project.platform_preference,
+            budget_type=project.budget_type,
+            budget_min=project.budget_min,
+            budget_max=project.budget_max,
+            deadline_date=project.deadline_date,
+            estimated_duration_days=project.estimated_duration_days,
+            required_skills=project.required_skills,
+            experience_level=project.experience_level,
+            view_count=project.view_count,
+            proposal_count=project.proposal_count,
+            status=project.status,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            published_at=project.published_at,
+            closed_at=project.closed_at,
+            client=client_summary
+        ))
+    return responses
+
+
+def build_projection_path(page: list) -> list:
+    """Current path: build column rows, validate them directly."""
+    client_fields = [column.key for column in CLIENT_SUMMARY_COLUMNS.exprs]
+    project_fields = [column.key for column in PROJECT_WITH_CLIENT_COLUMNS.exprs[:-1]]
+    client_row = result_tuple(client_fields)
+    project_row = result_tuple(project_fields + ["client"])
+
+    responses = []
+    for client_data, project_data in page:
+        # Row construction stands in for the driver handing back a result row
+        client = client_row([client_data[field] for field in client_fields])
+        project = project_row([project_data[field] for field in project_fields] + [client])
+        responses.append(project_response(project))
+    return responses
+
+
+def time_path(build, page: list, rounds: int) -> list:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        build(page)
+        samples.append((time.perf_counter() - start) / len(page))
+    return samples
+
+
+def report(name: str, samples: list) -> float:
+    median = statistics.median(samples)
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(f"{name:<12} median {median * 1e6:8.1f} us/item   p95 {p95 * 1e6:8.1f} us/item")
+    return median
+
+
+def run_in_memory(items: int, rounds: int) -> None:
+    client = client_values()
+    page = [(client, project_values(client, index)) for index in range(items)]
+
+    # Both paths must produce identical responses
+    assert [r.model_dump() for r in build_orm_path(page)] == \
+        [r.model_dump() for r in build_projection_path(page)]
+
+    before = report("orm", time_path(build_orm_path, page, rounds))
+    after = report("projection", time_path(build_projection_path, page, rounds))
+    print(f"speedup      {before / after:.2f}x on a {items}-item page")
+
+
+async def run_database(items: int, rounds: int) -> None:
+    from app.db.base import AsyncSessionLocal
+
+    async def orm_page(db):
+        result = await db.execute(
+            select(Project)
+            .options(selectinload(Project.client))
+            .order_by(desc(Project.created_at))
+            .limit(items)
+        )
+        projects = result.scalars().all()
+        page = [
+            (
+                {field: getattr(project.client, field) for field in client_values()},
+                {field: getattr(project, field) for field in project_values({"id": None}, 0)},
+            )
+            for project in projects
+        ]
+        build_orm_path(page)
+        db.expunge_all()
+        return len(projects)
+
+    async def projection_page(db):
+        result = await db.execute(
+            select_projects_with_client().order_by(desc(Project.created_at)).limit(items)
+        )
+        rows = result.scalars().all()
+        [project_response(row) for row in rows]
+        return len(rows)
+
+    async with AsyncSessionLocal() as db:
+        for name, load in (("orm", orm_page), ("projection", projection_page)):
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                count = await load(db)
+                samples.append((time.perf_counter() - start) / max(count, 1))
+            report(name, samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="Projects per page")
+    parser.add_argument("--rounds", type=int, default=200, help="Timed pages per path")
+    parser.add_argument("--database", action="store_true", help="Query DATABASE_URL end to end")
+    args = parser.parse_args()
+
+    if args.database:
+        asyncio.run(run_database(args.items, args.rounds))
+    else:
+        run_in_memory(args.items, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
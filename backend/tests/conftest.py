@@ -0,0 +1,42 @@
+"""Shared fixtures.
+
+Tests run the ASGI app in-process against the PostgreSQL database at
+``DATABASE_URL`` (migrated to head); they are skipped when it is unreachable.
+Redis is replaced by the in-process stand-in.
+"""
+
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from app.core.redis import InMemoryRedis, set_redis
+from app.db.base import AsyncSessionLocal, engine
+from app.main import app
+
+
+@pytest.fixture
+async def db_session() -> AsyncIterator:
+    """Session on the test database; skips the test if it is unreachable."""
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"Database unavailable: {e}")
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(db_session) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for the app, with Redis replaced by InMemoryRedis."""
+    set_redis(InMemoryRedis())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
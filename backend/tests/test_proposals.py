@@ -0,0 +1,89 @@
+"""Proposal submission through the API with a real login token."""
+
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import delete, select
+
+from app.core.security import hash_password
+from app.models.client import ClientProfile
+from app.models.creator import CreatorProfile
+from app.models.project import Project
+from app.models.user import User
+
+PASSWORD = "Sup3rSecret!"
+
+
+async def _create_user(db_session, user_type: str) -> User:
+    user = User(
+        email=f"{user_type}-{uuid.uuid4().hex[:12]}@test.reelbyte.test",
+        password_hash=await hash_password(PASSWORD),
+        user_type=user_type,
+        status="active",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def test_login_token_can_submit_proposal(client, db_session):
+    creator_user = await _create_user(db_session, "creator")
+    client_user = await _create_user(db_session, "client")
+    creator = CreatorProfile(user_id=creator_user.id, display_name="Test Creator")
+    client_profile = ClientProfile(user_id=client_user.id, company_name="Test Bistro")
+    db_session.add_all([creator, client_profile])
+    await db_session.flush()
+    project = Project(
+        client_profile_id=client_profile.id,
+        title="Menu launch reel",
+        description="Short vertical video for our new menu.",
+        category="food",
+        budget_min=Decimal("200.00"),
+        budget_max=Decimal("400.00"),
+    )
+    db_session.add(project)
+    await db_session.commit()
+
+    try:
+        login = await client.post(
+            "/v1/auth/login", json={"email": creator_user.email, "password": PASSWORD}
+        )
+        assert login.status_code == 200, login.text
+        token = login.json()["access_token"]
+
+        response = await client.post(
+            "/v1/proposals/",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "job_id": str(project.id),
+                "cover_letter": "I shoot food content weekly and can deliver a polished reel.",
+                "proposed_budget": "300.00",
+                "proposed_timeline_days": 7,
+            },
+        )
+        assert response.status_code == 201, response.text
+        body = response.json()
+        assert body["job_id"] == str(project.id)
+        assert body["creator_profile_id"] == str(creator.id)
+        assert body["project_proposal_count"] == 1
+
+        db_session.expire_all()
+        count = await db_session.scalar(select(Project.proposal_count).where(Project.id == project.id))
+        assert count == 1
+
+        # A second submission for the same project is rejected
+        duplicate = await client.post(
+            "/v1/proposals/",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "job_id": str(project.id),
+                "cover_letter": "I shoot food content weekly and can deliver a polished reel.",
+                "proposed_budget": "300.00",
+                "proposed_timeline_days": 7,
+            },
+        )
+        assert duplicate.status_code == 409, duplicate.text
+    finally:
+        # Cascades through the profiles to the project and proposal
+        await db_session.execute(delete(User).where(User.id.in_([creator_user.id, client_user.id])))
+        await db_session.commit()
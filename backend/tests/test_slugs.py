@@ -0,0 +1,80 @@
+"""Batch slug allocation for gigs."""
+
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.crud.gig import allocate_slugs
+from app.models.creator import CreatorProfile
+from app.models.gig import Gig
+from app.models.user import User
+
+
+class _FakeSession:
+    """Answers the allocation query with fixed rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, query):
+        return iter(self.rows)
+
+
+async def test_repeated_free_base_skips_existing_suffixes():
+    # "foo" is free but "foo-1" exists
+    db = _FakeSession([SimpleNamespace(base="foo", taken=False, max_suffix=1)])
+
+    slugs = await allocate_slugs(db, ["foo", "foo", "foo"])
+
+    assert slugs == ["foo", "foo-2", "foo-3"]
+
+
+async def test_repeated_taken_base_continues_after_highest_suffix():
+    db = _FakeSession([
+        SimpleNamespace(base="foo", taken=True, max_suffix=4),
+        SimpleNamespace(base="bar", taken=False, max_suffix=None),
+    ])
+
+    slugs = await allocate_slugs(db, ["foo", "bar", "foo", "bar"])
+
+    assert slugs == ["foo-5", "bar", "foo-6", "bar-1"]
+
+
+async def test_allocated_slugs_are_unique_in_database(db_session):
+    user = User(
+        email=f"slugs-{uuid.uuid4().hex[:12]}@test.reelbyte.test",
+        password_hash="x",
+        user_type="creator",
+        status="active",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    creator = CreatorProfile(user_id=user.id, display_name="Slug Tester")
+    db_session.add(creator)
+    await db_session.flush()
+
+    base = f"slug-test-{uuid.uuid4().hex[:8]}"
+
+    def gig(slug: str) -> Gig:
+        return Gig(
+            creator_profile_id=creator.id,
+            title="Slug test",
+            description="Slug allocation test gig.",
+            category="food",
+            slug=slug,
+            basic_price=Decimal("100.00"),
+            basic_delivery_days=3,
+        )
+
+    try:
+        db_session.add(gig(f"{base}-1"))
+        await db_session.flush()
+
+        slugs = await allocate_slugs(db_session, [base, base])
+        assert slugs == [base, f"{base}-2"]
+
+        db_session.add_all([gig(slug) for slug in slugs])
+        await db_session.flush()
+    finally:
+        # Nothing was committed
+        await db_session.rollback()
@@ -18,6 +18,10 @@ CREATE EXTENSION IF NOT EXISTS "pg_stat_statements";
 -- Enable GIN index support
 CREATE EXTENSION IF NOT EXISTS "btree_gin";
 
+-- Enable great-circle distance search (earthdistance requires cube)
+CREATE EXTENSION IF NOT EXISTS "cube";
+CREATE EXTENSION IF NOT EXISTS "earthdistance";
+
 -- ============================================================================
 -- 1. USERS & AUTHENTICATION
 -- ============================================================================
@@ -39,6 +43,9 @@ CREATE TABLE users (
     last_login_at TIMESTAMPTZ,
     login_count INTEGER DEFAULT 0,
 
+    -- Token revocation (tokens issued under an older version are rejected)
+    token_version INTEGER NOT NULL DEFAULT 0,
+
     -- Timestamps
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -99,7 +106,38 @@ CREATE TABLE creator_profiles (
 CREATE INDEX idx_creator_profiles_user_id ON creator_profiles(user_id);
 CREATE INDEX idx_creator_profiles_availability ON creator_profiles(availability_status);
 CREATE INDEX idx_creator_profiles_verified ON creator_profiles(is_verified);
-CREATE INDEX idx_creator_profiles_rating ON creator_profiles(average_rating DESC);
+CREATE INDEX idx_creator_profiles_rating_id ON creator_profiles(average_rating, id);
+CREATE INDEX idx_creator_profiles_jobs_completed_id ON creator_profiles(total_jobs_completed, id);
+CREATE INDEX idx_creator_profiles_created_at_id ON creator_profiles(created_at, id);
+CREATE INDEX idx_creator_profiles_hourly_rate_id ON creator_profiles(hourly_rate, id);
+CREATE INDEX idx_creator_profiles_available_rating_id ON creator_profiles(average_rating, id) WHERE availability_status = 'available';
+CREATE INDEX idx_creator_profiles_available_jobs_completed_id ON creator_profiles(total_jobs_completed, id) WHERE availability_status = 'available';
+CREATE INDEX idx_creator_profiles_available_created_at_id ON creator_profiles(created_at, id) WHERE availability_status = 'available';
+CREATE INDEX idx_creator_profiles_available_hourly_rate_id ON creator_profiles(hourly_rate, id) WHERE availability_status = 'available';
+CREATE INDEX idx_creator_profiles_full_text ON creator_profiles USING GIN(to_tsvector('english', display_name || ' ' || coalesce(tagline, '') || ' ' || coalesce(bio, '')));
+
+CREATE TABLE creator_skills (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+    skill_name VARCHAR(50) NOT NULL,
+    proficiency_level VARCHAR(20) CHECK (proficiency_level IN ('beginner', 'intermediate', 'expert')),
+    years_experience INTEGER,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX idx_creator_skills_unique ON creator_skills(creator_profile_id, skill_name);
+CREATE INDEX idx_creator_skills_skill_name ON creator_skills(skill_name);
+
+CREATE TABLE creator_categories (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+    category VARCHAR(50) NOT NULL,
+    is_primary BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX idx_creator_categories_creator_profile_id ON creator_categories(creator_profile_id);
+CREATE INDEX idx_creator_categories_category ON creator_categories(category);
 
 -- ============================================================================
 -- 3. CLIENT PROFILES
@@ -115,6 +153,10 @@ CREATE TABLE client_profiles (
     website_url VARCHAR(255),
     description TEXT,
 
+    -- Location (WGS84 degrees)
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+
     -- Statistics
     total_jobs_posted INTEGER DEFAULT 0,
     total_spent DECIMAL(12, 2) DEFAULT 0,
@@ -133,6 +175,9 @@ CREATE TABLE client_profiles (
 -- Indexes for client_profiles
 CREATE INDEX idx_client_profiles_user_id ON client_profiles(user_id);
 CREATE INDEX idx_client_profiles_verified ON client_profiles(is_verified);
+CREATE INDEX idx_client_profiles_location ON client_profiles USING GIST(ll_to_earth(latitude, longitude))
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
+CREATE INDEX idx_client_profiles_full_text ON client_profiles USING GIN(to_tsvector('english', company_name || ' ' || coalesce(industry, '')));
 
 -- ============================================================================
 -- 4. GIGS (SERVICE LISTINGS)
@@ -161,6 +206,10 @@ CREATE TABLE gigs (
     premium_delivery_days INTEGER,
     premium_revisions INTEGER,
 
+    -- Cheapest and most expensive tier (LEAST/GREATEST skip NULL tiers)
+    min_package_price DECIMAL(10, 2) GENERATED ALWAYS AS (LEAST(basic_price, standard_price, premium_price)) STORED NOT NULL,
+    max_package_price DECIMAL(10, 2) GENERATED ALWAYS AS (GREATEST(basic_price, standard_price, premium_price)) STORED NOT NULL,
+
     -- Details
     category VARCHAR(50) NOT NULL,
     subcategory VARCHAR(50),
@@ -194,9 +243,17 @@ CREATE INDEX idx_gigs_creator_id ON gigs(creator_profile_id);
 CREATE INDEX idx_gigs_status ON gigs(status);
 CREATE INDEX idx_gigs_category ON gigs(category);
 CREATE INDEX idx_gigs_slug ON gigs(slug);
+CREATE INDEX idx_gigs_slug_pattern ON gigs(slug varchar_pattern_ops);
 CREATE INDEX idx_gigs_published_at ON gigs(published_at DESC) WHERE status = 'active';
 CREATE INDEX idx_gigs_search_tags ON gigs USING GIN(search_tags);
 CREATE INDEX idx_gigs_full_text ON gigs USING GIN(to_tsvector('english', title || ' ' || description));
+-- Keyset pagination: one (status, sort key, id) index per sort_by
+CREATE INDEX idx_gigs_status_created_at_id ON gigs(status, created_at, id);
+CREATE INDEX idx_gigs_status_basic_price_id ON gigs(status, basic_price, id);
+CREATE INDEX idx_gigs_status_order_count_id ON gigs(status, order_count, id);
+CREATE INDEX idx_gigs_status_view_count_id ON gigs(status, view_count, id);
+CREATE INDEX idx_gigs_status_min_package_price_id ON gigs(status, min_package_price, id);
+CREATE INDEX idx_gigs_status_max_package_price_id ON gigs(status, max_package_price, id);
 
 -- ============================================================================
 -- 5. PROJECTS (JOB POSTINGS)
@@ -218,6 +275,11 @@ CREATE TABLE projects (
     budget_type VARCHAR(20) CHECK (budget_type IN ('fixed', 'hourly', 'range')),
     budget_min DECIMAL(10, 2),
     budget_max DECIMAL(10, 2),
+    -- [budget_min, budget_max]; a single bound is a point range, no budget is NULL
+    budget_range NUMRANGE GENERATED ALWAYS AS (
+        CASE WHEN budget_min IS NULL AND budget_max IS NULL THEN NULL
+        ELSE numrange(LEAST(budget_min, budget_max), GREATEST(budget_min, budget_max), '[]') END
+    ) STORED,
 
     -- Timeline
     deadline_date DATE,
@@ -250,6 +312,14 @@ CREATE INDEX idx_projects_category ON projects(category);
 CREATE INDEX idx_projects_published_at ON projects(published_at DESC) WHERE status = 'open';
 CREATE INDEX idx_projects_required_skills ON projects USING GIN(required_skills);
 CREATE INDEX idx_projects_full_text ON projects USING GIN(to_tsvector('english', title || ' ' || description));
+-- Keyset pagination: one (status, sort key, id) index per sort_by
+CREATE INDEX idx_projects_status_created_at_id ON projects(status, created_at, id);
+CREATE INDEX idx_projects_status_budget_min_id ON projects(status, budget_min, id);
+CREATE INDEX idx_projects_status_deadline_date_id ON projects(status, deadline_date, id);
+CREATE INDEX idx_projects_status_proposal_count_id ON projects(status, proposal_count, id);
+CREATE INDEX idx_projects_status_view_count_id ON projects(status, view_count, id);
+CREATE INDEX idx_projects_client_created_at ON projects(client_profile_id, created_at, id);
+CREATE INDEX idx_projects_budget_range ON projects USING GIST(budget_range);
 
 -- ============================================================================
 -- 6. PROPOSALS
@@ -537,6 +607,50 @@ CREATE TABLE notifications (
 CREATE INDEX idx_notifications_user_id ON notifications(user_id, created_at DESC);
 CREATE INDEX idx_notifications_unread ON notifications(user_id, is_read) WHERE is_read = FALSE;
 
+-- ============================================================================
+-- 12. CREATOR-PROJECT MATCHING
+-- ============================================================================
+
+-- Sparse, L2-normalized skill/category vectors of open projects and
+-- available creators
+CREATE TABLE project_match_terms (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    term VARCHAR(120) NOT NULL,
+    weight DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (project_id, term)
+);
+
+CREATE INDEX idx_project_match_terms_term ON project_match_terms(term);
+
+CREATE TABLE creator_match_terms (
+    creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+    term VARCHAR(120) NOT NULL,
+    weight DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (creator_profile_id, term)
+);
+
+CREATE INDEX idx_creator_match_terms_term ON creator_match_terms(term);
+
+-- Top-k creators per project and top-k projects per creator
+CREATE TABLE project_matches (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    creator_profile_id UUID NOT NULL REFERENCES creator_profiles(id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (project_id, creator_profile_id)
+);
+
+CREATE INDEX idx_project_matches_project_score ON project_matches(project_id, score);
+CREATE INDEX idx_project_matches_creator_score ON project_matches(creator_profile_id, score);
+
+-- Projects and creators whose matches are stale (filled by triggers below)
+CREATE TABLE match_refresh_queue (
+    entity_type VARCHAR(20) NOT NULL,
+    entity_id UUID NOT NULL,
+    queued_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (entity_type, entity_id)
+);
+
 -- ============================================================================
 -- TRIGGERS FOR AUTOMATIC TIMESTAMP UPDATES
 -- ============================================================================
@@ -572,6 +686,81 @@ CREATE TRIGGER update_proposals_updated_at BEFORE UPDATE ON proposals
 CREATE TRIGGER update_reviews_updated_at BEFORE UPDATE ON reviews
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================================================
+-- CHANGE NOTIFICATIONS
+-- ============================================================================
+
+-- Publish the id of every changed gig; consumed by the API's in-process gig
+-- index (channel must match GIG_INDEX_CHANNEL)
+CREATE OR REPLACE FUNCTION notify_gig_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('gig_changes', COALESCE(NEW.id, OLD.id)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Updates notify only for columns the index serves or filters on, so the
+-- write-behind view count flushes (view_count, updated_at) stay silent
+CREATE TRIGGER notify_gigs_change
+AFTER INSERT OR DELETE OR UPDATE OF
+    creator_profile_id, title, slug, description,
+    basic_price, basic_description, basic_delivery_days, basic_revisions,
+    standard_price, standard_description, standard_delivery_days, standard_revisions,
+    premium_price, premium_description, premium_delivery_days, premium_revisions,
+    category, subcategory, video_type, thumbnail_url, video_samples, requirements,
+    order_count, favorite_count, status, search_tags, published_at
+ON gigs
+    FOR EACH ROW EXECUTE FUNCTION notify_gig_change();
+
+-- Queue projects and creators whose match inputs change; consumed by the
+-- API's match refresher. Arguments: entity type, column holding its id
+CREATE OR REPLACE FUNCTION enqueue_match_refresh()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+    INSERT INTO match_refresh_queue (entity_type, entity_id)
+    VALUES (TG_ARGV[0], (changed ->> TG_ARGV[1])::uuid)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION enqueue_user_match_refresh()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO match_refresh_queue (entity_type, entity_id)
+    SELECT 'creator', id FROM creator_profiles WHERE user_id = NEW.id
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER queue_project_match_refresh
+    AFTER INSERT OR UPDATE OF status, category, required_skills, budget_min, budget_max, experience_level
+    ON projects
+    FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('project', 'id');
+
+CREATE TRIGGER queue_creator_profile_match_refresh
+    AFTER INSERT OR UPDATE OF hourly_rate, years_of_experience, availability_status
+    ON creator_profiles
+    FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'id');
+
+CREATE TRIGGER queue_creator_skill_match_refresh AFTER INSERT OR UPDATE OR DELETE ON creator_skills
+    FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'creator_profile_id');
+
+CREATE TRIGGER queue_creator_category_match_refresh AFTER INSERT OR UPDATE OR DELETE ON creator_categories
+    FOR EACH ROW EXECUTE FUNCTION enqueue_match_refresh('creator', 'creator_profile_id');
+
+CREATE TRIGGER queue_user_match_refresh AFTER UPDATE OF status, deleted_at ON users
+    FOR EACH ROW EXECUTE FUNCTION enqueue_user_match_refresh();
+
 -- ============================================================================
 -- INITIAL DATA / SEED DATA (Optional)
 -- ============================================================================
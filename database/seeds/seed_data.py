@@ -2115,13 +2115,13 @@ async def seed_amsterdam_restaurants(session: AsyncSession) -> Dict[str, List[uu
             text("""
                 INSERT INTO client_profiles (
                     id, user_id, company_name, company_size, industry,
-                    website_url, description, is_verified,
+                    website_url, description, is_verified, latitude, longitude,
                     total_jobs_posted, total_spent, average_rating, total_reviews,
                     created_at, updated_at
                 )
                 VALUES (
                     :id, :user_id, :company_name, :company_size, :industry,
-                    :website_url, :description, :is_verified,
+                    :website_url, :description, :is_verified, :latitude, :longitude,
                     0, 0, 0, 0,
                     NOW(), NOW()
                 )
@@ -2135,6 +2135,8 @@ async def seed_amsterdam_restaurants(session: AsyncSession) -> Dict[str, List[uu
                 "website_url": restaurant.get("website_url"),
                 "description": restaurant["description"],
                 "is_verified": restaurant["is_verified"],
+                "latitude": restaurant.get("lat"),
+                "longitude": restaurant.get("lon"),
             }
         )
         restaurant_client_ids.append(client_profile_id)
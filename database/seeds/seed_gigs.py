@@ -24,6 +24,7 @@ from app.db.base import AsyncSessionLocal
 from app.models.gig import Gig
 from app.models.creator import CreatorProfile
 from app.models.user import User
+from app.crud.gig import allocate_slugs
 import bcrypt
 
 
@@ -317,7 +318,7 @@ async def create_influencer_gigs():
         print(f"✓ Created/found {len(creators)} influencer profiles")
 
         # Create gigs from templates
-        gigs_created = 0
+        gigs = []
         for creator_data in creators:
             user, creator_profile, followers = creator_data
 
@@ -386,11 +387,16 @@ async def create_influencer_gigs():
                     favorite_count=random.randint(5, 50)
                 )
 
-                db.add(gig)
-                gigs_created += 1
+                gigs.append(gig)
+
+        # Make slugs unique against existing rows (re-runs) in one query
+        slugs = await allocate_slugs(db, [gig.slug for gig in gigs])
+        for gig, slug in zip(gigs, slugs):
+            gig.slug = slug
+        db.add_all(gigs)
 
         await db.commit()
-        print(f"✓ Created {gigs_created} influencer gigs")
+        print(f"✓ Created {len(gigs)} influencer gigs")
         print("🎉 Gig seeding complete!")
 
 
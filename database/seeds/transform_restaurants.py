@@ -6,7 +6,7 @@ Transform OpenStreetMap Amsterdam restaurant data into ReelByte seed format.
 import json
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 import random
 
@@ -138,6 +138,20 @@ def generate_email(name: str, existing_email: str = None, index: int = 0) -> str
     return f"{prefix}@{slug}{index}.nl"
 
 
+def parse_coordinates(restaurant: Dict) -> tuple[Optional[float], Optional[float]]:
+    """Return (lat, lon) as floats, or (None, None) if missing or out of range."""
+    try:
+        lat = float(restaurant.get('lat'))
+        lon = float(restaurant.get('lon'))
+    except (TypeError, ValueError):
+        return None, None
+
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        return None, None
+
+    return lat, lon
+
+
 def load_restaurant_data(json_path: Path) -> List[Dict]:
     """Load restaurant data from JSON file."""
     with open(json_path, 'r', encoding='utf-8') as f:
@@ -157,7 +171,7 @@ def transform_restaurants(restaurants: List[Dict], limit: int = 100) -> List[Dic
     - website_url
     - description
     - is_verified
-    - lat, lon (for potential future features)
+    - lat, lon (stored as client_profiles.latitude/longitude for distance search)
     - original_data (for debugging)
     """
     print(f"Processing {len(restaurants)} restaurants...")
@@ -180,6 +194,7 @@ def transform_restaurants(restaurants: List[Dict], limit: int = 100) -> List[Dic
         cuisine = restaurant.get('cuisine', '')
         address = restaurant.get('address', 'Amsterdam')
         website = restaurant.get('website', '')
+        lat, lon = parse_coordinates(restaurant)
 
         transformed_restaurant = {
             # User fields
@@ -201,8 +216,8 @@ def transform_restaurants(restaurants: List[Dict], limit: int = 100) -> List[Dic
             'address': address,
             'phone': restaurant.get('phone', ''),
             'instagram': restaurant.get('instagram', ''),
-            'lat': restaurant.get('lat'),
-            'lon': restaurant.get('lon'),
+            'lat': lat,
+            'lon': lon,
             'budget_range': estimate_budget_range(cuisine, bool(website)),
 
             # For debugging
@@ -239,6 +254,7 @@ def get_amsterdam_restaurants(limit: int = 100) -> List[Dict]:
     print(f"  - With phone: {sum(1 for r in transformed if r['phone'])}")
     print(f"  - With Instagram: {sum(1 for r in transformed if r['instagram'])}")
     print(f"  - Verified: {sum(1 for r in transformed if r['is_verified'])}")
+    print(f"  - With coordinates: {sum(1 for r in transformed if r['lat'] is not None)}")
 
     # Show cuisine distribution
     cuisines = {}